@@ -9,6 +9,35 @@ class AudioService: NSObject, ObservableObject {
     private var audioPlayer: AVAudioPlayer?
     private var cancellables = Set<AnyCancellable>()
     
+    // audio_file_name -> shared clip file name, from shared_clips.json (written by audio_dedup.py)
+    private lazy var sharedClipIndex: [String: String] = {
+        guard let url = Bundle.main.url(forResource: "shared_clips", withExtension: "json"),
+              let data = try? Data(contentsOf: url),
+              let json = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
+              let files = json["files"] as? [String: String],
+              let clips = json["clips"] as? [String: [String: Any]] else {
+            return [:]
+        }
+        var index: [String: String] = [:]
+        for (fileName, clipId) in files {
+            if let sharedFile = clips[clipId]?["file"] as? String {
+                index[fileName] = sharedFile
+            }
+        }
+        return index
+    }()
+    
+    // recipe title -> audio_file_name -> path under Audio/, from audio_index.json (written by audio_paths.py)
+    private lazy var pathIndex: [String: [String: String]] = {
+        guard let url = Bundle.main.url(forResource: "audio_index", withExtension: "json"),
+              let data = try? Data(contentsOf: url),
+              let json = try? JSONSerialization.jsonObject(with: data) as? [String: Any],
+              let files = json["files"] as? [String: [String: String]] else {
+            return [:]
+        }
+        return files
+    }()
+    
     override init() {
         super.init()
         setupAudioSession()
@@ -228,6 +257,30 @@ class AudioService: NSObject, ObservableObject {
     private func getAudioPath(for fileName: String, recipeTitle: String) -> URL {
         print("DEBUG: Looking for audio file: \(fileName) for recipe: \(recipeTitle)")
         
+        // Utterances shared by several steps ship once, under Audio/Shared
+        if let sharedFile = sharedClipIndex[fileName] {
+            let name = (sharedFile as NSString).deletingPathExtension
+            let ext = (sharedFile as NSString).pathExtension
+            if let url = Bundle.main.url(forResource: name, withExtension: ext, subdirectory: "Audio/Shared")
+                ?? Bundle.main.url(forResource: name, withExtension: ext) {
+                print("DEBUG: Found shared audio clip for \(fileName): \(url)")
+                return url
+            }
+        }
+        
+        // Precomputed location: one lookup instead of probing every subdirectory
+        if let indexedPath = pathIndex[recipeTitle]?[fileName] {
+            let indexedName = (indexedPath as NSString).lastPathComponent
+            let name = (indexedName as NSString).deletingPathExtension
+            let ext = (indexedName as NSString).pathExtension
+            let subdirectory = "Audio/" + (indexedPath as NSString).deletingLastPathComponent
+            if let url = Bundle.main.url(forResource: name, withExtension: ext, subdirectory: subdirectory)
+                ?? Bundle.main.url(forResource: name, withExtension: ext) {
+                print("DEBUG: Found indexed audio file for \(fileName): \(url)")
+                return url
+            }
+        }
+        
         // Prefer structured Audio folder paths first to avoid stale bundle-root files
         let fileNameWithoutExtension = (fileName as NSString).deletingPathExtension
         let fileExtension = (fileName as NSString).pathExtension
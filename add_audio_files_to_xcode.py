@@ -2,8 +2,19 @@
 """
 Script to add audio files to Xcode project.pbxproj file.
 This will add the audio files to the project so they're included in the app bundle.
+
+Sprites built by audio_sprites.py and their offset tables are added along
+with every per-step clip. AudioService.swift cannot play sprites yet, so the
+clips they contain are only left out with --exclude-sprite-clips, once the
+app can.
+
+Usage:
+    python3 add_audio_files_to_xcode.py
+    python3 add_audio_files_to_xcode.py --exclude-sprite-clips
 """
 
+import argparse
+import json
 import os
 import re
 import uuid
@@ -12,8 +23,28 @@ def generate_uuid():
     """Generate a UUID for Xcode project entries."""
     return str(uuid.uuid4()).replace('-', '').upper()[:24]
 
-def add_audio_files_to_xcode():
-    """Add audio files to the Xcode project."""
+def sprite_covered_files(audio_dir):
+    """Paths (relative to PerfectBrew/) of clips that a built sprite already contains."""
+    covered = set()
+    for root, dirs, files in os.walk(audio_dir):
+        for file in files:
+            if not file.endswith('.sprite.json'):
+                continue
+            with open(os.path.join(root, file), 'r', encoding='utf-8') as f:
+                table = json.load(f)
+            if not os.path.exists(os.path.join(root, table['sprite'])):
+                continue
+            for source in table.get('sources', {}).values():
+                covered.add(os.path.relpath(source['path'], "PerfectBrew"))
+    return covered
+
+def add_audio_files_to_xcode(exclude_sprite_clips=False):
+    """Add audio files to the Xcode project.
+
+    Args:
+        exclude_sprite_clips: Leave out clips a built sprite already contains
+            (only for app builds that play sprites)
+    """
     
     project_file = "PerfectBrew.xcodeproj/project.pbxproj"
     
@@ -44,14 +75,20 @@ def add_audio_files_to_xcode():
         print("❌ Error: Audio directory not found")
         return False
     
+    covered = sprite_covered_files(audio_dir) if exclude_sprite_clips else set()
+    
     # Walk through audio directory and find all audio files
     for root, dirs, files in os.walk(audio_dir):
         for file in files:
-            if file.endswith(('.mp3', '.wav', '.m4a', '.aac')):
+            if file.endswith(('.mp3', '.wav', '.m4a', '.aac', '.sprite.json')):
                 rel_path = os.path.relpath(os.path.join(root, file), "PerfectBrew")
-                audio_files.append(rel_path)
+                if rel_path not in covered:
+                    audio_files.append(rel_path)
     
-    print(f"Found {len(audio_files)} audio files to add")
+    if exclude_sprite_clips:
+        print(f"Found {len(audio_files)} audio files to add ({len(covered)} clips covered by sprites left out)")
+    else:
+        print(f"Found {len(audio_files)} audio files to add")
     
     # Generate file references for audio files
     file_refs = []
@@ -113,10 +150,15 @@ def add_audio_files_to_xcode():
     return True
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Add audio files to the Xcode project')
+    parser.add_argument('--exclude-sprite-clips', action='store_true',
+                        help='Leave out per-step clips contained in a built sprite (requires sprite playback in the app)')
+    args = parser.parse_args()
+
     print("🔧 Adding Audio Files to Xcode Project")
     print("=" * 50)
     
-    if add_audio_files_to_xcode():
+    if add_audio_files_to_xcode(exclude_sprite_clips=args.exclude_sprite_clips):
         print("\n🎉 Audio files have been added to the Xcode project!")
         print("📋 Next steps:")
         print("1. Open the project in Xcode")
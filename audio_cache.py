@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Content-addressed TTS output cache for PerfectBrew audio generation.
+
+Every synthesized clip is stored under a key derived from everything that
+affects the audio bytes: the cleaned script text, the language, the TTS
+backend, the voice and the encoder settings. A step whose key is already in
+the cache gets the stored M4A hard-linked (or copied) into place instead of
+being synthesized again, so editing one sentence costs one synthesis.
+
+Usage:
+    python3 audio_cache.py --stats
+    python3 audio_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+ROOT = Path(__file__).resolve().parent
+# Kept outside PerfectBrew/ so the cache never ends up in the app bundle
+CACHE_DIR = ROOT / ".audio_cache"
+
+
+def cache_key(clean_text: str, language: str, backend: str, voice: str,
+              encoder_settings: Dict[str, Any]) -> str:
+    """Hash every input that changes the encoded audio into a stable key."""
+    payload = json.dumps({
+        "text": clean_text,
+        "language": language,
+        "backend": backend,
+        "voice": voice,
+        "encoder": encoder_settings,
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    def __init__(self, cache_dir: Path = CACHE_DIR):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached clips
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str) -> Path:
+        # Two-level fan-out keeps directories small
+        return self.cache_dir / key[:2] / f"{key}.m4a"
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Return the cached clip for a key, or None."""
+        path = self._entry_path(key)
+        if path.exists() and path.stat().st_size > 0:
+            return path
+        return None
+
+    def restore(self, key: str, output_path: str) -> bool:
+        """
+        Place the cached clip for a key at output_path.
+
+        Returns:
+            bool: True on a cache hit, False on a miss
+        """
+        cached = self.lookup(key)
+        if cached is None:
+            self.misses += 1
+            return False
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        # Never write through an existing file: it may be a hard link into the cache
+        if os.path.lexists(output_path):
+            os.unlink(output_path)
+        try:
+            os.link(cached, output_path)
+        except OSError:
+            # Different filesystem (or no hard-link support): fall back to a copy
+            shutil.copy2(cached, output_path)
+        self.hits += 1
+        return True
+
+    def store(self, key: str, source_path: str) -> None:
+        """Add a freshly encoded clip to the cache."""
+        entry = self._entry_path(key)
+        if entry.exists():
+            return
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        # Publish atomically so a concurrent worker never sees a partial file
+        temp_path = entry.parent / f"{key}.{os.getpid()}.tmp"
+        try:
+            try:
+                os.link(source_path, temp_path)
+            except OSError:
+                shutil.copy2(source_path, temp_path)
+            os.replace(temp_path, entry)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def stats(self) -> Dict[str, int]:
+        """Return entry count and total size of the cache."""
+        entries = list(self.cache_dir.rglob("*.m4a")) if self.cache_dir.exists() else []
+        return {
+            "entries": len(entries),
+            "bytes": sum(p.stat().st_size for p in entries),
+        }
+
+    def clear(self) -> None:
+        """Delete every cached clip."""
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PerfectBrew TTS output cache')
+    parser.add_argument('--cache-dir', default=str(CACHE_DIR), help='Cache directory')
+    parser.add_argument('--stats', action='store_true', help='Show cache size')
+    parser.add_argument('--clear', action='store_true', help='Delete all cached clips')
+
+    args = parser.parse_args()
+    cache = AudioCache(Path(args.cache_dir))
+
+    if args.clear:
+        cache.clear()
+        print(f"🗑️  Cleared cache: {cache.cache_dir}")
+        return
+
+    stats = cache.stats()
+    print(f"📦 Cache: {cache.cache_dir}")
+    print(f"   Entries: {stats['entries']}")
+    print(f"   Size: {stats['bytes'] / (1024 * 1024):.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
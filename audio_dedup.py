@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Audio deduplication for the PerfectBrew bundle.
+
+Steps in different recipes often say the same thing ("Let the coffee drain
+completely"). Each utterance is identified by a hash of its normalized
+script (lowercase, no punctuation, single spaces) plus its language. When
+two or more audio_file_names carry the same utterance, one canonical clip
+is kept as Audio/Shared/shared_<id>.m4a and the per-recipe copies are
+removed. Audio/shared_clips.json maps every deduplicated audio_file_name
+to its shared clip; AudioService checks it before the per-recipe lookup.
+
+Run it as the last bundling step: a later generator run may put the
+per-recipe copies back (restored from the TTS cache), and running this
+again removes them.
+
+Usage:
+    python3 audio_dedup.py            # Report duplicate utterances and bytes saved
+    python3 audio_dedup.py --apply    # Move them to Audio/Shared and write the index
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from audio_paths import AUDIO_DIR, bundle_root_index, clip_file_name, resolve_audio_file
+from locale_fields import SOURCE_LOCALE, audio_fields
+
+ROOT = Path(__file__).resolve().parent
+RECIPES_DIR = ROOT / "PerfectBrew" / "Resources" / "Recipes"
+SHARED_DIR = AUDIO_DIR / "Shared"
+INDEX_PATH = AUDIO_DIR / "shared_clips.json"
+# (script field, file name field, language) for every narrated clip
+AUDIO_FIELDS = audio_fields()
+
+
+def normalize_script(text: str) -> str:
+    """Script text with case, punctuation and spacing differences removed."""
+    text = re.sub(r'[^\w\s]', '', text.lower())
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def utterance_id(text: str, language: str) -> str:
+    """Stable id of what a clip says, in which language."""
+    return hashlib.sha256(f"{language}\n{normalize_script(text)}".encode('utf-8')).hexdigest()[:16]
+
+
+def load_index() -> Dict[str, Any]:
+    if INDEX_PATH.exists():
+        with INDEX_PATH.open('r', encoding='utf-8') as f:
+            return json.load(f)
+    return {"clips": {}, "files": {}}
+
+
+def collect_clips(recipes_dir: Path = RECIPES_DIR, include_unlinked: bool = False) -> List[Dict[str, Any]]:
+    """
+    Every narrated clip the recipes reference, with its utterance id and file on disk.
+
+    Args:
+        include_unlinked: Also take translated scripts without an
+            audio_file_name_<lang>, under the name the generator writes them
+            (audio_paths.clip_file_name, e.g. <name>_es.m4a)
+    """
+    root_index = bundle_root_index(AUDIO_DIR)
+    clips = []
+    for recipe_file in sorted(recipes_dir.rglob('*.json')):
+        with recipe_file.open('r', encoding='utf-8') as f:
+            data = json.load(f)
+        for recipe in data if isinstance(data, list) else [data]:
+            if not isinstance(recipe, dict):
+                continue
+            title = recipe.get('title', '')
+            sources = [(step, f"step_{number:02d}") for number, step in enumerate(recipe.get('brewing_steps', []), 1)]
+            if isinstance(recipe.get('what_to_expect'), dict):
+                sources.append((recipe['what_to_expect'], "intro"))
+            for source, default_stem in sources:
+                for script_field, file_field, language in AUDIO_FIELDS:
+                    script, file_name = source.get(script_field), source.get(file_field)
+                    if script and not file_name and include_unlinked and language != SOURCE_LOCALE:
+                        file_name = clip_file_name(source, language, default_stem)
+                    if not script or not file_name:
+                        continue
+                    clips.append({
+                        'id': utterance_id(script, language),
+                        'language': language,
+                        'script': normalize_script(script),
+                        'audio_file_name': file_name,
+                        'path': resolve_audio_file(file_name, title, AUDIO_DIR, root_index),
+                        'recipe_file': str(recipe_file.relative_to(ROOT)),
+                    })
+    return clips
+
+
+def plan_dedup(clips: List[Dict[str, Any]], previous: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Utterance id -> its clips, for utterances shipped under more than one file name."""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for clip in clips:
+        groups.setdefault(clip['id'], []).append(clip)
+
+    shared = {}
+    for clip_id, members in groups.items():
+        names = {clip['audio_file_name'] for clip in members}
+        # Once shared, an utterance stays shared even if only one name is left
+        if len(names) > 1 or clip_id in previous["clips"]:
+            shared[clip_id] = members
+    return shared
+
+
+def apply_dedup(shared: Dict[str, List[Dict[str, Any]]], previous: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep one clip per shared utterance, remove the copies and return the new index."""
+    index = {"clips": {}, "files": {}}
+    SHARED_DIR.mkdir(parents=True, exist_ok=True)
+
+    for clip_id, members in sorted(shared.items()):
+        existing = [clip['path'] for clip in members if clip['path'] is not None]
+        shared_name = f"shared_{clip_id}{existing[0].suffix if existing else '.m4a'}"
+        shared_path = SHARED_DIR / shared_name
+
+        if existing and existing[0] != shared_path:
+            # Copy, never link: the per-recipe clip may be a hard link into the TTS cache
+            temp_path = shared_path.with_name(f".{shared_name}.tmp")
+            shutil.copy2(existing[0], temp_path)
+            os.replace(temp_path, shared_path)
+        if not shared_path.exists():
+            print(f"⚠️  No audio on disk for utterance {clip_id} ({members[0]['audio_file_name']}); skipping")
+            continue
+
+        index["clips"][clip_id] = {
+            "file": shared_name,
+            "language": members[0]['language'],
+            "script": members[0]['script'],
+        }
+        for clip in members:
+            index["files"][clip['audio_file_name']] = clip_id
+            if clip['path'] is not None and clip['path'] != shared_path and clip['path'].exists():
+                clip['path'].unlink()
+
+    # Shared clips nothing points at any more
+    for clip_id, clip in previous["clips"].items():
+        if clip_id not in index["clips"] and (SHARED_DIR / clip["file"]).exists():
+            (SHARED_DIR / clip["file"]).unlink()
+
+    temp_path = INDEX_PATH.with_suffix('.json.tmp')
+    with temp_path.open('w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(temp_path, INDEX_PATH)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Deduplicate identical narration clips in the PerfectBrew bundle')
+    parser.add_argument('--apply', action='store_true', help='Move duplicates to Audio/Shared and write the index')
+
+    args = parser.parse_args()
+
+    print("🔎 Scanning recipes for duplicate utterances...")
+    previous = load_index()
+    clips = collect_clips()
+    shared = plan_dedup(clips, previous)
+
+    saved = 0
+    for clip_id, members in sorted(shared.items()):
+        sizes = [clip['path'].stat().st_size for clip in members if clip['path'] is not None]
+        saved += sum(sizes) - max(sizes, default=0)
+        names = sorted({clip['audio_file_name'] for clip in members})
+        print(f"  {clip_id} [{members[0]['language']}] \"{members[0]['script'][:50]}\"")
+        print(f"      {len(names)} files: {', '.join(names)}")
+
+    print(f"\n📊 {len(clips)} clips, {len({c['id'] for c in clips})} unique utterances, "
+          f"{len(shared)} shared, {saved / 1024:.0f} KB saved")
+
+    if args.apply:
+        index = apply_dedup(shared, previous)
+        print(f"✅ Wrote {INDEX_PATH.relative_to(ROOT)} ({len(index['files'])} files → {len(index['clips'])} clips)")
+    elif shared:
+        print("Run with --apply to deduplicate")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Measured clip durations for the PerfectBrew audio bundle.
+
+Reads each clip's duration straight from its container header (the MP4
+'mvhd' box for .m4a, the RIFF header for .wav) without decoding any audio,
+and keeps the results in .audio_build/durations.json. Clips whose size and
+mtime have not changed since the last probe are not opened at all, so
+refreshing the whole ~300-clip tree takes a fraction of a second.
+
+validate_aeropress_timers.py checks these real durations against each
+step's time_seconds instead of estimating from the word count.
+
+Usage:
+    python3 audio_durations.py                  # Refresh and summarize
+    python3 audio_durations.py --csv out.csv    # Also export path,duration rows
+"""
+
+import argparse
+import csv
+import json
+import os
+import struct
+import sys
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from audio_manifest import BUILD_DIR, ROOT
+from audio_paths import AUDIO_DIR
+
+DURATIONS_PATH = BUILD_DIR / "durations.json"
+MP4_EXTENSIONS = {".m4a", ".mp4", ".m4v"}
+
+
+def iter_mp4_boxes(f, end: int):
+    """(type, payload offset, payload size) of the MP4 boxes between f's position and end."""
+    while f.tell() + 8 <= end:
+        start = f.tell()
+        size, box_type = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - start
+        if size < header:
+            return
+        yield box_type, start + header, size - header
+        f.seek(start + size)
+
+
+def _mp4_duration(path: Path) -> Optional[float]:
+    with path.open("rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        for box_type, offset, size in iter_mp4_boxes(f, file_size):
+            # mdat is skipped by seeking past it; only moov is read
+            if box_type != b"moov":
+                continue
+            for child_type, child_offset, _ in iter_mp4_boxes(f, offset + size):
+                if child_type != b"mvhd":
+                    continue
+                f.seek(child_offset)
+                version = f.read(1)[0]
+                f.seek(3, os.SEEK_CUR)  # flags
+                if version == 1:
+                    _, _, timescale, duration = struct.unpack(">QQIQ", f.read(28))
+                else:
+                    _, _, timescale, duration = struct.unpack(">IIII", f.read(16))
+                return duration / timescale if timescale else None
+    return None
+
+
+def _wav_duration(path: Path) -> Optional[float]:
+    with wave.open(str(path), "rb") as wav_file:
+        rate = wav_file.getframerate()
+        return wav_file.getnframes() / rate if rate else None
+
+
+def probe_duration(path: Path) -> Optional[float]:
+    """Duration in seconds from the file's header, or None if it cannot be read."""
+    try:
+        if path.suffix.lower() in MP4_EXTENSIONS:
+            return _mp4_duration(path)
+        if path.suffix.lower() == ".wav":
+            return _wav_duration(path)
+    except (OSError, struct.error, wave.Error, EOFError, IndexError):
+        pass
+    return None
+
+
+def load_durations(path: Path = DURATIONS_PATH) -> Dict[str, Dict[str, Any]]:
+    """Relative clip path -> {"duration", "size", "mtime"} from the last refresh."""
+    if path.exists():
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f).get("clips", {})
+    return {}
+
+
+def refresh_durations(audio_dir: Path = AUDIO_DIR, path: Path = DURATIONS_PATH) -> Dict[str, Dict[str, Any]]:
+    """Probe new or changed clips under audio_dir, drop deleted ones, save and return."""
+    previous = load_durations(path)
+    clips: Dict[str, Dict[str, Any]] = {}
+    to_probe = []
+
+    for clip in audio_dir.rglob("*"):
+        if not clip.is_file() or clip.name.startswith(".") or clip.suffix.lower() not in MP4_EXTENSIONS | {".wav"}:
+            continue
+        stat = clip.stat()
+        key = str(clip.relative_to(ROOT))
+        record = previous.get(key)
+        if record and record["size"] == stat.st_size and record["mtime"] == stat.st_mtime:
+            clips[key] = record
+        else:
+            clips[key] = {"size": stat.st_size, "mtime": stat.st_mtime}
+            to_probe.append((key, clip))
+
+    # Header reads are tiny and I/O bound; a few threads hide the seek latency
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for (key, _), duration in zip(to_probe, pool.map(lambda item: probe_duration(item[1]), to_probe)):
+            clips[key]["duration"] = round(duration, 3) if duration is not None else None
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".json.tmp")
+    with temp_path.open("w", encoding="utf-8") as f:
+        json.dump({"clips": clips}, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+    return clips
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure PerfectBrew clip durations from container headers')
+    parser.add_argument('--audio-dir', default=str(AUDIO_DIR), help='Audio tree to probe')
+    parser.add_argument('--csv', help='Also write path,duration_seconds rows to this CSV file')
+
+    args = parser.parse_args()
+    clips = refresh_durations(Path(args.audio_dir).resolve())
+
+    unreadable = sorted(key for key, clip in clips.items() if clip.get("duration") is None)
+    total = sum(clip["duration"] for clip in clips.values() if clip.get("duration") is not None)
+    print(f"⏱️  Durations: {DURATIONS_PATH}")
+    print(f"   Clips: {len(clips)} ({total / 60:.1f} min of audio)")
+    print(f"   Unreadable: {len(unreadable)}")
+    for key in unreadable:
+        print(f"      ❌ {key}")
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["path", "duration_seconds"])
+            for key, clip in sorted(clips.items()):
+                writer.writerow([key, clip.get("duration")])
+        print(f"📄 Wrote {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+M4A/AAC encoder backends for PerfectBrew audio generation.
+
+  pyav - encodes in-process through PyAV's libav bindings (no subprocess, no temp file)
+  pipe - streams raw int16 PCM to ffmpeg over stdin (no temp file)
+  file - writes a temporary WAV and converts it with ffmpeg (original behaviour)
+
+"auto" picks the fastest one available and falls back to "file" if a
+streaming encode fails.
+
+Every encoder can also be opened as a stream (open_stream) that accepts PCM
+chunk by chunk, so long narrations never need to be held in memory whole.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import wave
+from typing import Any, Dict
+
+import numpy as np
+
+try:
+    import av
+except ImportError:
+    av = None
+
+ENCODER_CHOICES = ['auto', 'pyav', 'pipe', 'file']
+
+# AAC settings per encoding profile; the chosen one is part of the audio cache key.
+# The TTS source is 22.05 kHz mono speech, so the speech profiles lose nothing
+# audible while shrinking each clip several times over.
+ENCODING_PROFILES = {
+    # Original settings: 128 kbps 44.1 kHz stereo AAC-LC
+    "standard": {
+        "codec": "aac",
+        "bitrate": "128k",
+        "sample_rate": 44100,
+        "channels": 2,
+    },
+    # Mono AAC-LC at the TTS sample rate
+    "speech": {
+        "codec": "aac",
+        "bitrate": "48k",
+        "sample_rate": 22050,
+        "channels": 1,
+    },
+    # HE-AAC (SBR) for the smallest bundle; needs an ffmpeg/PyAV built with libfdk_aac
+    "speech-he": {
+        "codec": "libfdk_aac",
+        "profile": "aac_he",
+        "bitrate": "32k",
+        "sample_rate": 22050,
+        "channels": 1,
+    },
+}
+PROFILE_CHOICES = list(ENCODING_PROFILES)
+M4A_ENCODER_SETTINGS = ENCODING_PROFILES["standard"]
+
+
+def to_pcm16(wav: np.ndarray) -> np.ndarray:
+    """Convert a float waveform in [-1, 1] to 1-D int16 PCM."""
+    wav = np.asarray(wav, dtype=np.float32).reshape(-1)
+    # One float scratch buffer, clipped in place, then the int16 result
+    scaled = np.multiply(wav, 32767, dtype=np.float32)
+    np.clip(scaled, -32767, 32767, out=scaled)
+    return scaled.astype(np.int16)
+
+
+def _bitrate_to_int(bitrate: str) -> int:
+    """'128k' -> 128000"""
+    bitrate = str(bitrate).lower()
+    if bitrate.endswith('k'):
+        return int(float(bitrate[:-1]) * 1000)
+    return int(bitrate)
+
+
+def ffmpeg_output_args(settings: Dict[str, Any], output_path: str) -> list:
+    """ffmpeg arguments that encode to settings and write output_path."""
+    args = [
+        '-c:a', settings['codec'],                 # Audio codec: AAC
+        '-b:a', settings['bitrate'],               # Audio bitrate
+        '-ar', str(settings['sample_rate']),       # Output sample rate
+        '-ac', str(settings['channels']),          # Output channels
+    ]
+    if settings.get('profile'):
+        args += ['-profile:a', settings['profile']]  # AAC profile, e.g. aac_he
+    return args + [
+        '-y',                                      # Overwrite output file
+        output_path
+    ]
+
+
+def _unlink_existing(output_path: str) -> None:
+    # The old file may be a hard link into the audio cache; never write through it
+    if os.path.lexists(output_path):
+        os.unlink(output_path)
+
+
+class FFmpegFileEncoder:
+    """Temp WAV on disk + one ffmpeg process per clip."""
+    name = 'file'
+
+    def __init__(self, settings: Dict[str, Any]):
+        self.settings = settings
+
+    def encode(self, pcm: np.ndarray, sample_rate: int, output_path: str) -> bool:
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_wav:
+            temp_path = temp_wav.name
+        try:
+            with wave.open(temp_path, 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(sample_rate)
+                wav_file.writeframes(pcm.tobytes())
+
+            _unlink_existing(output_path)
+            cmd = ['ffmpeg', '-i', temp_path] + ffmpeg_output_args(self.settings, output_path)
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"    ❌ FFmpeg conversion failed: {result.stderr}")
+                return False
+            return True
+        except FileNotFoundError:
+            print(f"    ❌ FFmpeg not found. Please install ffmpeg: brew install ffmpeg")
+            return False
+        finally:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+    def open_stream(self, sample_rate: int, output_path: str) -> 'FileStream':
+        return FileStream(self, sample_rate, output_path)
+
+
+class FileStream:
+    """Appends chunks to a temp WAV; ffmpeg converts it on close()."""
+
+    def __init__(self, encoder: FFmpegFileEncoder, sample_rate: int, output_path: str):
+        self.encoder = encoder
+        self.output_path = output_path
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_wav:
+            self.temp_path = temp_wav.name
+        self.wav_file = wave.open(self.temp_path, 'wb')
+        self.wav_file.setnchannels(1)
+        self.wav_file.setsampwidth(2)
+        self.wav_file.setframerate(sample_rate)
+
+    def write(self, pcm: np.ndarray) -> None:
+        self.wav_file.writeframes(pcm.tobytes())
+
+    def close(self) -> bool:
+        self.wav_file.close()
+        try:
+            _unlink_existing(self.output_path)
+            cmd = ['ffmpeg', '-i', self.temp_path] + ffmpeg_output_args(self.encoder.settings, self.output_path)
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"    ❌ FFmpeg conversion failed: {result.stderr}")
+                return False
+            return True
+        except FileNotFoundError:
+            print(f"    ❌ FFmpeg not found. Please install ffmpeg: brew install ffmpeg")
+            return False
+        finally:
+            try:
+                os.unlink(self.temp_path)
+            except OSError:
+                pass
+
+
+class FFmpegPipeEncoder:
+    """Raw PCM streamed to ffmpeg's stdin; nothing touches the disk but the M4A."""
+    name = 'pipe'
+
+    def __init__(self, settings: Dict[str, Any]):
+        self.settings = settings
+
+    def _input_args(self, sample_rate: int) -> list:
+        # -loglevel error keeps stderr small enough that an unread pipe never fills up
+        return ['ffmpeg', '-loglevel', 'error',
+                '-f', 's16le', '-ar', str(sample_rate), '-ac', '1', '-i', 'pipe:0']
+
+    def encode(self, pcm: np.ndarray, sample_rate: int, output_path: str) -> bool:
+        _unlink_existing(output_path)
+        cmd = self._input_args(sample_rate) + ffmpeg_output_args(self.settings, output_path)
+        result = subprocess.run(cmd, input=pcm.astype('<i2', copy=False).tobytes(), capture_output=True)
+        if result.returncode != 0:
+            print(f"    ❌ FFmpeg pipe encode failed: {result.stderr.decode(errors='replace')[-500:]}")
+            return False
+        return True
+
+    def open_stream(self, sample_rate: int, output_path: str) -> 'PipeStream':
+        _unlink_existing(output_path)
+        cmd = self._input_args(sample_rate) + ffmpeg_output_args(self.settings, output_path)
+        return PipeStream(subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                           stderr=subprocess.PIPE))
+
+
+class PipeStream:
+    """Chunks written straight into a running ffmpeg's stdin."""
+
+    def __init__(self, process: subprocess.Popen):
+        self.process = process
+
+    def write(self, pcm: np.ndarray) -> None:
+        self.process.stdin.write(pcm.astype('<i2', copy=False).tobytes())
+
+    def close(self) -> bool:
+        _, stderr = self.process.communicate()
+        if self.process.returncode != 0:
+            print(f"    ❌ FFmpeg pipe encode failed: {stderr.decode(errors='replace')[-500:]}")
+            return False
+        return True
+
+
+class PyAVEncoder:
+    """In-process AAC encoding through PyAV (pip install av)."""
+    name = 'pyav'
+
+    def __init__(self, settings: Dict[str, Any]):
+        if av is None:
+            raise ImportError("PyAV is not installed: pip install av")
+        self.settings = settings
+        self.layout = 'stereo' if settings['channels'] == 2 else 'mono'
+
+    def encode(self, pcm: np.ndarray, sample_rate: int, output_path: str) -> bool:
+        stream = self.open_stream(sample_rate, output_path)
+        try:
+            stream.write(pcm)
+        finally:
+            ok = stream.close()
+        return ok
+
+    def open_stream(self, sample_rate: int, output_path: str) -> 'PyAVStream':
+        _unlink_existing(output_path)
+        return PyAVStream(self, sample_rate, output_path)
+
+
+class PyAVStream:
+    """Chunks resampled and muxed in-process as they arrive."""
+
+    def __init__(self, encoder: PyAVEncoder, sample_rate: int, output_path: str):
+        settings = encoder.settings
+        self.sample_rate = sample_rate
+        # 'ipod' is libav's muxer for .m4a
+        self.container = av.open(output_path, mode='w', format='ipod')
+        self.stream = self.container.add_stream(settings['codec'], rate=settings['sample_rate'])
+        self.stream.bit_rate = _bitrate_to_int(settings['bitrate'])
+        if settings.get('profile'):
+            self.stream.codec_context.options = {'profile': settings['profile']}
+        self.stream.codec_context.layout = encoder.layout
+        self.resampler = av.AudioResampler(format='fltp', layout=encoder.layout,
+                                           rate=settings['sample_rate'])
+
+    def _mux(self, frames) -> None:
+        for frame in frames:
+            for packet in self.stream.encode(frame):
+                self.container.mux(packet)
+
+    def write(self, pcm: np.ndarray) -> None:
+        frame = av.AudioFrame.from_ndarray(pcm.reshape(1, -1), format='s16', layout='mono')
+        frame.sample_rate = self.sample_rate
+        self._mux(self.resampler.resample(frame))
+
+    def close(self) -> bool:
+        try:
+            self._mux(self.resampler.resample(None))
+            for packet in self.stream.encode(None):
+                self.container.mux(packet)
+        finally:
+            self.container.close()
+        return True
+
+
+class AutoEncoder:
+    """Fastest available streaming encoder, falling back to temp-WAV + ffmpeg."""
+    name = 'auto'
+
+    def __init__(self, settings: Dict[str, Any]):
+        if av is not None:
+            self.primary = PyAVEncoder(settings)
+        else:
+            self.primary = FFmpegPipeEncoder(settings)
+        self.fallback = FFmpegFileEncoder(settings)
+
+    def encode(self, pcm: np.ndarray, sample_rate: int, output_path: str) -> bool:
+        try:
+            if self.primary.encode(pcm, sample_rate, output_path):
+                return True
+        except Exception as e:
+            print(f"    ⚠️  {self.primary.name} encoder failed ({e}), falling back to ffmpeg on disk")
+        return self.fallback.encode(pcm, sample_rate, output_path)
+
+    def open_stream(self, sample_rate: int, output_path: str):
+        # A stream cannot switch encoders halfway, so only opening can fall back
+        try:
+            return self.primary.open_stream(sample_rate, output_path)
+        except Exception as e:
+            print(f"    ⚠️  {self.primary.name} stream failed to open ({e}), falling back to ffmpeg on disk")
+            return self.fallback.open_stream(sample_rate, output_path)
+
+
+ENCODERS = {
+    'auto': AutoEncoder,
+    'pyav': PyAVEncoder,
+    'pipe': FFmpegPipeEncoder,
+    'file': FFmpegFileEncoder,
+}
+
+
+def get_encoder(name: str, settings: Dict[str, Any]):
+    """Create an encoder backend by name (see ENCODER_CHOICES)."""
+    if name not in ENCODERS:
+        raise ValueError(f"Unknown encoder '{name}'. Choose from: {', '.join(ENCODER_CHOICES)}")
+    if name in ('pipe', 'file', 'auto') and shutil.which('ffmpeg') is None and av is None:
+        print("⚠️  ffmpeg not found. Please install ffmpeg: brew install ffmpeg")
+    return ENCODERS[name](settings)
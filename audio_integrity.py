@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Integrity scan of the whole PerfectBrew audio bundle.
+
+Walks Resources/Audio on a thread pool and checks every clip:
+
+  - zero-length files
+  - M4A/AAC: ftyp first, boxes not truncated, a moov with an mvhd duration
+    and an mp4a (AAC) sample entry, and a non-empty mdat
+  - WAV: readable RIFF header with frames; MP3: ID3 tag or frame sync
+  - with --decode, a full ffmpeg decode to catch corrupt audio data
+
+and cross-references the tree against every audio_file_name and
+audio_file_name_es in the recipe corpus (resolved like AudioService does):
+references with no playable clip, and clips nothing references.
+
+Per-file results are cached in .audio_build/integrity.json by size and mtime,
+so a re-scan only opens files that changed.
+
+Usage:
+    python3 audio_integrity.py              # Scan and report
+    python3 audio_integrity.py --decode     # Also decode every changed clip
+    python3 audio_integrity.py --full       # Ignore the cache
+"""
+
+import argparse
+import json
+import os
+import struct
+import subprocess
+import sys
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+from audio_dedup import AUDIO_FIELDS, INDEX_PATH, RECIPES_DIR, SHARED_DIR
+from audio_durations import MP4_EXTENSIONS, iter_mp4_boxes, probe_duration
+from audio_manifest import BUILD_DIR, ROOT
+from audio_paths import AUDIO_DIR, bundle_root_index, is_sprite_file, resolve_audio_file
+
+CACHE_PATH = BUILD_DIR / "integrity.json"
+AUDIO_EXTENSIONS = MP4_EXTENSIONS | {".aac", ".mp3", ".wav"}
+# Bumped whenever the checks change, so cached results from older checks are redone
+CHECK_VERSION = 1
+
+
+def _check_mp4(path: Path, file_size: int) -> List[str]:
+    problems = []
+    boxes = []
+    with path.open("rb") as f:
+        try:
+            for box_type, offset, size in iter_mp4_boxes(f, file_size):
+                boxes.append(box_type)
+                if offset + size > file_size:
+                    problems.append(f"truncated {box_type.decode('latin-1')} box")
+                    break
+                if box_type == b"moov":
+                    f.seek(offset)
+                    moov = f.read(size)
+                    f.seek(offset + size)
+                    if b"mp4a" not in moov:
+                        problems.append("no AAC (mp4a) audio track")
+                elif box_type == b"mdat" and size == 0:
+                    problems.append("empty mdat (no audio data)")
+        except struct.error:
+            problems.append("truncated box header")
+
+    if not boxes or boxes[0] != b"ftyp":
+        problems.insert(0, "does not start with an ftyp box")
+    if b"moov" not in boxes:
+        problems.append("no moov box (unfinished encode?)")
+    if b"mdat" not in boxes:
+        problems.append("no mdat box")
+    if not problems and not probe_duration(path):
+        problems.append("zero or unreadable duration")
+    return problems
+
+
+def _check_wav(path: Path) -> List[str]:
+    try:
+        with wave.open(str(path), "rb") as wav_file:
+            if wav_file.getnframes() == 0:
+                return ["no audio frames"]
+    except (wave.Error, EOFError) as e:
+        return [f"bad WAV header: {e}"]
+    return []
+
+
+def _check_mp3(path: Path) -> List[str]:
+    with path.open("rb") as f:
+        head = f.read(3)
+    if head == b"ID3" or (len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+        return []
+    return ["no ID3 tag or MPEG frame sync"]
+
+
+def _decode(path: Path) -> List[str]:
+    result = subprocess.run(['ffmpeg', '-v', 'error', '-i', str(path), '-f', 'null', '-'],
+                            capture_output=True, text=True)
+    if result.returncode != 0 or result.stderr.strip():
+        return [f"decode error: {result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'ffmpeg failed'}"]
+    return []
+
+
+def check_file(path: Path, decode: bool = False) -> List[str]:
+    """Problems found in one clip (empty if it looks playable)."""
+    try:
+        size = path.stat().st_size
+        if size == 0:
+            return ["zero-length file"]
+        suffix = path.suffix.lower()
+        if suffix in MP4_EXTENSIONS:
+            problems = _check_mp4(path, size)
+        elif suffix == ".wav":
+            problems = _check_wav(path)
+        elif suffix == ".mp3":
+            problems = _check_mp3(path)
+        else:
+            problems = []
+        if decode and not problems:
+            problems = _decode(path)
+        return problems
+    except OSError as e:
+        return [f"unreadable: {e}"]
+
+
+def load_cache(path: Path = CACHE_PATH) -> Dict[str, Dict[str, Any]]:
+    if path.exists():
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == CHECK_VERSION:
+            return data.get("files", {})
+    return {}
+
+
+def save_cache(files: Dict[str, Dict[str, Any]], path: Path = CACHE_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".json.tmp")
+    with temp_path.open("w", encoding="utf-8") as f:
+        json.dump({"version": CHECK_VERSION, "files": files}, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def scan_files(audio_dir: Path = AUDIO_DIR, decode: bool = False, use_cache: bool = True,
+               jobs: int = 8) -> Dict[str, Dict[str, Any]]:
+    """
+    Check every clip under audio_dir, reusing cached results for unchanged files.
+
+    Returns:
+        Relative path -> {"size", "mtime", "problems", "decoded"}
+    """
+    previous = load_cache() if use_cache else {}
+    files: Dict[str, Dict[str, Any]] = {}
+    to_check = []
+
+    for clip in audio_dir.rglob("*"):
+        if not clip.is_file() or clip.name.startswith(".") or clip.suffix.lower() not in AUDIO_EXTENSIONS:
+            continue
+        stat = clip.stat()
+        key = str(clip.relative_to(ROOT))
+        record = previous.get(key)
+        if (record and record["size"] == stat.st_size and record["mtime"] == stat.st_mtime
+                and (record["decoded"] or not decode)):
+            files[key] = record
+        else:
+            files[key] = {"size": stat.st_size, "mtime": stat.st_mtime, "decoded": decode}
+            to_check.append((key, clip))
+
+    # Header checks are small reads and --decode waits on ffmpeg; both are I/O bound
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for (key, _), problems in zip(to_check, pool.map(lambda item: check_file(item[1], decode), to_check)):
+            files[key]["problems"] = problems
+
+    save_cache(files)
+    print(f"🔍 {len(files)} clips: {len(to_check)} checked, {len(files) - len(to_check)} unchanged")
+    return files
+
+
+def cross_reference(files: Dict[str, Dict[str, Any]], recipes_dir: Path = RECIPES_DIR,
+                    audio_dir: Path = AUDIO_DIR) -> Dict[str, List]:
+    """
+    Match recipe audio references to clips on disk.
+
+    Returns:
+        Dict with 'missing': (recipe file, field, file name) that resolve to no
+        clip, 'broken': references whose clip failed its checks, and
+        'orphaned': clips no recipe, shared clip index or sprite accounts for
+    """
+    root_index = bundle_root_index(audio_dir)
+    shared = {}
+    if INDEX_PATH.exists():
+        with INDEX_PATH.open("r", encoding="utf-8") as f:
+            shared = json.load(f)
+    result = {"missing": [], "broken": [], "orphaned": []}
+    referenced = set()
+
+    for recipe_file in sorted(recipes_dir.rglob("*.json")):
+        with recipe_file.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        for recipe in data if isinstance(data, list) else [data]:
+            if not isinstance(recipe, dict):
+                continue
+            sources = list(recipe.get("brewing_steps", []))
+            if isinstance(recipe.get("what_to_expect"), dict):
+                sources.append(recipe["what_to_expect"])
+            for source in sources:
+                for _, field, _ in AUDIO_FIELDS:
+                    file_name = source.get(field)
+                    if not file_name:
+                        continue
+                    ref = (str(recipe_file.relative_to(ROOT)), field, file_name)
+                    clip_id = shared.get("files", {}).get(file_name)
+                    if clip_id in shared.get("clips", {}):
+                        path = SHARED_DIR / shared["clips"][clip_id]["file"]
+                        path = path if path.exists() else None
+                    else:
+                        path = resolve_audio_file(file_name, recipe.get("title", ""), audio_dir, root_index)
+                    if path is None:
+                        result["missing"].append(ref)
+                        continue
+                    key = str(path.relative_to(ROOT))
+                    referenced.add(key)
+                    if files.get(key, {}).get("problems"):
+                        result["broken"].append(ref)
+
+    for key in sorted(files):
+        if key not in referenced and not is_sprite_file(Path(key)):
+            result["orphaned"].append(key)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check every clip in the PerfectBrew audio bundle')
+    parser.add_argument('--decode', action='store_true', help='Also decode each clip with ffmpeg')
+    parser.add_argument('--full', action='store_true', help='Re-check every file, ignoring the cache')
+    parser.add_argument('--jobs', '-j', type=int, default=8, help='Scanner threads (default: 8)')
+
+    args = parser.parse_args()
+
+    print("🩺 AUDIO BUNDLE INTEGRITY SCAN")
+    print("=" * 60)
+    files = scan_files(decode=args.decode, use_cache=not args.full, jobs=max(1, args.jobs))
+    bad = {key: record["problems"] for key, record in sorted(files.items()) if record["problems"]}
+    refs = cross_reference(files)
+
+    if bad:
+        print(f"\n❌ DAMAGED CLIPS ({len(bad)}):")
+        for key, problems in bad.items():
+            print(f"  {key}: {'; '.join(problems)}")
+    if refs["missing"]:
+        print(f"\n❌ MISSING CLIPS ({len(refs['missing'])}):")
+        for recipe_file, field, file_name in refs["missing"]:
+            print(f"  {recipe_file} :: {field} :: {file_name}")
+    if refs["orphaned"]:
+        print(f"\n⚠️  UNREFERENCED CLIPS ({len(refs['orphaned'])}):")
+        for key in refs["orphaned"]:
+            print(f"  {key}")
+
+    print(f"\n📊 SCAN SUMMARY:")
+    print(f"  Clips: {len(files)}")
+    print(f"  Damaged: {len(bad)} ({len(refs['broken'])} recipe references affected)")
+    print(f"  Missing: {len(refs['missing'])}")
+    print(f"  Unreferenced: {len(refs['orphaned'])}")
+    return 1 if bad or refs["missing"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Job journal for PerfectBrew audio batch runs.
+
+Every finished step output is appended to an append-only JSON-lines journal
+with its size and SHA-256, as soon as it finishes. If a long Chatterbox run
+crashes or is killed, --resume skips every job the journal shows as done
+(and whose file still matches the recorded size and hash) and re-runs the
+rest, including the ones that failed.
+
+Usage:
+    python3 audio_journal.py             # Summary of the journal
+    python3 audio_journal.py --compact   # Keep only the latest record per output
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from audio_manifest import BUILD_DIR, ROOT, relative_path
+
+JOURNAL_PATH = BUILD_DIR / "journal.jsonl"
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AudioJournal:
+    def __init__(self, path: Path = JOURNAL_PATH):
+        """
+        Load the journal (an empty one if the file does not exist yet).
+
+        Args:
+            path: Location of journal.jsonl
+        """
+        self.path = Path(path)
+        # Latest record per output path; later lines win
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.lines = 0
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A crash can leave a torn last line; everything before it is valid
+                        continue
+                    self.records[record["output_path"]] = record
+                    self.lines += 1
+
+    def is_complete(self, output_path: str, key: Optional[str]) -> bool:
+        """True if output_path was finished for this exact script and is still intact."""
+        record = self.records.get(relative_path(output_path))
+        if not record or record["status"] != "done" or record.get("key") != key:
+            return False
+        if not os.path.exists(output_path) or os.path.getsize(output_path) != record["size"]:
+            return False
+        return file_sha256(output_path) == record["sha256"]
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        record["time"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            # The whole point is surviving a crash, so make each record durable
+            os.fsync(f.fileno())
+        self.records[record["output_path"]] = record
+        self.lines += 1
+
+    def record_success(self, output_path: str, key: Optional[str], attempts: int = 1) -> None:
+        """Journal a finished output with its size and hash."""
+        self._append({
+            "output_path": relative_path(output_path),
+            "key": key,
+            "status": "done",
+            "size": os.path.getsize(output_path),
+            "sha256": file_sha256(output_path),
+            "attempts": attempts,
+        })
+
+    def record_failure(self, output_path: str, key: Optional[str], attempts: int = 1) -> None:
+        """Journal a job that failed on every attempt."""
+        self._append({
+            "output_path": relative_path(output_path),
+            "key": key,
+            "status": "failed",
+            "attempts": attempts,
+        })
+
+    def compact(self) -> None:
+        """Rewrite the journal with only the latest record per output."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".jsonl.tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            for record in self.records.values():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(temp_path, self.path)
+        self.lines = len(self.records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PerfectBrew audio job journal')
+    parser.add_argument('--journal', default=str(JOURNAL_PATH), help='Journal path')
+    parser.add_argument('--compact', action='store_true', help='Keep only the latest record per output')
+
+    args = parser.parse_args()
+    journal = AudioJournal(Path(args.journal))
+
+    done = [r for r in journal.records.values() if r["status"] == "done"]
+    failed = [r for r in journal.records.values() if r["status"] == "failed"]
+    stale = [r for r in done if not os.path.exists(ROOT / r["output_path"])]
+
+    print(f"📒 Journal: {journal.path}")
+    print(f"   Outputs: {len(journal.records)} ({journal.lines} records)")
+    print(f"   Done: {len(done)}")
+    print(f"   Failed: {len(failed)}")
+    for record in failed:
+        print(f"      ❌ {record['output_path']} ({record['attempts']} attempts)")
+    print(f"   Done but missing on disk: {len(stale)}")
+
+    if args.compact:
+        journal.compact()
+        print(f"🗜️  Compacted to {journal.lines} records")
+
+
+if __name__ == "__main__":
+    main()
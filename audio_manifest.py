@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Audio build manifest for PerfectBrew incremental audio generation.
+
+Maps every generated step (recipe file, step index, language) to the script
+hash and output path it last produced. Diffing the manifest against the
+current recipe JSON tells the generator exactly which .m4a files need to be
+regenerated, renamed or deleted, instead of re-running whole methods.
+Entries also carry the clip's duration in seconds after silence trimming,
+when the generator knows it.
+
+Usage:
+    python3 audio_manifest.py            # Summary of the manifest
+    python3 audio_manifest.py --prune    # Drop entries whose clip no longer exists
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+ROOT = Path(__file__).resolve().parent
+# Build state lives outside PerfectBrew/ so it is never bundled into the app
+BUILD_DIR = ROOT / ".audio_build"
+MANIFEST_PATH = BUILD_DIR / "manifest.json"
+
+
+def relative_path(path: str) -> str:
+    """Path relative to the repository root (unchanged if outside it)."""
+    absolute = os.path.abspath(path)
+    if absolute.startswith(str(ROOT) + os.sep):
+        return os.path.relpath(absolute, ROOT)
+    return absolute
+
+
+def clean_script(text: str) -> str:
+    """Script text as it is sent to TTS (and hashed for the manifest)."""
+    # Remove special characters that might cause TTS issues
+    text = re.sub(r'[^\w\s.,!?;:\-()]', '', text)
+    
+    # Normalize spacing
+    text = re.sub(r'\s+', ' ', text)
+    
+    # Add natural pauses
+    text = text.replace('.', '. ')
+    text = text.replace(',', ', ')
+    text = text.replace(':', ': ')
+    text = text.replace(';', '; ')
+    
+    return text.strip()
+
+
+def script_hash(clean_text: str) -> str:
+    """Hash of a cleaned audio script."""
+    return hashlib.sha256(clean_text.encode("utf-8")).hexdigest()[:16]
+
+
+def entry_key(recipe_ref: str, step_index: Any, language: str) -> str:
+    """
+    Manifest key for one step.
+
+    Args:
+        recipe_ref: Recipe file relative to the repo root plus its index in the
+            file, e.g. "PerfectBrew/Resources/Recipes/V60/.../x.json[0]"
+        step_index: 1-based brewing step number, or "what_to_expect"
+        language: Audio language (en or es)
+    """
+    return f"{recipe_ref}::{step_index}::{language}"
+
+
+def scope_of(key: str) -> str:
+    """The recipe_ref::language part of a manifest key."""
+    recipe_ref, _, language = key.rsplit("::", 2)
+    return f"{recipe_ref}::{language}"
+
+
+class AudioManifest:
+    def __init__(self, path: Path = MANIFEST_PATH):
+        """
+        Load the manifest (an empty one if the file does not exist yet).
+
+        Args:
+            path: Location of manifest.json
+        """
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                self.entries = json.load(f).get("entries", {})
+
+    def plan(self, current: Dict[str, Dict[str, Any]], scopes: Iterable[str]) -> Dict[str, List]:
+        """
+        Diff the manifest against the steps that exist now.
+
+        Args:
+            current: Manifest key -> {"key", "output_path", ...} for every step
+                the recipes currently define
+            scopes: recipe_ref::language values that were scanned; entries
+                outside these scopes are left alone (e.g. other methods)
+
+        Returns:
+            Dict with lists of keys:
+              regenerate: new steps, changed scripts/settings or missing clips
+              rename: same audio, new output path -> (key, old_path, new_path)
+              delete: steps that no longer exist -> (key, old_path)
+              unchanged: steps whose clip is up to date
+        """
+        plan = {"regenerate": [], "rename": [], "delete": [], "unchanged": []}
+        scopes = set(scopes)
+
+        for key, entry in current.items():
+            previous = self.entries.get(key)
+            if previous is None or previous.get("key") != entry["key"]:
+                plan["regenerate"].append(key)
+            elif previous["output_path"] != entry["output_path"]:
+                if os.path.exists(ROOT / previous["output_path"]):
+                    plan["rename"].append((key, previous["output_path"], entry["output_path"]))
+                else:
+                    plan["regenerate"].append(key)
+            elif not os.path.exists(ROOT / entry["output_path"]):
+                plan["regenerate"].append(key)
+            else:
+                plan["unchanged"].append(key)
+
+        current_paths = {entry["output_path"] for entry in current.values()}
+        for key, previous in self.entries.items():
+            if key in current or scope_of(key) not in scopes:
+                continue
+            # A path reused by another step is overwritten, not deleted
+            old_path = previous["output_path"] if previous["output_path"] not in current_paths else None
+            plan["delete"].append((key, old_path))
+
+        return plan
+
+    def record(self, key: str, entry: Dict[str, Any]) -> None:
+        """Record the clip a step produced."""
+        self.entries[key] = entry
+
+    def remove(self, key: str) -> None:
+        """Forget a step."""
+        self.entries.pop(key, None)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".json.tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump({"entries": self.entries}, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PerfectBrew audio build manifest')
+    parser.add_argument('--manifest', default=str(MANIFEST_PATH), help='Manifest path')
+    parser.add_argument('--prune', action='store_true', help='Drop entries whose clip no longer exists')
+
+    args = parser.parse_args()
+    manifest = AudioManifest(Path(args.manifest))
+
+    missing = [key for key, entry in manifest.entries.items()
+               if not os.path.exists(ROOT / entry["output_path"])]
+
+    languages: Dict[str, int] = {}
+    for key in manifest.entries:
+        language = key.rsplit("::", 1)[1]
+        languages[language] = languages.get(language, 0) + 1
+
+    print(f"📋 Manifest: {manifest.path}")
+    print(f"   Entries: {len(manifest.entries)}")
+    for language, count in sorted(languages.items()):
+        print(f"   {language.upper()}: {count}")
+    print(f"   Missing clips: {len(missing)}")
+
+    if args.prune and missing:
+        for key in missing:
+            manifest.remove(key)
+        manifest.save()
+        print(f"🗑️  Pruned {len(missing)} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Spanish/English audio parity report for the PerfectBrew corpus.
+
+For every recipe, compares the clips each language should have (steps with
+an audio_script / audio_script_es, named the way the generator names them)
+with the clips that exist anywhere in the Audio tree, using set operations
+over one directory walk:
+
+  missing   - the step has a script in that language but no clip on disk
+  stale     - the clip was rendered from an older script: the script hash
+              the audio build manifest recorded for it no longer matches
+  unknown   - the clip exists but the manifest has no script hash for it
+              (e.g. a fresh checkout), so its freshness cannot be checked;
+              reported, not counted as a failure
+  unlinked  - a Spanish clip exists but the step has no audio_file_name_es,
+              so the app falls back to English
+  orphaned  - clips on disk that no recipe step expects in any language
+
+Replaces counting *_es.m4a files with find | wc -l after each batch.
+
+Usage:
+    python3 audio_parity.py                # Per-recipe report
+    python3 audio_parity.py --json out.json
+    python3 audio_parity.py --only-problems
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from audio_manifest import MANIFEST_PATH, ROOT, clean_script, entry_key, script_hash
+from audio_paths import AUDIO_DIR, PATH_INDEX_NAME, RECIPES_DIR, bundle_root_index, clip_file_name, is_sprite_file
+from locale_fields import SOURCE_LOCALE, all_locales, localized_field
+
+LANGUAGES = tuple(all_locales())
+SCRIPT_FIELDS = {language: localized_field("audio_script", language) for language in LANGUAGES}
+# Bundle files in the Audio tree that are not step clips
+NON_CLIP_FILES = {PATH_INDEX_NAME, "shared_clips.json"}
+
+
+def expected_clips(recipe: Dict[str, Any], recipe_ref: str) -> List[Dict[str, Any]]:
+    """One entry per (step, language) that should have a clip: name, script and manifest key."""
+    sources = [(number, step, f"step_{number:02d}")
+               for number, step in enumerate(recipe.get("brewing_steps", []), 1)
+               if step.get("audio_script")]
+    if isinstance(recipe.get("what_to_expect"), dict):
+        sources.append(("what_to_expect", recipe["what_to_expect"], "intro"))
+
+    clips = []
+    for step_index, source, default_stem in sources:
+        for language in LANGUAGES:
+            script = source.get(SCRIPT_FIELDS[language])
+            if not script:
+                continue
+            clips.append({
+                "step": step_index,
+                "language": language,
+                "file_name": clip_file_name(source, language, default_stem),
+                "linked": language == SOURCE_LOCALE or bool(source.get(localized_field("audio_file_name", language))),
+                "script_hash": script_hash(clean_script(script)),
+                "manifest_key": entry_key(recipe_ref, step_index, language),
+            })
+    return clips
+
+
+def build_report(recipes_dir: Path = RECIPES_DIR, audio_dir: Path = AUDIO_DIR,
+                 manifest_path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    """
+    Compare expected and existing clips for every recipe.
+
+    Returns:
+        {"recipes": title -> {"file", "<lang>": {"expected", "present",
+        "missing", "stale", "unknown", "unlinked"}}, "orphaned": [paths]}
+    """
+    on_disk = {name: paths[0] for name, paths in bundle_root_index(audio_dir).items()
+               if name not in NON_CLIP_FILES and not is_sprite_file(Path(name))}
+    manifest: Dict[str, Dict[str, Any]] = {}
+    if manifest_path.exists():
+        with manifest_path.open("r", encoding="utf-8") as f:
+            manifest = json.load(f).get("entries", {})
+
+    report: Dict[str, Any] = {"recipes": {}, "orphaned": []}
+    expected_names = set()
+
+    for recipe_file in sorted(recipes_dir.rglob("*.json")):
+        with recipe_file.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        relative = recipe_file.relative_to(ROOT)
+        for recipe_index, recipe in enumerate(data if isinstance(data, list) else [data]):
+            if not isinstance(recipe, dict) or not recipe.get("title"):
+                continue
+            entry = {"file": str(relative)}
+            for language in LANGUAGES:
+                entry[language] = {"expected": 0, "present": 0, "missing": [], "stale": [], "unknown": [],
+                                   "unlinked": []}
+
+            for clip in expected_clips(recipe, f"{relative}[{recipe_index}]"):
+                name = clip["file_name"]
+                counts = entry[clip["language"]]
+                counts["expected"] += 1
+                expected_names.add(name)
+                path = on_disk.get(name)
+                if path is None:
+                    counts["missing"].append(name)
+                    continue
+                counts["present"] += 1
+                if not clip["linked"]:
+                    counts["unlinked"].append(name)
+                recorded = manifest.get(clip["manifest_key"], {}).get("script_hash")
+                if recorded is None:
+                    counts["unknown"].append(name)
+                elif recorded != clip["script_hash"]:
+                    counts["stale"].append(name)
+            report["recipes"][recipe["title"]] = entry
+
+    report["orphaned"] = sorted(str(path.relative_to(ROOT)) for name, path in on_disk.items()
+                                if name not in expected_names)
+    return report
+
+
+def _has_problems(entry: Dict[str, Any]) -> bool:
+    return any(entry[language][kind] for language in LANGUAGES for kind in ("missing", "stale", "unlinked"))
+
+
+def _summary(counts: Dict[str, Any]) -> str:
+    details = [f"{len(counts[kind])} {kind}" for kind in ("missing", "stale", "unknown", "unlinked") if counts[kind]]
+    return f"{counts['present']}/{counts['expected']}" + (f" ({', '.join(details)})" if details else "")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare Spanish and English audio coverage per recipe')
+    parser.add_argument('--json', help='Also write the full report to this JSON file')
+    parser.add_argument('--only-problems', action='store_true', help='Hide recipes with nothing to fix')
+    parser.add_argument('--verbose', '-v', action='store_true', help='List every missing/stale/unknown/unlinked clip')
+
+    args = parser.parse_args()
+    started = time.perf_counter()
+    report = build_report()
+    elapsed = time.perf_counter() - started
+
+    print("🇪🇸🇬🇧 AUDIO PARITY REPORT")
+    print("=" * 60)
+    for title, entry in sorted(report["recipes"].items()):
+        if args.only_problems and not _has_problems(entry):
+            continue
+        marker = "⚠️ " if _has_problems(entry) else "✅"
+        print(f"{marker} {title}: " + " | ".join(f"{language.upper()} {_summary(entry[language])}"
+                                                 for language in LANGUAGES))
+        if args.verbose:
+            for language in LANGUAGES:
+                for kind in ("missing", "stale", "unknown", "unlinked"):
+                    for name in entry[language][kind]:
+                        print(f"      {language.upper()} {kind}: {name}")
+
+    totals: Dict[str, Dict[str, int]] = {}
+    for language in LANGUAGES:
+        totals[language] = {key: 0 for key in ("expected", "present", "missing", "stale", "unknown", "unlinked")}
+        for entry in report["recipes"].values():
+            counts = entry[language]
+            totals[language]["expected"] += counts["expected"]
+            totals[language]["present"] += counts["present"]
+            for kind in ("missing", "stale", "unknown", "unlinked"):
+                totals[language][kind] += len(counts[kind])
+
+    if report["orphaned"]:
+        print(f"\n🗑️  ORPHANED CLIPS ({len(report['orphaned'])}):")
+        for path in report["orphaned"]:
+            print(f"  {path}")
+
+    print(f"\n📊 PARITY SUMMARY ({len(report['recipes'])} recipes, {elapsed:.2f}s):")
+    for language in LANGUAGES:
+        t = totals[language]
+        print(f"  {language.upper()}: {t['present']}/{t['expected']} clips, {t['missing']} missing, "
+              f"{t['stale']} stale, {t['unknown']} unknown, {t['unlinked']} unlinked")
+    print(f"  Orphaned: {len(report['orphaned'])}")
+    if any(totals[language]["unknown"] for language in LANGUAGES):
+        print("  ℹ️  Unknown clips have no script hash in the audio build manifest; "
+              "the next generator run records one")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"📄 Wrote {args.json}")
+
+    problems = sum(totals[language][kind] for language in LANGUAGES for kind in ("missing", "stale"))
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Python mirror of how the app finds a recipe's audio files.
+
+AudioService.swift derives a brewing method and a folder name from the
+recipe title and probes a fixed list of subdirectories of the bundle's
+Audio folder, trying the file name as given and then other extensions.
+The helpers here follow the same rules against PerfectBrew/Resources/Audio
+on disk, so build tools agree with the app about which clip a step plays.
+Keep them in sync with getAudioPath / getBrewingMethod /
+convertTitleToFolderName.
+
+The Xcode target uses a synchronized folder group, which copies every clip
+into the bundle root; that is where most lookups actually succeed, so file
+names must be unique across the whole Audio tree.
+
+Running this module resolves every recipe reference once and writes the
+result to Audio/audio_index.json:
+
+    {"files":   {"<title>": {"<audio_file_name>": "<path under Audio/>"}},
+     "recipes": {"<title>": {"en": {"what_to_expect": ..., "1": ...}, "es": {...}}}}
+
+AudioService reads "files" before falling back to probing, and tools can
+use load_path_index() instead of calling resolve_audio_file per clip.
+
+Usage:
+    python3 audio_paths.py            # Write Audio/audio_index.json
+    python3 audio_paths.py --check    # Exit 1 if the index is out of date
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from locale_fields import SOURCE_LOCALE, audio_fields, localized_field
+
+ROOT = Path(__file__).resolve().parent
+AUDIO_DIR = ROOT / "PerfectBrew" / "Resources" / "Audio"
+RECIPES_DIR = ROOT / "PerfectBrew" / "Resources" / "Recipes"
+PATH_INDEX_NAME = "audio_index.json"
+# (file name field, language) of the clips a recipe references
+FILE_FIELDS = [(file_field, language) for _, file_field, language in audio_fields()]
+# Extensions getAudioPath falls back to when the JSON's extension is stale
+FALLBACK_EXTENSIONS = ["m4a", "mp3", "wav", "aac"]
+# Per-recipe sprites and their offset tables (audio_sprites.py)
+SPRITE_SUFFIX = ".sprite"
+# Recipe "brewing_method" -> folder under Audio/ the generators write into
+METHOD_FOLDERS = {
+    "AeroPress": "AeroPress",
+    "V60": "V60",
+    "French Press": "French_Press",
+    "FrenchPress": "French_Press",
+    "Chemex": "Chemex"
+}
+
+
+def brewing_method(title: str) -> str:
+    """AudioService.getBrewingMethod"""
+    if "AeroPress" in title or "aeropress" in title:
+        return "AeroPress"
+    elif "V60" in title or "v60" in title:
+        return "V60"
+    elif "French Press" in title or "french press" in title:
+        return "French_Press"
+    # Default to AeroPress for backward compatibility
+    return "AeroPress"
+
+
+def folder_name(title: str) -> str:
+    """AudioService.convertTitleToFolderName"""
+    stripped = re.sub(r'[^\w\s]', '', title)
+    return re.sub(r'\s+', '_', stripped)[:50]
+
+
+def recipe_audio_dir(recipe_file: Path, recipe: Dict[str, Any], audio_dir: Path = AUDIO_DIR) -> Path:
+    """
+    Audio/<method>/<recipe file's folder>, where the generators write a recipe's clips.
+
+    Unlike brewing_method(), this follows the recipe file rather than title
+    keywords, so a V60 recipe without "V60" in its title still lands under V60/.
+    """
+    method = recipe.get("brewing_method", "Unknown")
+    return Path(audio_dir) / METHOD_FOLDERS.get(method, method.replace(" ", "_")) / Path(recipe_file).parent.name
+
+
+def candidate_subdirectories(title: str) -> List[str]:
+    """Bundle subdirectories getAudioPath probes, in order."""
+    method = brewing_method(title)
+    folder = folder_name(title)
+    return [
+        f"Audio/{method}/{folder}",
+        f"Resources/Audio/{method}/{folder}",
+        f"Audio/{method}/World_Champions/{folder}",
+        f"Audio/{method}/{folder}/{folder}_AeroPress",
+        f"Audio/{method}/{folder}/{folder}_Classic_AeroPress",
+        f"Audio/{method}/{folder}/{folder}s_Ultimate_AeroPress",
+        f"Audio/{method}/World_Champions/{folder}/{folder}_AeroPress",
+        f"Audio/{method}/World_Champions/{folder}/{folder}_Classic_AeroPress",
+        f"Audio/{method}/World_Champions/{folder}/{folder}s_Ultimate_AeroPress",
+    ]
+
+
+def is_sprite_file(path: Path) -> bool:
+    """True for an audio_sprites.py sprite or offset table rather than a step clip."""
+    return path.name.endswith(f"{SPRITE_SUFFIX}.m4a") or path.name.endswith(f"{SPRITE_SUFFIX}.json")
+
+
+def clip_file_name(source: Dict[str, Any], language: str, default_stem: str) -> str:
+    """
+    The .m4a name the generator writes for a step (or what_to_expect) in language.
+
+    Other languages use their audio_file_name_<lang>, else the English name
+    with a _<lang> suffix.
+
+    Args:
+        default_stem: Name to use when the step has no audio_file_name, e.g. "step_01"
+    """
+    if language != SOURCE_LOCALE:
+        field, suffix = localized_field("audio_file_name", language), f"_{language}"
+        name = source.get(field) or source.get("audio_file_name", f"{default_stem}{suffix}.m4a")
+        if not source.get(field) and suffix not in name:
+            name = f"{name.rsplit('.', 1)[0] if '.' in name else name}{suffix}.m4a"
+    else:
+        name = source.get("audio_file_name", f"{default_stem}.m4a")
+    # Whatever the JSON says, the generator always writes .m4a
+    return (name.rsplit(".", 1)[0] if "." in name else name) + ".m4a"
+
+
+def _subdirectory_path(subdirectory: str, audio_dir: Path) -> Optional[Path]:
+    # Both "Audio/..." and "Resources/Audio/..." live under Resources/Audio on disk
+    for prefix in ("Resources/Audio", "Audio"):
+        if subdirectory == prefix or subdirectory.startswith(prefix + "/"):
+            return audio_dir / subdirectory[len(prefix):].lstrip("/")
+    return None
+
+
+def _candidate_names(file_name: str) -> List[str]:
+    stem, _, extension = file_name.rpartition(".")
+    if not stem:
+        stem, extension = file_name, ""
+    return [file_name, f"{stem}.{extension or 'mp3'}"] + [f"{stem}.{ext}" for ext in FALLBACK_EXTENSIONS]
+
+
+def bundle_root_index(audio_dir: Path = AUDIO_DIR) -> Dict[str, List[Path]]:
+    """File name -> every clip with that name (the flattened bundle root)."""
+    index: Dict[str, List[Path]] = {}
+    for path in sorted(audio_dir.rglob("*")):
+        if path.is_file() and not path.name.startswith("."):
+            index.setdefault(path.name, []).append(path)
+    return index
+
+
+def resolve_audio_file(file_name: str, title: str, audio_dir: Path = AUDIO_DIR,
+                       root_index: Optional[Dict[str, List[Path]]] = None) -> Optional[Path]:
+    """
+    The file under audio_dir the app would play for file_name in this recipe,
+    or None if the app would not find one.
+
+    Args:
+        root_index: bundle_root_index(audio_dir), to avoid rescanning per call
+    """
+    names = _candidate_names(file_name)
+
+    for subdirectory in candidate_subdirectories(title):
+        directory = _subdirectory_path(subdirectory, audio_dir)
+        if directory is None or not directory.is_dir():
+            continue
+        for name in names:
+            if (directory / name).is_file():
+                return directory / name
+
+    # Bundle root: every clip, flattened by the synchronized group
+    if root_index is None:
+        root_index = bundle_root_index(audio_dir)
+    for name in names:
+        if root_index.get(name):
+            return root_index[name][0]
+    return None
+
+
+def _shared_files(audio_dir: Path) -> Dict[str, str]:
+    """audio_file_name -> path under audio_dir of its shared clip (audio_dedup.py)."""
+    index_path = audio_dir / "shared_clips.json"
+    if not index_path.exists():
+        return {}
+    with index_path.open("r", encoding="utf-8") as f:
+        shared = json.load(f)
+    files = {}
+    for file_name, clip_id in shared.get("files", {}).items():
+        clip = shared.get("clips", {}).get(clip_id)
+        if clip and (audio_dir / "Shared" / clip["file"]).is_file():
+            files[file_name] = f"Shared/{clip['file']}"
+    return files
+
+
+def build_path_index(recipes_dir: Path = RECIPES_DIR, audio_dir: Path = AUDIO_DIR) -> Dict[str, Any]:
+    """
+    Resolve every audio reference in the corpus once.
+
+    Returns:
+        {"files": title -> audio_file_name -> path, "recipes": title ->
+        language -> step ("what_to_expect" or 1-based number) -> path}, with
+        paths relative to audio_dir; references with no clip are left out
+    """
+    root_index = {name: paths for name, paths in bundle_root_index(audio_dir).items()
+                  if not is_sprite_file(Path(name))}
+    shared = _shared_files(audio_dir)
+    index: Dict[str, Any] = {"files": {}, "recipes": {}}
+
+    for recipe_file in sorted(recipes_dir.rglob("*.json")):
+        with recipe_file.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        for recipe in data if isinstance(data, list) else [data]:
+            if not isinstance(recipe, dict) or not recipe.get("title"):
+                continue
+            title = recipe["title"]
+            steps = [(str(number), step) for number, step in enumerate(recipe.get("brewing_steps", []), 1)]
+            if isinstance(recipe.get("what_to_expect"), dict):
+                steps.insert(0, ("what_to_expect", recipe["what_to_expect"]))
+
+            for step_key, step in steps:
+                for field, language in FILE_FIELDS:
+                    file_name = step.get(field)
+                    if not file_name:
+                        continue
+                    if file_name in shared:
+                        path = shared[file_name]
+                    else:
+                        clip = resolve_audio_file(file_name, title, audio_dir, root_index)
+                        if clip is None:
+                            continue
+                        path = clip.relative_to(audio_dir).as_posix()
+                    index["files"].setdefault(title, {})[file_name] = path
+                    index["recipes"].setdefault(title, {}).setdefault(language, {})[step_key] = path
+    return index
+
+
+def load_path_index(audio_dir: Path = AUDIO_DIR) -> Dict[str, Any]:
+    """The index last written by write_path_index (empty if there is none)."""
+    index_path = audio_dir / PATH_INDEX_NAME
+    if not index_path.exists():
+        return {"files": {}, "recipes": {}}
+    with index_path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_path_index(index: Dict[str, Any], audio_dir: Path = AUDIO_DIR) -> Path:
+    """Write the index atomically; compact, since it ships in the app bundle."""
+    index_path = audio_dir / PATH_INDEX_NAME
+    temp_path = index_path.with_suffix(".json.tmp")
+    with temp_path.open("w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    os.replace(temp_path, index_path)
+    return index_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write the audio path index AudioService reads')
+    parser.add_argument('--check', action='store_true', help='Only report whether the index is current')
+
+    args = parser.parse_args()
+    index = build_path_index()
+    clips = sum(len(files) for files in index["files"].values())
+
+    if args.check:
+        if load_path_index() != index:
+            print(f"❌ {PATH_INDEX_NAME} is out of date; run python3 audio_paths.py")
+            return 1
+        print(f"✅ {PATH_INDEX_NAME} is current ({len(index['files'])} recipes, {clips} clips)")
+        return 0
+
+    index_path = write_path_index(index)
+    print(f"✅ Wrote {index_path.relative_to(ROOT)} ({len(index['files'])} recipes, {clips} clips)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Post-processing applied to synthesized speech before it is encoded.
+
+  trim_silence       - drops leading/trailing frames quieter than a threshold,
+                       keeping a short pad so words are not clipped
+  normalize_loudness - gated-RMS gain to a common target level (LUFS-style,
+                       without K-weighting), limited so peaks never clip
+
+Both work on whole numpy frames at once; there are no per-sample Python
+loops. Trimming matters for timed brew steps: every second of dead air at
+either end of a clip eats into the step's time_seconds budget.
+"""
+
+from typing import Any, Dict
+
+import numpy as np
+
+# Part of the audio cache key: changing any value re-renders every clip
+POSTPROCESS_SETTINGS = {
+    "frame_ms": 10,
+    "silence_threshold_db": -45.0,
+    "pad_ms": 80,
+    "target_dbfs": -20.0,
+    "peak_ceiling": 0.95,
+}
+
+
+def _frame_rms(wav: np.ndarray, frame: int) -> np.ndarray:
+    """RMS of consecutive frames (the tail shorter than a frame is its own frame)."""
+    count = -(-len(wav) // frame)
+    padded = np.zeros(count * frame, dtype=np.float32)
+    padded[:len(wav)] = wav
+    return np.sqrt(np.mean(np.square(padded.reshape(count, frame)), axis=1))
+
+
+def trim_silence(wav: np.ndarray, sample_rate: int,
+                 settings: Dict[str, Any] = POSTPROCESS_SETTINGS) -> np.ndarray:
+    """Cut leading and trailing silence, keeping pad_ms on each side."""
+    if len(wav) == 0:
+        return wav
+    frame = max(1, int(sample_rate * settings["frame_ms"] / 1000))
+    rms = _frame_rms(wav, frame)
+    voiced = np.flatnonzero(rms > 10 ** (settings["silence_threshold_db"] / 20))
+    if len(voiced) == 0:
+        # Nothing above the threshold: leave it alone rather than return nothing
+        return wav
+
+    pad = int(sample_rate * settings["pad_ms"] / 1000)
+    start = max(0, voiced[0] * frame - pad)
+    end = min(len(wav), (voiced[-1] + 1) * frame + pad)
+    return wav[start:end]
+
+
+def normalize_loudness(wav: np.ndarray, sample_rate: int,
+                       settings: Dict[str, Any] = POSTPROCESS_SETTINGS) -> np.ndarray:
+    """Scale to target_dbfs gated RMS, capped so the peak stays under peak_ceiling."""
+    if len(wav) == 0:
+        return wav
+    frame = max(1, int(sample_rate * settings["frame_ms"] / 1000))
+    rms = _frame_rms(wav, frame)
+    # Gate out pauses so long silences do not drag the level down
+    active = rms[rms > 10 ** (settings["silence_threshold_db"] / 20)]
+    if len(active) == 0:
+        return wav
+
+    level = np.sqrt(np.mean(np.square(active)))
+    gain = 10 ** (settings["target_dbfs"] / 20) / level
+    peak = float(np.max(np.abs(wav)))
+    if peak > 0:
+        gain = min(gain, settings["peak_ceiling"] / peak)
+    return (wav * np.float32(gain)).astype(np.float32, copy=False)
+
+
+def postprocess(wav: np.ndarray, sample_rate: int,
+                settings: Dict[str, Any] = POSTPROCESS_SETTINGS) -> np.ndarray:
+    """Trim, then normalize a mono float waveform."""
+    wav = np.asarray(wav, dtype=np.float32).reshape(-1)
+    return normalize_loudness(trim_silence(wav, sample_rate, settings), sample_rate, settings)
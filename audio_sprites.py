@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Per-recipe audio sprites for the PerfectBrew bundle.
+
+Concatenates every clip a recipe narrates in one language (what_to_expect,
+then the brewing steps in order) into a single .m4a, and writes an offset
+table next to it:
+
+    Audio/<method>/<recipe dir>/<folder>/<folder>_<lang>.sprite.m4a
+    Audio/<method>/<recipe dir>/<folder>/<folder>_<lang>.sprite.json
+
+    {"recipe": ..., "language": ..., "sprite": "<folder>_<lang>.sprite.m4a",
+     "clips": {"<audio_file_name>": {"offset": 12.48, "length": 7.31}, ...},
+     "sources": {...}, "settings": {...}}
+
+A player seeks to offset and stops after length instead of opening one file
+per step. AudioService.swift does not play sprites yet, so the per-step clips
+stay in the bundle; add_audio_files_to_xcode.py --exclude-sprite-clips drops
+them once it does. The directory is the one the generator writes the
+recipe's clips into (audio_paths.recipe_audio_dir, from the recipe file's
+location) and <folder> is AudioService.convertTitleToFolderName, so sprite
+names are unique in the flattened bundle root like every other clip. Clip
+names follow audio_paths.clip_file_name, the same names the generator writes.
+
+The clips are decoded and re-encoded once with an encoding profile, so the
+sprite has a single encoder priming delay and offsets are the cumulative
+measured clip durations (audio_durations.py). Sprites whose sources and
+settings have not changed are skipped; the rest are built on a bounded pool
+of ffmpeg processes.
+
+Usage:
+    python3 audio_sprites.py                    # Build/refresh all sprites
+    python3 audio_sprites.py --profile speech   # Mono 48k sprites
+    python3 audio_sprites.py --dry-run
+    python3 audio_sprites.py --clean            # Delete all sprites and tables
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from audio_durations import probe_duration, refresh_durations
+from audio_encoder import ENCODING_PROFILES, PROFILE_CHOICES, ffmpeg_output_args
+from audio_paths import (AUDIO_DIR, RECIPES_DIR, SPRITE_SUFFIX, bundle_root_index, clip_file_name, folder_name,
+                         is_sprite_file, recipe_audio_dir, resolve_audio_file)
+from locale_fields import all_locales, localized_field
+
+ROOT = Path(__file__).resolve().parent
+LANGUAGES = tuple(all_locales())
+# Offsets come from source durations; a larger drift means the table is wrong
+MAX_DRIFT_SECONDS = 0.25
+
+
+def sprite_paths(title: str, language: str, directory: Path) -> tuple:
+    """(sprite .m4a, offset table .json) for a recipe title and language, in the recipe's clip directory."""
+    stem = f"{folder_name(title)}_{language}{SPRITE_SUFFIX}"
+    return directory / f"{stem}.m4a", directory / f"{stem}.json"
+
+
+def plan_sprites(recipes_dir: Path = RECIPES_DIR, audio_dir: Path = AUDIO_DIR) -> List[Dict[str, Any]]:
+    """One entry per recipe and language: title, language, sprite directory and its clips in playback order."""
+    root_index = bundle_root_index(audio_dir)
+    # Sprites must never be built out of other sprites
+    root_index = {name: paths for name, paths in root_index.items() if not is_sprite_file(Path(name))}
+    plans = []
+    for recipe_file in sorted(recipes_dir.rglob('*.json')):
+        with recipe_file.open('r', encoding='utf-8') as f:
+            data = json.load(f)
+        for recipe in data if isinstance(data, list) else [data]:
+            if not isinstance(recipe, dict) or not recipe.get('title'):
+                continue
+            title = recipe['title']
+            # Where the generator writes this recipe's clips, whatever its title says
+            directory = recipe_audio_dir(recipe_file, recipe, audio_dir) / folder_name(title)
+            sources = []
+            if isinstance(recipe.get('what_to_expect'), dict):
+                sources.append((recipe['what_to_expect'], "intro"))
+            sources.extend((step, f"step_{number:02d}")
+                           for number, step in enumerate(recipe.get('brewing_steps', []), 1))
+
+            for language in LANGUAGES:
+                script_field = localized_field('audio_script', language)
+                clips, missing = [], []
+                for source, default_stem in sources:
+                    if not source.get(script_field):
+                        continue
+                    file_name = clip_file_name(source, language, default_stem)
+                    if any(name == file_name for name, _ in clips):
+                        continue
+                    path = directory / file_name
+                    if not path.is_file():
+                        path = resolve_audio_file(file_name, title, audio_dir, root_index)
+                    if path is None:
+                        missing.append(file_name)
+                    else:
+                        clips.append((file_name, path))
+                if clips:
+                    plans.append({'title': title, 'language': language, 'directory': directory,
+                                  'clips': clips, 'missing': missing,
+                                  'recipe_file': str(recipe_file.relative_to(ROOT))})
+    return plans
+
+
+def _fingerprints(clips: List[tuple]) -> Dict[str, Dict[str, Any]]:
+    result = {}
+    for file_name, path in clips:
+        stat = path.stat()
+        result[file_name] = {'path': str(path.relative_to(ROOT)), 'size': stat.st_size, 'mtime': stat.st_mtime}
+    return result
+
+
+def _load_table(table_path: Path) -> Optional[Dict[str, Any]]:
+    if table_path.exists():
+        with table_path.open('r', encoding='utf-8') as f:
+            return json.load(f)
+    return None
+
+
+def build_sprite(plan: Dict[str, Any], durations: Dict[str, Dict[str, Any]],
+                 settings: Dict[str, Any], audio_dir: Path = AUDIO_DIR) -> Dict[str, Any]:
+    """
+    Concatenate one recipe's clips into its sprite and write the offset table.
+
+    Returns:
+        Dict with 'status' ('built', 'skipped' or 'failed') and 'message'
+    """
+    sprite_path, table_path = sprite_paths(plan['title'], plan['language'], plan['directory'])
+    sources = _fingerprints(plan['clips'])
+    previous = _load_table(table_path)
+    if (previous and previous.get('sources') == sources and previous.get('settings') == settings
+            and sprite_path.exists()):
+        return {'status': 'skipped', 'message': sprite_path.name}
+
+    # Offsets are the running sum of each clip's measured duration
+    clips, offset = {}, 0.0
+    for file_name, path in plan['clips']:
+        length = durations.get(str(path.relative_to(ROOT)), {}).get('duration')
+        if length is None:
+            return {'status': 'failed', 'message': f"{sprite_path.name}: no duration for {file_name}"}
+        clips[file_name] = {'offset': round(offset, 3), 'length': length}
+        offset += length
+
+    # Every input is brought to the output format before concat, so mixed
+    # sample rates/layouts (e.g. old 44.1k stereo next to new speech clips) join cleanly
+    layout = 'mono' if settings['channels'] == 1 else 'stereo'
+    filters = [f"[{i}:a]aformat=sample_fmts=fltp:sample_rates={settings['sample_rate']}:"
+               f"channel_layouts={layout}[a{i}]" for i in range(len(plan['clips']))]
+    inputs = ''.join(f"[a{i}]" for i in range(len(plan['clips'])))
+    filters.append(f"{inputs}concat=n={len(plan['clips'])}:v=0:a=1[out]")
+
+    sprite_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = sprite_path.with_name(f".{sprite_path.stem}.{os.getpid()}.tmp.m4a")
+    cmd = ['ffmpeg', '-loglevel', 'error']
+    for _, path in plan['clips']:
+        cmd += ['-i', str(path)]
+    cmd += ['-filter_complex', ';'.join(filters), '-map', '[out]'] + ffmpeg_output_args(settings, str(temp_path))
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            return {'status': 'failed', 'message': f"{sprite_path.name}: {result.stderr.strip()[-300:]}"}
+        total = probe_duration(temp_path)
+        if total is None or abs(total - offset) > MAX_DRIFT_SECONDS:
+            return {'status': 'failed',
+                    'message': f"{sprite_path.name}: sprite is {total}s but clips sum to {offset:.3f}s"}
+        os.replace(temp_path, sprite_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+    table = {
+        'recipe': plan['title'],
+        'language': plan['language'],
+        'sprite': sprite_path.name,
+        'clips': clips,
+        'sources': sources,
+        'settings': settings,
+    }
+    temp_table = table_path.with_suffix('.json.tmp')
+    with temp_table.open('w', encoding='utf-8') as f:
+        json.dump(table, f, indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(temp_table, table_path)
+    return {'status': 'built', 'message': f"{sprite_path.name} ({len(clips)} clips, {offset:.1f}s)"}
+
+
+def clean_sprites(audio_dir: Path = AUDIO_DIR) -> int:
+    removed = 0
+    for path in audio_dir.rglob(f"*{SPRITE_SUFFIX}.*"):
+        if is_sprite_file(path):
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build per-recipe audio sprites with offset tables')
+    parser.add_argument('--profile', default='standard', choices=PROFILE_CHOICES,
+                        help='AAC profile for the sprites (default: standard)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Concurrent ffmpeg processes (default: CPU count)')
+    parser.add_argument('--dry-run', action='store_true', help='List the sprites that would be built')
+    parser.add_argument('--clean', action='store_true', help='Delete every sprite and offset table')
+
+    args = parser.parse_args()
+
+    if args.clean:
+        print(f"🗑️  Removed {clean_sprites()} sprite files")
+        return 0
+
+    print("🧩 Planning per-recipe audio sprites...")
+    plans = plan_sprites()
+    for plan in plans:
+        if plan['missing']:
+            print(f"⚠️  {plan['title']} [{plan['language']}]: {len(plan['missing'])} clips not on disk "
+                  f"(e.g. {plan['missing'][0]}); sprite covers the rest")
+    clip_count = sum(len(plan['clips']) for plan in plans)
+    print(f"   {len(plans)} sprites from {clip_count} clips")
+
+    if args.dry_run:
+        for plan in plans:
+            sprite_path, _ = sprite_paths(plan['title'], plan['language'], plan['directory'])
+            print(f"🔍 {sprite_path.relative_to(ROOT)} ← {len(plan['clips'])} clips")
+        return 0
+
+    durations = refresh_durations()
+    settings = ENCODING_PROFILES[args.profile]
+    counts = {'built': 0, 'skipped': 0, 'failed': 0}
+    # Threads only wait on ffmpeg, so they bound how many encoder processes run at once
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = [pool.submit(build_sprite, plan, durations, settings) for plan in plans]
+        for future in as_completed(futures):
+            result = future.result()
+            counts[result['status']] += 1
+            if result['status'] == 'built':
+                print(f"✅ {result['message']}")
+            elif result['status'] == 'failed':
+                print(f"❌ {result['message']}")
+
+    print(f"\n📊 SPRITE SUMMARY:")
+    print(f"  Built: {counts['built']}")
+    print(f"  Up to date: {counts['skipped']}")
+    print(f"  Failed: {counts['failed']}")
+    print(f"  Bundle files: {clip_count} clips → {len(plans)} sprites")
+    return 1 if counts['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,13 @@
 """
 clean_partial_translations.py
 
-Removes all partial Spanish translations from recipe JSONs to start fresh.
-This eliminates the "Spanglish" problem.
+Removes all partial translations of one or more locales from recipe JSONs
+to start fresh. This eliminates the "Spanglish" problem.
+
+Every locale given is stripped in the same pass over the corpus (see
+locale_fields.py), so each file is read and written at most once. --all
+cleans every method in one all-or-nothing rewrite: if any file fails,
+nothing is written and the script exits non-zero.
 
 Usage:
     python3 clean_partial_translations.py --method AeroPress
@@ -11,87 +16,68 @@ Usage:
     python3 clean_partial_translations.py --method French_Press
     python3 clean_partial_translations.py --method Chemex
     python3 clean_partial_translations.py --all
+    python3 clean_partial_translations.py --all --locale es --locale pt
 """
 
-import json
 import os
 import sys
 import argparse
 
+from corpus_rewriter import RewriteError
+from locale_fields import LOCALES, locale_schema, process_corpus, strip_locale
+
 RECIPES_DIR = "PerfectBrew/Resources/Recipes"
 
 # Fields to remove (Spanish translations)
-ES_FIELDS_RECIPE = ["title_es", "notes_es", "preparation_steps_es"]
-ES_FIELDS_STEP = ["instruction_es", "short_instruction_es", "audio_script_es", "audio_file_name_es"]
-ES_FIELDS_WTE = ["description_es", "audio_script_es", "audio_file_name_es"]
+ES_FIELDS_RECIPE = locale_schema("es")["recipe"]
+ES_FIELDS_STEP = locale_schema("es")["step"]
+ES_FIELDS_WTE = locale_schema("es")["what_to_expect"]
+
+
+def clean_recipe(recipe: dict, locale: str = "es") -> dict:
+    """Remove all fields of locale from a recipe."""
+    strip_locale(recipe, locale)
+    return recipe
 
 
-def clean_recipe(recipe: dict) -> dict:
-    """Remove all _es fields from a recipe."""
-    # Remove top-level _es fields
-    for field in ES_FIELDS_RECIPE:
-        if field in recipe:
-            del recipe[field]
+def clean_files(filepaths: list, locales: list, dry_run: bool = False) -> list:
+    """
+    Strip locales from every recipe file in one all-or-nothing pass.
     
-    # Clean brewing_steps
-    if "brewing_steps" in recipe:
-        for step in recipe["brewing_steps"]:
-            for field in ES_FIELDS_STEP:
-                if field in step:
-                    del step[field]
+    Returns:
+        Paths of the files cleaned (or that would be)
     
-    # Clean what_to_expect
-    if "what_to_expect" in recipe and isinstance(recipe["what_to_expect"], dict):
-        for field in ES_FIELDS_WTE:
-            if field in recipe["what_to_expect"]:
-                del recipe["what_to_expect"][field]
+    Raises:
+        RewriteError: a file failed; no file was written
+    """
+    result = process_corpus(filepaths, lambda recipe, path, locale: strip_locale(recipe, locale),
+                            locales, dry_run)
     
-    return recipe
+    for filepath in result["changed"]:
+        if dry_run:
+            print(f"  [DRY RUN] Would clean: {filepath}")
+        else:
+            print(f"  ✅ Cleaned: {filepath}")
+    return result["changed"]
 
 
-def clean_file(filepath: str, dry_run: bool = False) -> bool:
+def clean_file(filepath: str, dry_run: bool = False, locales: list = None) -> bool:
     """Clean a single recipe file."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        modified = False
-        
-        # Handle array of recipes
-        if isinstance(data, list):
-            for recipe in data:
-                # Check if any _es fields exist
-                has_es = any(field in recipe for field in ES_FIELDS_RECIPE)
-                if "brewing_steps" in recipe:
-                    for step in recipe["brewing_steps"]:
-                        has_es = has_es or any(field in step for field in ES_FIELDS_STEP)
-                if "what_to_expect" in recipe and isinstance(recipe["what_to_expect"], dict):
-                    has_es = has_es or any(field in recipe["what_to_expect"] for field in ES_FIELDS_WTE)
-                
-                if has_es:
-                    clean_recipe(recipe)
-                    modified = True
-        else:
-            has_es = any(field in data for field in ES_FIELDS_RECIPE)
-            if has_es:
-                clean_recipe(data)
-                modified = True
-        
-        if modified:
-            if dry_run:
-                print(f"  [DRY RUN] Would clean: {filepath}")
-            else:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                print(f"  ✅ Cleaned: {filepath}")
-        
-        return modified
-    except Exception as e:
-        print(f"  ❌ Error: {filepath} - {e}")
-        return False
-
-
-def clean_method(method: str, dry_run: bool = False) -> int:
+    return bool(clean_files([filepath], locales or ["es"], dry_run))
+
+
+def method_files(method: str) -> list:
+    """Every recipe file of a brewing method (none if the method has no directory)."""
+    method_dir = os.path.join(RECIPES_DIR, method)
+    filepaths = []
+    for root, dirs, files in os.walk(method_dir):
+        for file in files:
+            if file.endswith('.json'):
+                filepaths.append(os.path.join(root, file))
+    return sorted(filepaths)
+
+
+def clean_method(method: str, dry_run: bool = False, locales: list = None) -> int:
     """Clean all recipes for a specific brewing method."""
     method_dir = os.path.join(RECIPES_DIR, method)
     
@@ -100,29 +86,24 @@ def clean_method(method: str, dry_run: bool = False) -> int:
         return 0
     
     print(f"\n🧹 Cleaning {method} recipes...")
-    
-    cleaned = 0
-    for root, dirs, files in os.walk(method_dir):
-        for file in files:
-            if file.endswith('.json'):
-                filepath = os.path.join(root, file)
-                if clean_file(filepath, dry_run):
-                    cleaned += 1
+    cleaned = len(clean_files(method_files(method), locales or ["es"], dry_run))
     
     print(f"   Cleaned {cleaned} files in {method}")
     return cleaned
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Clean partial Spanish translations')
+    parser = argparse.ArgumentParser(description='Clean partial translations')
     parser.add_argument('--method', '-m', help='Brewing method to clean (AeroPress, V60, French_Press, Chemex)')
     parser.add_argument('--all', '-a', action='store_true', help='Clean all methods')
     parser.add_argument('--dry-run', '-d', action='store_true', help='Preview without modifying')
+    parser.add_argument('--locale', '-l', action='append', choices=LOCALES,
+                        help='Locale to remove, repeatable (default: es)')
     
     args = parser.parse_args()
     
     print("=" * 60)
-    print("Clean Partial Spanish Translations")
+    print("Clean Partial Translations")
     print("=" * 60)
     
     if args.dry_run:
@@ -137,16 +118,33 @@ def main():
         print("Please specify --method or --all")
         sys.exit(1)
     
-    total_cleaned = 0
+    locales = args.locale or ["es"]
+    files = {}
     for method in methods:
-        total_cleaned += clean_method(method, args.dry_run)
+        if not os.path.exists(os.path.join(RECIPES_DIR, method)):
+            print(f"❌ Method directory not found: {os.path.join(RECIPES_DIR, method)}")
+            continue
+        files[method] = method_files(method)
+    
+    # One transaction for every method: all of them are cleaned or none is
+    print(f"🧹 Cleaning {', '.join(files)} recipes...")
+    try:
+        cleaned = {str(path) for path in clean_files([path for paths in files.values() for path in paths],
+                                                     locales, args.dry_run)}
+    except RewriteError as e:
+        print(f"  ❌ Error: {e}")
+        return 1
+    
+    for method, paths in files.items():
+        print(f"   {method}: {sum(1 for path in paths if path in cleaned)} files")
     
     print("\n" + "=" * 60)
-    print(f"✅ Total: {total_cleaned} files {'would be ' if args.dry_run else ''}cleaned")
+    print(f"✅ Total: {len(cleaned)} files {'would be ' if args.dry_run else ''}cleaned")
     print("=" * 60)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
 
@@ -1,12 +1,46 @@
 #!/usr/bin/env python3
 """
-Convert existing MP3 files to M4A format for iOS compatibility.
+Convert existing audio files to M4A format for iOS compatibility.
 This will fix the audio playback issue without regenerating the audio.
+
+Transcodes the whole Resources/Audio tree with a bounded pool of ffmpeg
+processes. Sources whose mtime/size (or, failing that, content hash) match
+the last successful conversion with the same settings are skipped, so
+re-runs only touch what changed. Once every clip a recipe references exists
+in the new format, the recipe's audio_file_name fields are rewritten
+atomically.
+
+--profile picks the AAC encoding profile. Re-encoding the existing .m4a
+tree in place with a speech profile (--from m4a --profile speech) shrinks
+the bundle without re-running TTS, and prints the bytes saved per recipe.
+
+Usage:
+    python3 convert_mp3_to_m4a.py                   # All .mp3 under Resources/Audio
+    python3 convert_mp3_to_m4a.py --from wav -j 8   # Other source formats, 8 encoders
+    python3 convert_mp3_to_m4a.py --keep-source --dry-run
+    python3 convert_mp3_to_m4a.py --from m4a --profile speech
 """
 
+import argparse
+import json
 import os
 import subprocess
-import json
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from audio_encoder import ENCODING_PROFILES, PROFILE_CHOICES, ffmpeg_output_args
+from audio_journal import file_sha256
+from audio_manifest import BUILD_DIR
+
+ROOT = Path(__file__).resolve().parent
+AUDIO_DIR = ROOT / "PerfectBrew" / "Resources" / "Audio"
+RECIPES_DIR = ROOT / "PerfectBrew" / "Resources" / "Recipes"
+# Fingerprints of converted files, outside PerfectBrew/ so it is never bundled
+STATE_PATH = BUILD_DIR / "transcode_state.json"
+AUDIO_FILE_FIELDS = ['audio_file_name', 'audio_file_name_es']
+
 
 def check_ffmpeg():
     """Check if ffmpeg is available"""
@@ -22,113 +56,246 @@ def check_ffmpeg():
         print("❌ ffmpeg not found")
         return False
 
-def convert_mp3_to_m4a(input_file, output_file):
-    """Convert MP3 file to M4A using ffmpeg"""
+
+def load_state() -> Dict[str, Any]:
+    if STATE_PATH.exists():
+        with STATE_PATH.open('r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state: Dict[str, Any]) -> None:
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = STATE_PATH.with_suffix('.json.tmp')
+    with temp_path.open('w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(temp_path, STATE_PATH)
+
+
+def fingerprint(path: Path, with_hash: bool = True) -> Dict[str, Any]:
+    stat = path.stat()
+    result = {'mtime': stat.st_mtime, 'size': stat.st_size}
+    if with_hash:
+        result['sha256'] = file_sha256(str(path))
+    return result
+
+
+def is_current(record: Optional[Dict[str, Any]], source: Path, output: Path,
+               settings: Dict[str, Any]) -> bool:
+    """True if source was already converted to output with these settings."""
+    if not record or record['settings'] != settings or not output.exists():
+        return False
+    # In-place re-encodes (m4a -> m4a) fingerprint the output they left behind
+    current = fingerprint(source, with_hash=False)
+    if (current['mtime'], current['size']) == (record['mtime'], record['size']):
+        return True
+    # Touched but possibly identical (git checkout, copy): fall back to the hash
+    return current['size'] == record['size'] and file_sha256(str(source)) == record['sha256']
+
+
+def convert_to_m4a(input_file: Path, output_file: Path, settings: Dict[str, Any]) -> bool:
+    """Convert an audio file to M4A using ffmpeg, replacing output_file atomically"""
+    # Keep the .m4a extension on the temp file so ffmpeg picks the right muxer
+    temp_file = output_file.with_name(f".{output_file.stem}.{os.getpid()}.tmp.m4a")
+    cmd = ['ffmpeg', '-loglevel', 'error', '-i', str(input_file)] + ffmpeg_output_args(settings, str(temp_file))
     try:
-        cmd = [
-            'ffmpeg',
-            '-i', input_file,           # Input file
-            '-c:a', 'aac',              # Audio codec: AAC
-            '-b:a', '128k',             # Audio bitrate: 128kbps
-            '-ar', '44100',             # Sample rate: 44.1kHz
-            '-ac', '2',                 # Stereo
-            '-y',                       # Overwrite output file
-            output_file
-        ]
-        
-        print(f"🔄 Converting: {os.path.basename(input_file)} → {os.path.basename(output_file)}")
         result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print(f"✅ Converted: {os.path.basename(output_file)}")
-            return True
-        else:
-            print(f"❌ Failed to convert {os.path.basename(input_file)}: {result.stderr}")
+        if result.returncode != 0:
+            print(f"❌ Failed to convert {input_file.name}: {result.stderr.strip()[-300:]}")
             return False
-            
+        os.replace(temp_file, output_file)
+        return True
     except Exception as e:
-        print(f"❌ Error converting {os.path.basename(input_file)}: {e}")
+        print(f"❌ Error converting {input_file.name}: {e}")
         return False
+    finally:
+        if temp_file.exists():
+            temp_file.unlink()
+
+
+def find_sources(audio_dir: Path, extensions: List[str]) -> List[Path]:
+    sources = []
+    for ext in extensions:
+        sources.extend(p for p in audio_dir.rglob(f"*.{ext}") if not p.name.startswith('.'))
+    return sorted(sources)
+
+
+def transcode_all(sources: List[Path], settings: Dict[str, Any], jobs: int,
+                  keep_source: bool, dry_run: bool) -> Dict[str, Any]:
+    """
+    Convert every source on a bounded pool of ffmpeg processes.
+
+    Returns:
+        Dict with converted/skipped/failed counts and 'sizes': output path ->
+        (bytes before, bytes after) for every converted file
+    """
+    state = load_state()
+    counts = {'converted': 0, 'skipped': 0, 'failed': 0, 'sizes': {}}
+
+    todo = []
+    for source in sources:
+        output = source.with_suffix('.m4a')
+        key = str(source.relative_to(ROOT))
+        if is_current(state.get(key), source, output, settings):
+            counts['skipped'] += 1
+        else:
+            todo.append((key, source, output))
+
+    print(f"📁 {len(sources)} source files: {len(todo)} to convert, {counts['skipped']} up to date")
+    if dry_run:
+        for _, source, output in todo:
+            print(f"🔍 {source.relative_to(ROOT)} → {output.name}")
+        return counts
+
+    # Threads only wait on ffmpeg, so they bound how many encoder processes run at once
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(convert_to_m4a, source, output, settings): (key, source, output,
+                                                                           source.stat().st_size)
+                   for key, source, output in todo}
+        for done, future in enumerate(as_completed(futures), 1):
+            key, source, output, size_before = futures[future]
+            if not future.result():
+                counts['failed'] += 1
+                continue
+            counts['converted'] += 1
+            counts['sizes'][output] = (size_before, output.stat().st_size)
+            print(f"✅ [{done}/{len(todo)}] {output.relative_to(ROOT)}")
+            if source != output and not keep_source:
+                source.unlink()
+                state.pop(key, None)
+            else:
+                # Fingerprint what is left at the source path for the next run
+                state[key] = dict(fingerprint(source), settings=settings)
+
+    save_state(state)
+    return counts
+
+
+def print_savings_report(sizes: Dict[Path, tuple], audio_dir: Path) -> None:
+    """Bytes before/after per recipe folder, largest savings first."""
+    by_recipe: Dict[str, List[int]] = {}
+    for output, (before, after) in sizes.items():
+        totals = by_recipe.setdefault(str(output.parent.relative_to(audio_dir)), [0, 0, 0])
+        totals[0] += 1
+        totals[1] += before
+        totals[2] += after
+
+    print(f"\n💾 SIZE REPORT (per recipe):")
+    for recipe, (files, before, after) in sorted(by_recipe.items(), key=lambda item: item[1][2] - item[1][1]):
+        print(f"  {recipe}: {files} files, {before / 1024:.0f} KB → {after / 1024:.0f} KB "
+              f"({_percent_saved(before, after)})")
+    before = sum(b for b, _ in sizes.values())
+    after = sum(a for _, a in sizes.values())
+    print(f"  TOTAL: {before / (1024 * 1024):.1f} MB → {after / (1024 * 1024):.1f} MB "
+          f"({_percent_saved(before, after)})")
+
+
+def _percent_saved(before: int, after: int) -> str:
+    if not before:
+        return "n/a"
+    return f"{(before - after) * 100 / before:.0f}% saved"
+
+
+def _referenced_files(recipe: Dict[str, Any]):
+    """(container dict, field) for every audio file name a recipe references."""
+    containers = list(recipe.get('brewing_steps', []))
+    if isinstance(recipe.get('what_to_expect'), dict):
+        containers.append(recipe['what_to_expect'])
+    for container in containers:
+        for field in AUDIO_FILE_FIELDS:
+            if isinstance(container, dict) and container.get(field):
+                yield container, field
+
+
+def update_recipe_json(recipes_dir: Path, audio_dir: Path, extensions: List[str], dry_run: bool) -> int:
+    """
+    Point audio_file_name fields at the .m4a files, one recipe file at a time.
+
+    Recipe JSON only stores bare file names, so a recipe is rewritten once every
+    file it references has an .m4a of the same name in the audio tree.
+    """
+    available = {p.name for p in audio_dir.rglob('*.m4a')}
+    updated = 0
+
+    for recipe_file in sorted(recipes_dir.rglob('*.json')):
+        with recipe_file.open('r', encoding='utf-8') as f:
+            data = json.load(f)
+        recipes = data if isinstance(data, list) else [data]
+
+        renames = []
+        for recipe in recipes:
+            if not isinstance(recipe, dict):
+                continue
+            for container, field in _referenced_files(recipe):
+                stem, _, ext = container[field].rpartition('.')
+                if ext in extensions and ext != 'm4a':
+                    renames.append((container, field, f"{stem}.m4a"))
+        if not renames:
+            continue
+
+        missing = [new for _, _, new in renames if new not in available]
+        if missing:
+            print(f"⏳ {recipe_file.relative_to(ROOT)}: waiting for {len(missing)} clips (e.g. {missing[0]})")
+            continue
+
+        print(f"📝 {recipe_file.relative_to(ROOT)}: {len(renames)} audio_file_name fields → .m4a")
+        if dry_run:
+            continue
+        for container, field, new in renames:
+            container[field] = new
+
+        # Atomic rewrite: the app bundle never sees a half-written recipe
+        temp_path = recipe_file.with_suffix('.json.tmp')
+        with temp_path.open('w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, recipe_file)
+        updated += 1
+
+    return updated
 
-def update_recipe_json():
-    """Update recipe JSON to use .m4a files instead of .mp3"""
-    recipe_file = "PerfectBrew/Resources/Recipes/AeroPress/World_Champions/2021_Tuomas_Merikanto_Finland/AeroPress_2021_Tuomas_Merikanto_single_serve.json"
-    
-    with open(recipe_file, 'r') as f:
-        recipes = json.load(f)
-    
-    recipe = recipes[0]
-    updated = False
-    
-    for step in recipe.get('brewing_steps', []):
-        if step.get('audio_file_name', '').endswith('.mp3'):
-            step['audio_file_name'] = step['audio_file_name'].replace('.mp3', '.m4a')
-            updated = True
-    
-    if updated:
-        with open(recipe_file, 'w') as f:
-            json.dump(recipes, f, indent=2)
-        print("✅ Updated recipe JSON to use .m4a files")
-    else:
-        print("⚠️  No .mp3 files found in recipe JSON")
 
 def main():
-    print("🔄 CONVERTING MP3 FILES TO M4A FOR iOS COMPATIBILITY")
+    parser = argparse.ArgumentParser(description='Bulk-transcode PerfectBrew audio to M4A')
+    parser.add_argument('--audio-dir', default=str(AUDIO_DIR), help='Audio tree to transcode')
+    parser.add_argument('--recipes-dir', default=str(RECIPES_DIR), help='Recipe JSON tree to update')
+    parser.add_argument('--from', dest='extensions', default='mp3',
+                        help='Comma-separated source extensions (default: mp3)')
+    parser.add_argument('--profile', default='standard', choices=PROFILE_CHOICES,
+                        help='AAC profile: standard (128k stereo), speech (48k mono 22.05 kHz) '
+                             'or speech-he (32k HE-AAC, needs libfdk_aac)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Concurrent ffmpeg processes (default: CPU count)')
+    parser.add_argument('--keep-source', action='store_true', help='Keep the original files')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would change')
+
+    args = parser.parse_args()
+    extensions = [ext.strip().lstrip('.').lower() for ext in args.extensions.split(',') if ext.strip()]
+
+    print("🔄 CONVERTING AUDIO FILES TO M4A FOR iOS COMPATIBILITY")
     print("=" * 60)
-    
-    # Check if ffmpeg is available
-    if not check_ffmpeg():
+
+    if not args.dry_run and not check_ffmpeg():
         print("Please install ffmpeg first:")
         print("brew install ffmpeg")
-        return
-    
-    # Define paths
-    input_dir = "PerfectBrew/Resources/Audio/AeroPress/World_Champions/2021_World_AeroPress_Champion_Tuomas_Merikanto_Finland_Inverted"
-    
-    if not os.path.exists(input_dir):
-        print(f"❌ Input directory not found: {input_dir}")
-        return
-    
-    # Find all MP3 files
-    mp3_files = [f for f in os.listdir(input_dir) if f.endswith('.mp3')]
-    
-    if not mp3_files:
-        print("❌ No MP3 files found in input directory")
-        return
-    
-    print(f"📁 Found {len(mp3_files)} MP3 files to convert")
-    
-    # Convert each MP3 file to M4A
-    success_count = 0
-    
-    for mp3_file in sorted(mp3_files):
-        input_path = os.path.join(input_dir, mp3_file)
-        m4a_file = mp3_file.replace('.mp3', '.m4a')
-        output_path = os.path.join(input_dir, m4a_file)
-        
-        if convert_mp3_to_m4a(input_path, output_path):
-            success_count += 1
-            
-            # Remove the original MP3 file
-            os.remove(input_path)
-            print(f"🗑️  Removed original MP3: {mp3_file}")
-    
+        return 1
+
+    audio_dir = Path(args.audio_dir).resolve()
+    recipes_dir = Path(args.recipes_dir).resolve()
+    sources = find_sources(audio_dir, extensions)
+    counts = transcode_all(sources, ENCODING_PROFILES[args.profile], max(1, args.jobs),
+                           args.keep_source, args.dry_run)
+    if counts['sizes']:
+        print_savings_report(counts['sizes'], audio_dir)
+    updated = update_recipe_json(recipes_dir, audio_dir, extensions, args.dry_run)
+
     print(f"\n📊 CONVERSION SUMMARY:")
-    print(f"  Successfully converted: {success_count}/{len(mp3_files)} files")
-    print(f"  Output directory: {input_dir}")
-    
-    if success_count == len(mp3_files):
-        print("✅ All files converted successfully!")
-        
-        # Update recipe JSON
-        update_recipe_json()
-        
-        print("\n🎯 NEXT STEPS:")
-        print("1. Build and run the app in Xcode")
-        print("2. Test the 2021 World Champion recipe")
-        print("3. Audio should now play correctly!")
-    else:
-        print("❌ Some files failed to convert")
+    print(f"  Converted: {counts['converted']}")
+    print(f"  Up to date: {counts['skipped']}")
+    print(f"  Failed: {counts['failed']}")
+    print(f"  Recipe files updated: {updated}")
+
+    return 1 if counts['failed'] else 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+corpus_rewriter.py
+
+All-or-nothing, parallel rewrites of recipe JSON files.
+
+The translation tools used to load, mutate and rewrite recipes one file at a
+time with open(path, 'w'): a crash or a bad file halfway through left some
+recipes translated and others not (or a file truncated mid-write), which is
+the "Spanglish" state clean_partial_translations.py exists to undo.
+rewrite_corpus() replaces that loop for every tool:
+
+  1. A thread pool reads, parses and transforms every file, serializes the
+     result the way the tools always have (indent=2, ensure_ascii=False)
+     and, only if the bytes differ from what is on disk, writes them to a
+     fsynced temp file next to the original. Unchanged files are never
+     rewritten, so their mtimes (which audio_parity.py reads) stay put.
+  2. If any file failed, every temp file is deleted and RewriteError is
+     raised: nothing was touched.
+  3. Otherwise the temp files are renamed over the originals with
+     os.replace. If a rename fails, the files already replaced are
+     restored from their original bytes.
+
+A journal in .translation_cache/ covers a crash of the process itself:
+interrupted while staging, the next run deletes the temp files; interrupted
+while renaming, it finishes the renames. Either way the corpus ends up
+entirely old or entirely new.
+
+Usage:
+    python3 corpus_rewriter.py --recover    # Settle an interrupted rewrite
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent
+JOURNAL_PATH = ROOT / ".translation_cache" / "rewrite_journal.json"
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+
+class RewriteError(Exception):
+    def __init__(self, failures: List[Tuple[Path, BaseException]]):
+        self.failures = failures
+        details = "; ".join(f"{path}: {error}" for path, error in failures[:3])
+        more = f" (+{len(failures) - 3} more)" if len(failures) > 3 else ""
+        super().__init__(f"{len(failures)} file(s) failed, nothing was written: {details}{more}")
+
+
+def serialize(data: Any) -> bytes:
+    """Recipe JSON exactly as the tools write it."""
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _temp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def _write_synced(path: Path, content: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _write_journal(journal_path: Path, state: str, pairs: List[Tuple[Path, Path]]) -> None:
+    journal_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = journal_path.with_suffix(".json.tmp")
+    content = json.dumps({"state": state, "files": [[str(temp), str(target)] for temp, target in pairs]})
+    _write_synced(temp_path, content.encode("utf-8"))
+    os.replace(temp_path, journal_path)
+
+
+def recover(journal_path: Path = JOURNAL_PATH) -> Optional[str]:
+    """
+    Settle a rewrite interrupted by a crash.
+
+    Returns:
+        None if there was nothing to do, 'rolled back' if staged temp files
+        were discarded, 'rolled forward' if pending renames were completed
+    """
+    if not journal_path.exists():
+        return None
+    with journal_path.open("r", encoding="utf-8") as f:
+        journal = json.load(f)
+
+    for temp, target in journal.get("files", []):
+        temp_path = Path(temp)
+        if not temp_path.exists():
+            continue
+        if journal.get("state") == "committing":
+            # Every temp file was complete before renaming started
+            os.replace(temp_path, target)
+        else:
+            temp_path.unlink()
+    journal_path.unlink()
+    return "rolled forward" if journal.get("state") == "committing" else "rolled back"
+
+
+def _stage(path: Path, transform: Callable[[Any, Path], Any], dry_run: bool) -> Dict[str, Any]:
+    original = path.read_bytes()
+    data = json.loads(original)
+    info = transform(data, path)
+    content = serialize(data)
+    record = {"path": path, "info": info, "changed": content != original, "original": original}
+    if record["changed"] and not dry_run:
+        _write_synced(_temp_path(path), content)
+    return record
+
+
+def rewrite_corpus(paths: Iterable[Any], transform: Callable[[Any, Path], Any], jobs: int = DEFAULT_JOBS,
+                   dry_run: bool = False, journal_path: Path = JOURNAL_PATH) -> List[Dict[str, Any]]:
+    """
+    Transform recipe files in parallel and commit every change or none.
+
+    Args:
+        paths: Recipe JSON files
+        transform: transform(data, path) mutates the parsed JSON in place; its
+            return value is passed back as the record's 'info'
+        jobs: Worker threads
+        dry_run: Transform and compare, but write nothing
+
+    Returns:
+        One record per path, in order: {'path', 'info', 'changed'}, where
+        'changed' means the file's bytes differ (and were written)
+
+    Raises:
+        RewriteError: a file could not be read, parsed, transformed or
+            written; the corpus is left as it was
+    """
+    recover(journal_path)
+    paths = [Path(path) for path in paths]
+    if not paths:
+        return []
+    if not dry_run:
+        _write_journal(journal_path, "staging", [(_temp_path(path), path) for path in paths])
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(_stage, path, transform, dry_run) for path in paths]
+    records, failures = [], []
+    for path, future in zip(paths, futures):
+        try:
+            records.append(future.result())
+        except Exception as e:
+            failures.append((path, e))
+
+    changed = [record for record in records if record["changed"]]
+    if dry_run:
+        if failures:
+            raise RewriteError(failures)
+        return [_public(record) for record in records]
+
+    if failures or not changed:
+        for record in changed:
+            _temp_path(record["path"]).unlink(missing_ok=True)
+        journal_path.unlink(missing_ok=True)
+        if failures:
+            raise RewriteError(failures)
+        return [_public(record) for record in records]
+
+    _write_journal(journal_path, "committing", [(_temp_path(record["path"]), record["path"]) for record in changed])
+    replaced = []
+    try:
+        for record in changed:
+            os.replace(_temp_path(record["path"]), record["path"])
+            replaced.append(record)
+    except OSError as e:
+        # Put back what was already replaced, then drop the rest of the staged files
+        for record in replaced:
+            restore_path = _temp_path(record["path"])
+            _write_synced(restore_path, record["original"])
+            os.replace(restore_path, record["path"])
+        for record in changed[len(replaced):]:
+            _temp_path(record["path"]).unlink(missing_ok=True)
+        journal_path.unlink(missing_ok=True)
+        raise RewriteError([(changed[len(replaced)]["path"], e)]) from e
+    journal_path.unlink()
+    return [_public(record) for record in records]
+
+
+def _public(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {"path": record["path"], "info": record["info"], "changed": record["changed"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Settle an interrupted recipe rewrite')
+    parser.add_argument('--recover', action='store_true', help='Finish or undo an interrupted rewrite')
+    args = parser.parse_args()
+
+    if not args.recover:
+        parser.print_help()
+        return 0
+    outcome = recover()
+    print(f"✅ Interrupted rewrite {outcome}" if outcome else "✅ No interrupted rewrite")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,10 @@ from pathlib import Path
 # Check if we can import the generator
 try:
     from universal_audio_generator import UniversalAudioGenerator
+    from audio_cache import CACHE_DIR
+    from tts_backends import BACKEND_CHOICES
+    from audio_encoder import PROFILE_CHOICES
+    from audio_paths import recipe_audio_dir
 except ImportError:
     print("❌ Cannot import UniversalAudioGenerator. Make sure universal_audio_generator.py is in the same directory.")
     sys.exit(1)
@@ -22,15 +26,6 @@ BASE_DIR = Path(__file__).parent
 RECIPES_DIR = BASE_DIR / "PerfectBrew" / "Resources" / "Recipes"
 AUDIO_DIR = BASE_DIR / "PerfectBrew" / "Resources" / "Audio"
 
-# Mapping of brewing methods to their folder names
-METHOD_FOLDERS = {
-    "AeroPress": "AeroPress",
-    "V60": "V60",
-    "French Press": "French_Press",
-    "FrenchPress": "French_Press",
-    "Chemex": "Chemex"
-}
-
 def find_all_recipe_files():
     """Find all recipe JSON files."""
     recipe_files = []
@@ -44,18 +39,28 @@ def find_all_recipe_files():
                 recipe_files.append(json_file)
     return recipe_files
 
-def get_audio_output_dir(recipe_file: Path, recipe_data: dict) -> Path:
+def get_audio_output_dir(recipe_file: Path, recipe_data: dict, audio_dir: Path = AUDIO_DIR) -> Path:
     """Determine the output directory for audio files."""
-    # Get brewing method from recipe
-    brewing_method = recipe_data.get("brewing_method", "Unknown")
-    method_folder = METHOD_FOLDERS.get(brewing_method, brewing_method.replace(" ", "_"))
-    
-    # Get recipe folder name from the parent directory
-    recipe_folder = recipe_file.parent.name
-    
-    # Construct output path
-    output_dir = AUDIO_DIR / method_folder / recipe_folder
-    return output_dir
+    return recipe_audio_dir(recipe_file, recipe_data, audio_dir)
+
+def render_recipe_file(recipe_file: Path, generator: UniversalAudioGenerator) -> bool:
+    """Generate audio for every recipe in a file, into the bundle directory AudioService reads."""
+    recipe_file = Path(recipe_file).resolve()
+    with open(recipe_file, 'r', encoding='utf-8') as f:
+        recipe_data = json.load(f)
+    recipes = recipe_data if isinstance(recipe_data, list) else [recipe_data]
+    
+    success = True
+    for recipe_index, recipe in enumerate(recipes):
+        output_dir = get_audio_output_dir(recipe_file, recipe)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        success = generator.generate_recipe_audio(
+            recipe=recipe,
+            output_dir=str(output_dir),
+            include_preparation=False,  # Preparation steps don't have audio
+            recipe_ref=f"{recipe_file.relative_to(BASE_DIR.resolve())}[{recipe_index}]"
+        ) and success
+    return success
 
 def process_recipe(recipe_file: Path, generator: UniversalAudioGenerator, dry_run: bool = False) -> bool:
     """Process a single recipe file and generate Spanish audio."""
@@ -76,7 +81,7 @@ def process_recipe(recipe_file: Path, generator: UniversalAudioGenerator, dry_ru
     else:
         recipes = [recipe_data]
     
-    for recipe in recipes:
+    for recipe_index, recipe in enumerate(recipes):
         title = recipe.get("title", "Unknown")
         
         # Check if recipe has Spanish audio scripts
@@ -122,7 +127,8 @@ def process_recipe(recipe_file: Path, generator: UniversalAudioGenerator, dry_ru
                 output_dir=str(output_dir),
                 include_preparation=False,  # Preparation steps don't have audio
                 include_brewing=True,
-                include_notes=True
+                include_notes=True,
+                recipe_ref=f"{recipe_file.relative_to(BASE_DIR)}[{recipe_index}]"
             )
             
             if success:
@@ -146,6 +152,26 @@ def main():
                         help='Filter by brewing method')
     parser.add_argument('--recipe', help='Filter by specific recipe name (partial match)')
     parser.add_argument('--device', default='cpu', choices=['cpu', 'cuda'], help='Device for TTS')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='Number of TTS worker processes kept alive across recipes (default: 1)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-synthesize, ignoring the TTS output cache')
+    parser.add_argument('--changed-only', action='store_true',
+                        help='Only regenerate, rename or delete clips whose step changed since the last run')
+    parser.add_argument('--backend', default='chatterbox', choices=BACKEND_CHOICES,
+                        help='TTS backend: chatterbox for final renders, pyttsx3/say/silent/tone for fast drafts')
+    parser.add_argument('--resume', action='store_true',
+                        help='Resume a crashed or killed run: skip finished jobs, retry failed ones')
+    parser.add_argument('--retries', type=int, default=2,
+                        help='Extra attempts for failed jobs, with exponential backoff (default: 2)')
+    parser.add_argument('--job-timeout', type=int, default=300,
+                        help='Seconds one script may take to synthesize before it is retried (default: 300)')
+    parser.add_argument('--voice', default=None,
+                        help='Reference clip to clone, e.g. reference_spanish_latam.wav (chatterbox only)')
+    parser.add_argument('--profile', default='standard', choices=PROFILE_CHOICES,
+                        help='AAC profile: standard (128k stereo), speech (48k mono) or speech-he (HE-AAC)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Synthesize long scripts sentence by sentence straight into the encoder (flat memory)')
     
     args = parser.parse_args()
     
@@ -176,7 +202,16 @@ def main():
     if not args.dry_run:
         print("\n🔧 Initializing Chatterbox TTS (Spanish mode)...")
         try:
-            generator = UniversalAudioGenerator(device=args.device, language='es')
+            generator = UniversalAudioGenerator(device=args.device, language='es', workers=args.workers,
+                                                cache_dir=None if args.no_cache else str(CACHE_DIR),
+                                                changed_only=args.changed_only,
+                                                stream=args.stream,
+                                                backend=args.backend,
+                                                resume=args.resume,
+                                                retries=args.retries,
+                                                job_timeout=args.job_timeout,
+                                                voice=args.voice,
+                                                profile=args.profile)
         except Exception as e:
             print(f"❌ Failed to initialize TTS: {e}")
             print("💡 Make sure Chatterbox TTS is installed: pip install chatterbox-tts")
@@ -199,6 +234,9 @@ def main():
             print(f"❌ Unexpected error: {e}")
             fail_count += 1
     
+    if generator:
+        generator.close()
+    
     # Summary
     print("\n" + "=" * 60)
     print("📊 SUMMARY")
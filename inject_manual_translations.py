@@ -1,19 +1,25 @@
-#!/usr/bin/env python3
 """
 inject_manual_translations.py
 
-Injects complete manual Spanish translations from manual_translations_es.json
-into individual recipe JSON files. Only injects 100% Spanish content.
+Injects complete manual translations from manual_translations_<locale>.json
+into individual recipe JSON files. Only injects 100% translated content.
+
+All requested locales are injected in one pass: each recipe file is read
+and written once however many locales it receives (see locale_fields.py).
 
 Usage:
     python3 inject_manual_translations.py
+    python3 inject_manual_translations.py --locale es --locale pt
 """
 
+import argparse
 import json
 import os
-import glob
 
-TRANSLATIONS_FILE = "PerfectBrew/Resources/Translations/manual_translations_es.json"
+from locale_fields import LOCALES, TEXT_FIELDS, inject_locale, process_corpus
+
+TRANSLATIONS_DIR = "PerfectBrew/Resources/Translations"
+TRANSLATIONS_FILE = os.path.join(TRANSLATIONS_DIR, "manual_translations_es.json")
 RECIPES_DIR = "PerfectBrew/Resources/Recipes"
 
 # Map translation keys to file paths
@@ -26,54 +32,39 @@ RECIPE_PATHS = {
 }
 
 
-def inject_translation(recipe: dict, translation: dict) -> dict:
-    """Inject Spanish translations into a recipe."""
-    
-    # Top-level fields
-    if "title_es" in translation:
-        recipe["title_es"] = translation["title_es"]
-    if "notes_es" in translation:
-        recipe["notes_es"] = translation["notes_es"]
-    if "preparation_steps_es" in translation:
-        recipe["preparation_steps_es"] = translation["preparation_steps_es"]
-    
-    # Brewing steps
-    if "brewing_steps" in translation and "brewing_steps" in recipe:
-        for i, step_trans in enumerate(translation["brewing_steps"]):
-            if i < len(recipe["brewing_steps"]):
-                step = recipe["brewing_steps"][i]
-                if "instruction_es" in step_trans:
-                    step["instruction_es"] = step_trans["instruction_es"]
-                if "short_instruction_es" in step_trans:
-                    step["short_instruction_es"] = step_trans["short_instruction_es"]
-                if "audio_script_es" in step_trans:
-                    step["audio_script_es"] = step_trans["audio_script_es"]
-    
-    # What to expect
-    if "what_to_expect" in translation and "what_to_expect" in recipe:
-        wte = recipe["what_to_expect"]
-        wte_trans = translation["what_to_expect"]
-        if "description_es" in wte_trans:
-            wte["description_es"] = wte_trans["description_es"]
-        if "audio_script_es" in wte_trans:
-            wte["audio_script_es"] = wte_trans["audio_script_es"]
-    
+def inject_translation(recipe: dict, translation: dict, locale: str = "es") -> dict:
+    """Inject a locale's translations into a recipe."""
+    inject_locale(recipe, translation, locale, fields=TEXT_FIELDS)
     return recipe
 
 
+def load_manual_translations(locale: str) -> dict:
+    """Translation key -> entry from manual_translations_<locale>.json (empty if there is none)."""
+    path = os.path.join(TRANSLATIONS_DIR, f"manual_translations_{locale}.json")
+    if not os.path.exists(path):
+        print(f"⚠️  No manual translations file: {path}")
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get("translations", {})
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Inject manual translations into recipe files')
+    parser.add_argument('--locale', '-l', action='append', choices=LOCALES,
+                        help='Locale to inject, repeatable (default: es)')
+    args = parser.parse_args()
+    locales = args.locale or ["es"]
+    
     print("=" * 60)
-    print("Inject Manual Spanish Translations")
+    print("Inject Manual Translations")
     print("=" * 60)
     
     # Load translations
-    with open(TRANSLATIONS_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    translations = data.get("translations", {})
+    translations = {locale: load_manual_translations(locale) for locale in locales}
     
+    keys_by_path = {}
     for key, rel_path in RECIPE_PATHS.items():
-        if key not in translations:
+        if not any(key in entries for entries in translations.values()):
             print(f"⚠️  No translation found for: {key}")
             continue
         
@@ -81,31 +72,22 @@ def main():
         if not os.path.exists(filepath):
             print(f"❌ File not found: {filepath}")
             continue
-        
-        # Load recipe
-        with open(filepath, 'r', encoding='utf-8') as f:
-            recipe_data = json.load(f)
-        
-        # Handle array wrapper
-        is_array = isinstance(recipe_data, list)
-        recipe = recipe_data[0] if is_array else recipe_data
-        
-        # Inject translations
-        recipe = inject_translation(recipe, translations[key])
-        
-        # Save back
-        output_data = [recipe] if is_array else recipe
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"✅ Injected: {rel_path}")
+        keys_by_path[filepath] = key
+    
+    def inject(recipe, path, locale):
+        translation = translations[locale].get(keys_by_path[str(path)])
+        return bool(translation) and inject_locale(recipe, translation, locale, fields=TEXT_FIELDS)
+    
+    result = process_corpus(keys_by_path, inject, locales)
+    for filepath in result["changed"]:
+        print(f"✅ Injected: {os.path.relpath(filepath, RECIPES_DIR)}")
     
     print("\n" + "=" * 60)
-    print("✅ Done! 5 priority recipes now have complete Spanish translations.")
+    for locale in locales:
+        print(f"✅ Done! {len(keys_by_path)} priority recipes have complete {locale} translations "
+              f"({result['counts'][locale]} files updated).")
     print("=" * 60)
 
 
 if __name__ == "__main__":
     main()
-
-
@@ -4,6 +4,8 @@ import re
 import sys
 from pathlib import Path
 
+from speech_rate import SpeechRates
+
 ROOT = Path(__file__).resolve().parent
 RECIPES_DIR = ROOT / "PerfectBrew" / "Resources" / "Recipes"
 
@@ -21,6 +23,9 @@ START_TIMER_RE = re.compile(r"\bStart (your )?timer\b", re.IGNORECASE)
 AT_TIMESTAMP_RE = re.compile(r"\bAt\s+\d(?::\d{2})?", re.IGNORECASE)  # At 1:20 / At 90
 NOTES_WAV_RE = re.compile(r"notes\.wav\b", re.IGNORECASE)
 
+# (script field, language) narrated over a step's time_seconds
+TIMED_SCRIPTS = (("audio_script", "en"), ("audio_script_es", "es"))
+
 
 from typing import Optional
 
@@ -43,7 +48,7 @@ def iter_recipe_files(limit_to_method: Optional[str] = None):
             continue
 
 
-def lint_recipe(path: Path, recipe: dict) -> list[dict]:
+def lint_recipe(path: Path, recipe: dict, rates: Optional[SpeechRates] = None) -> list[dict]:
     issues: list[dict] = []
 
     # what_to_expect
@@ -75,6 +80,16 @@ def lint_recipe(path: Path, recipe: dict) -> list[dict]:
             if not any(p in s for p in (" seconds", " second")):
                 issues.append({"file": str(path), "location": f"brewing_steps[{idx}].audio_script", "issue": "Does not start with timing phrase (e.g., 'You have X seconds ...' / 'In X seconds ...')"})
 
+        # Predicted narration length from the per-language calibrated speaking rate
+        step_time = step.get("time_seconds") or 0
+        for field, language in TIMED_SCRIPTS:
+            text = step.get(field)
+            if rates is None or not text or step_time <= 0:
+                continue
+            seconds = rates.estimate_seconds(text, language)
+            if seconds > step_time:
+                issues.append({"file": str(path), "location": f"brewing_steps[{idx}].{field}", "issue": f"Will cut off: ~{seconds:.1f}s of narration for a {step_time}s step"})
+
     return issues
 
 
@@ -84,8 +99,9 @@ def main():
         only = sys.argv[1]
 
     all_issues: list[dict] = []
+    rates = SpeechRates()
     for path, recipe in iter_recipe_files(limit_to_method=None if only == "all" else None):
-        all_issues.extend(lint_recipe(path, recipe))
+        all_issues.extend(lint_recipe(path, recipe, rates))
 
     if not all_issues:
         print("No audio_script issues found.")
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+locale_fields.py
+
+The localized field schema of a recipe, for any locale.
+
+Recipes carry their English text in plain fields and every translation in
+the same field with a _<locale> suffix (title_es, brewing_steps[i].
+audio_script_es, what_to_expect.audio_file_name_es, ...). The cleaning,
+injection and audio tools used to hard-code the Spanish names; they now ask
+this module for a locale's fields, so a new locale is one entry in LOCALES.
+
+process_corpus() walks the recipe corpus once for any number of locales:
+each file is parsed once, every locale's change is applied to the same
+parsed recipes, and the file is written once if anything changed, through
+the all-or-nothing corpus_rewriter.
+
+Usage:
+    python3 locale_fields.py            # Per-locale field coverage of the corpus
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from corpus_rewriter import rewrite_corpus
+
+ROOT = Path(__file__).resolve().parent
+RECIPES_DIR = ROOT / "PerfectBrew" / "Resources" / "Recipes"
+
+# Language of the unsuffixed fields
+SOURCE_LOCALE = "en"
+# Translated locales the tools handle; add e.g. "pt" here once its catalogs exist
+LOCALES = ["es"]
+
+# Base names of the localizable fields at each level of a recipe
+RECIPE_FIELDS = ["title", "notes", "preparation_steps"]
+STEP_FIELDS = ["instruction", "short_instruction", "audio_script", "audio_file_name"]
+WTE_FIELDS = ["description", "audio_script", "audio_file_name"]
+# Everything but the clip names, which belong to the audio tools
+TEXT_FIELDS = [field for field in RECIPE_FIELDS + STEP_FIELDS + WTE_FIELDS if field != "audio_file_name"]
+
+
+def all_locales() -> List[str]:
+    return [SOURCE_LOCALE] + LOCALES
+
+
+def localized_field(field: str, locale: str) -> str:
+    """Name of field in locale: "audio_script" -> "audio_script_es"."""
+    return field if locale == SOURCE_LOCALE else f"{field}_{locale}"
+
+
+def locale_schema(locale: str) -> Dict[str, List[str]]:
+    """Localized field names of locale at each level: 'recipe', 'step' and 'what_to_expect'."""
+    return {
+        "recipe": [localized_field(field, locale) for field in RECIPE_FIELDS],
+        "step": [localized_field(field, locale) for field in STEP_FIELDS],
+        "what_to_expect": [localized_field(field, locale) for field in WTE_FIELDS],
+    }
+
+
+def audio_fields() -> List[Tuple[str, str, str]]:
+    """(script field, file name field, locale) for every locale, English first."""
+    return [(localized_field("audio_script", locale), localized_field("audio_file_name", locale), locale)
+            for locale in all_locales()]
+
+
+def _sections(recipe: Dict[str, Any]) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    yield "recipe", recipe
+    for step in recipe.get("brewing_steps") or []:
+        yield "step", step
+    if isinstance(recipe.get("what_to_expect"), dict):
+        yield "what_to_expect", recipe["what_to_expect"]
+
+
+def has_locale(recipe: Dict[str, Any], locale: str) -> bool:
+    """Whether any field of locale is present anywhere in recipe."""
+    schema = locale_schema(locale)
+    return any(field in section for level, section in _sections(recipe) for field in schema[level])
+
+
+def strip_locale(recipe: Dict[str, Any], locale: str) -> bool:
+    """Remove every field of locale from recipe. Returns True if anything was removed."""
+    if locale == SOURCE_LOCALE:
+        raise ValueError("Refusing to strip the source language")
+    schema = locale_schema(locale)
+    modified = False
+    for level, section in _sections(recipe):
+        for field in schema[level]:
+            if field in section:
+                del section[field]
+                modified = True
+    return modified
+
+
+def inject_locale(recipe: Dict[str, Any], translation: Dict[str, Any], locale: str,
+                  fields: Optional[Iterable[str]] = None, create_what_to_expect: bool = False) -> bool:
+    """
+    Copy locale's fields from a translation entry into recipe.
+
+    Args:
+        recipe: Recipe dict, modified in place
+        translation: Catalog-shaped entry: top-level <field>_<locale>,
+            brewing_steps[i] and what_to_expect dicts with step fields
+        locale: Locale of the translation
+        fields: Base field names to copy (default: the whole schema)
+        create_what_to_expect: Add a what_to_expect to recipes without one
+
+    Returns:
+        True if any field was written
+    """
+    allowed = set(fields) if fields is not None else None
+
+    def copy(target: Dict[str, Any], source: Dict[str, Any], names: List[str]) -> bool:
+        copied = False
+        for name in names:
+            field = localized_field(name, locale)
+            if field in source and (allowed is None or name in allowed):
+                target[field] = source[field]
+                copied = True
+        return copied
+
+    modified = copy(recipe, translation, RECIPE_FIELDS)
+
+    if "brewing_steps" in translation and "brewing_steps" in recipe:
+        for step, step_trans in zip(recipe["brewing_steps"], translation["brewing_steps"]):
+            modified = copy(step, step_trans, STEP_FIELDS) or modified
+
+    if isinstance(translation.get("what_to_expect"), dict):
+        if "what_to_expect" not in recipe and create_what_to_expect:
+            recipe["what_to_expect"] = {"description": ""}
+        if isinstance(recipe.get("what_to_expect"), dict):
+            modified = copy(recipe["what_to_expect"], translation["what_to_expect"], WTE_FIELDS) or modified
+
+    return modified
+
+
+def find_recipe_files(recipes_dir: Path = RECIPES_DIR) -> List[Path]:
+    return sorted(Path(recipes_dir).rglob("*.json"))
+
+
+def recipes_in(data: Any) -> List[Dict[str, Any]]:
+    """The recipe dicts of a recipe file (an object or an array of them)."""
+    return [recipe for recipe in (data if isinstance(data, list) else [data]) if isinstance(recipe, dict)]
+
+
+def process_corpus(paths: Iterable[Path], apply: Callable[[Dict[str, Any], Path, str], bool],
+                   locales: Iterable[str], dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Apply a per-locale change to every recipe, parsing and writing each file once.
+
+    Files are processed in parallel and committed all-or-nothing by
+    corpus_rewriter.rewrite_corpus, which raises RewriteError if any fails.
+
+    Args:
+        paths: Recipe files
+        apply: apply(recipe, path, locale) -> True if it changed the recipe
+        locales: Locales to run apply for, in order, on the same parsed recipes
+        dry_run: Report changes without writing
+
+    Returns:
+        Dict with 'changed' (paths written or that would be) and 'counts'
+        (locale -> number of changed files it touched)
+    """
+    locales = list(locales)
+
+    def transform(data: Any, path: Path) -> List[str]:
+        # Every recipe gets every locale: no short-circuiting
+        return [locale for locale in locales if any([apply(recipe, path, locale) for recipe in recipes_in(data)])]
+
+    records = rewrite_corpus(paths, transform, dry_run=dry_run)
+    result: Dict[str, Any] = {"changed": [], "counts": {locale: 0 for locale in locales}}
+    for record in records:
+        if record["changed"]:
+            result["changed"].append(record["path"])
+            for locale in record["info"]:
+                result["counts"][locale] += 1
+    return result
+
+
+def main():
+    print("🌐 LOCALE FIELD COVERAGE")
+    print("=" * 60)
+    recipes = []
+    for path in find_recipe_files():
+        with path.open("r", encoding="utf-8") as f:
+            recipes.extend(recipes_in(json.load(f)))
+
+    for locale in LOCALES:
+        schema = locale_schema(locale)
+        present = {(level, field): 0 for level, fields in schema.items() for field in fields}
+        for recipe in recipes:
+            for level, section in _sections(recipe):
+                for field in schema[level]:
+                    if section.get(field):
+                        present[(level, field)] += 1
+        with_locale = sum(1 for recipe in recipes if has_locale(recipe, locale))
+        print(f"\n{locale}: {with_locale}/{len(recipes)} recipes")
+        for (level, field), count in present.items():
+            print(f"  {level}.{field}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,34 +2,40 @@
 """
 migrate_spanish_translations.py
 
-Injects Spanish translations from recipes_es.json into individual recipe JSON files.
-This script reads translations and updates recipe files with _es fields.
+Injects translations from recipes_<locale>.json into individual recipe JSON files.
+This script reads translations and updates recipe files with _<locale> fields.
+Several locales are migrated in one pass over the recipes (see locale_fields.py).
 
 Usage:
-    python3 migrate_spanish_translations.py [--dry-run]
+    python3 migrate_spanish_translations.py [--dry-run] [--locale es --locale pt]
     
 Options:
     --dry-run   Preview changes without modifying files
+    --locale    Locale to migrate, repeatable (default: es)
 """
 
+import argparse
 import json
 import os
 import sys
-import re
 from pathlib import Path
 
+from locale_fields import LOCALES, inject_locale, process_corpus
+
 # Paths
-TRANSLATIONS_FILE = "PerfectBrew/Resources/Translations/recipes_es.json"
+TRANSLATIONS_DIR = "PerfectBrew/Resources/Translations"
+TRANSLATIONS_FILE = os.path.join(TRANSLATIONS_DIR, "recipes_es.json")
 RECIPES_DIR = "PerfectBrew/Resources/Recipes"
 
 
-def load_translations():
-    """Load Spanish translations from the master file."""
-    if not os.path.exists(TRANSLATIONS_FILE):
-        print(f"❌ Translations file not found: {TRANSLATIONS_FILE}")
+def load_translations(locale="es"):
+    """Load a locale's translations from its master file."""
+    translations_file = os.path.join(TRANSLATIONS_DIR, f"recipes_{locale}.json")
+    if not os.path.exists(translations_file):
+        print(f"❌ Translations file not found: {translations_file}")
         return {}
     
-    with open(TRANSLATIONS_FILE, 'r', encoding='utf-8') as f:
+    with open(translations_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
     return data.get("translations", {})
@@ -55,127 +61,74 @@ def find_all_recipes(base_dir):
     return recipes
 
 
-def inject_single_recipe(recipe, translation):
+def inject_single_recipe(recipe, translation, locale="es"):
     """
-    Inject Spanish translation into a single recipe dict.
+    Inject a locale's translation into a single recipe dict.
     Returns True if any modification was made.
     """
-    modified = False
-    
-    # Title
-    if "title_es" in translation:
-        recipe["title_es"] = translation["title_es"]
-        modified = True
-    
-    # Notes
-    if "notes_es" in translation:
-        recipe["notes_es"] = translation["notes_es"]
-        modified = True
-    
-    # Preparation steps
-    if "preparation_steps_es" in translation:
-        recipe["preparation_steps_es"] = translation["preparation_steps_es"]
-        modified = True
-    
-    # Brewing steps
-    if "brewing_steps" in translation and "brewing_steps" in recipe:
-        for i, step_trans in enumerate(translation["brewing_steps"]):
-            if i < len(recipe["brewing_steps"]):
-                step = recipe["brewing_steps"][i]
-                if "instruction_es" in step_trans:
-                    step["instruction_es"] = step_trans["instruction_es"]
-                    modified = True
-                if "short_instruction_es" in step_trans:
-                    step["short_instruction_es"] = step_trans["short_instruction_es"]
-                    modified = True
-                if "audio_script_es" in step_trans:
-                    step["audio_script_es"] = step_trans["audio_script_es"]
-                    modified = True
-                if "audio_file_name_es" in step_trans:
-                    step["audio_file_name_es"] = step_trans["audio_file_name_es"]
-                    modified = True
-    
-    # What to expect
-    if "what_to_expect" in translation and "what_to_expect" in recipe:
-        wte = translation["what_to_expect"]
-        if "description_es" in wte:
-            recipe["what_to_expect"]["description_es"] = wte["description_es"]
-            modified = True
-        if "audio_script_es" in wte:
-            recipe["what_to_expect"]["audio_script_es"] = wte["audio_script_es"]
-            modified = True
-        if "audio_file_name_es" in wte:
-            recipe["what_to_expect"]["audio_file_name_es"] = wte["audio_file_name_es"]
-            modified = True
-    
-    return modified
+    return inject_locale(recipe, translation, locale)
 
 
-def inject_translation(recipe_path, translation, dry_run=False):
+def inject_translation(recipe_path, translation, dry_run=False, locale="es"):
     """
-    Inject Spanish translation into a recipe JSON file.
+    Inject a locale's translation into a recipe JSON file.
     Handles both single recipe objects and arrays of recipes.
     """
-    with open(recipe_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    modified = False
-    
-    # Handle array of recipes (most common case)
-    if isinstance(data, list):
-        for recipe in data:
-            if inject_single_recipe(recipe, translation):
-                modified = True
-    # Handle single recipe object
-    elif isinstance(data, dict):
-        if inject_single_recipe(data, translation):
-            modified = True
+    result = process_corpus([recipe_path], lambda recipe, path, loc: inject_single_recipe(recipe, translation, loc),
+                            [locale], dry_run)
+    modified = bool(result["changed"])
     
     if modified:
         if dry_run:
             print(f"  [DRY RUN] Would update: {recipe_path}")
         else:
-            with open(recipe_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
             print(f"  ✅ Updated: {recipe_path}")
     
     return modified
 
 
 def main():
-    dry_run = "--dry-run" in sys.argv
+    parser = argparse.ArgumentParser(description='Migrate master-file translations into recipe files')
+    parser.add_argument('--dry-run', action='store_true', help='Preview changes without modifying files')
+    parser.add_argument('--locale', '-l', action='append', choices=LOCALES,
+                        help='Locale to migrate, repeatable (default: es)')
+    args = parser.parse_args()
+    dry_run = args.dry_run
+    locales = args.locale or ["es"]
     
     print("=" * 60)
-    print("Spanish Translation Migration Script")
+    print("Translation Migration Script")
     print("=" * 60)
     
     if dry_run:
         print("⚠️  DRY RUN MODE - No files will be modified")
     
     # Load translations
-    translations = load_translations()
-    if not translations:
+    translations = {locale: load_translations(locale) for locale in locales}
+    if not any(translations.values()):
         print("❌ No translations found. Exiting.")
         return 1
     
-    print(f"📚 Loaded {len(translations)} translation entries")
+    for locale in locales:
+        print(f"📚 Loaded {len(translations[locale])} {locale} translation entries")
     
     # Find all recipes
     recipes = find_all_recipes(RECIPES_DIR)
     print(f"📂 Found {len(recipes)} recipe files")
     
-    # Process each recipe
-    updated_count = 0
-    for recipe_path in recipes:
-        key = get_recipe_key(recipe_path)
-        
-        if key in translations:
-            print(f"\n🔄 Processing: {key}")
-            if inject_translation(recipe_path, translations[key], dry_run):
-                updated_count += 1
+    # Process every locale in one pass: each recipe is parsed and written once
+    def inject(recipe, path, locale):
+        translation = translations[locale].get(get_recipe_key(path))
+        return bool(translation) and inject_single_recipe(recipe, translation, locale)
+    
+    result = process_corpus(recipes, inject, locales, dry_run)
+    for recipe_path in result["changed"]:
+        print(f"  {'[DRY RUN] Would update' if dry_run else '✅ Updated'}: {recipe_path}")
     
     print("\n" + "=" * 60)
-    print(f"✅ Migration complete: {updated_count} recipes {'would be ' if dry_run else ''}updated")
+    print(f"✅ Migration complete: {len(result['changed'])} recipes {'would be ' if dry_run else ''}updated")
+    for locale in locales:
+        print(f"   {locale}: {result['counts'][locale]} recipes")
     print("=" * 60)
     
     return 0
@@ -1,5 +1,7 @@
 #!/bin/bash
 # Monitor audio generation and continue with next method when done
+# Extra arguments are passed through, e.g. --changed-only to only rebuild edited steps
+# or --resume to pick up a run that crashed or was killed
 
 METHODS=("AeroPress" "V60" "FrenchPress")
 BASE_DIR="/Users/home/Documents/Programando/PerfectBrew"
@@ -11,7 +13,7 @@ for method in "${METHODS[@]}"; do
     
     # Run the generation
     cd "$BASE_DIR" || exit 1
-    python3 generate_spanish_audio_batch.py --method "$method"
+    python3 generate_spanish_audio_batch.py --method "$method" "$@"
     
     EXIT_CODE=$?
     
@@ -54,3 +56,6 @@ echo "🎉 ALL METHODS COMPLETE!"
 echo "=" | awk '{printf "%.0s=", 1..60}'
 
 
+
+# What is still missing, stale or not linked from the recipe JSON, per recipe
+python3 audio_parity.py --only-problems
@@ -1,71 +1,143 @@
 #!/usr/bin/env python3
 """
 Quick Audio Generator - Creates placeholder audio files for testing
+
+Draft mode renders every recipe in the corpus in seconds with clips whose
+length is estimated from each script's word count, so timer/audio sync can
+be checked in the app right after a recipe edit. Final renders come from
+universal_audio_generator.py with the chatterbox backend; drafts never
+enter the TTS output cache, and the build manifest sees them as a different
+backend, so the next final render replaces them.
+
+Drafts go to .audio_drafts/ (same Method/recipe layout, with its own
+manifest and journal) so a casual run never overwrites the narration that
+ships in PerfectBrew/Resources/Audio. Pass --in-place to draft straight into
+the bundle, e.g. to check sync in the app before a final render exists.
+
+Usage:
+    python3 quick_audio_generator.py                      # Tone clips, EN + ES, all recipes
+    python3 quick_audio_generator.py --style silent       # Pure silence
+    python3 quick_audio_generator.py --style pyttsx3      # Robot voice drafts
+    python3 quick_audio_generator.py --method V60 --language es --changed-only
+    python3 quick_audio_generator.py --in-place           # Overwrite the bundle's clips
 """
 
+import argparse
 import json
-import os
+import sys
+import time
 import wave
-import struct
+
+import numpy as np
+
+from generate_spanish_audio_batch import AUDIO_DIR, BASE_DIR, find_all_recipe_files, get_audio_output_dir
+from locale_fields import SOURCE_LOCALE, all_locales, localized_field
+from tts_backends import estimate_duration
+from universal_audio_generator import UniversalAudioGenerator
+
+DRAFT_STYLES = ['tone', 'silent', 'pyttsx3']
+# Where drafts go unless --in-place
+DRAFT_DIR = BASE_DIR / ".audio_drafts"
+
 
 def create_silent_audio(duration_seconds=3, sample_rate=44100, filename="silent.wav"):
     """Create a silent audio file for testing."""
     # Calculate number of frames
     num_frames = int(duration_seconds * sample_rate)
-    
-    # Create silent audio data (16-bit PCM)
-    audio_data = [0] * num_frames
-    
-    # Convert to bytes
-    audio_bytes = struct.pack('<' + 'h' * num_frames, *audio_data)
-    
-    # Write WAV file
+
+    # Write WAV file straight from a zeroed 16-bit PCM buffer
     with wave.open(filename, 'wb') as wav_file:
         wav_file.setnchannels(1)  # Mono
         wav_file.setsampwidth(2)  # 16-bit
         wav_file.setframerate(sample_rate)
-        wav_file.writeframes(audio_bytes)
+        wav_file.writeframes(np.zeros(num_frames, dtype='<i2').tobytes())
+
+
+def generate_draft_audio(style: str, languages, method=None, recipe_filter=None,
+                         changed_only: bool = False, dry_run: bool = False, in_place: bool = False) -> bool:
+    """Render draft clips for every recipe matching the filters, into DRAFT_DIR unless in_place."""
+    audio_dir = AUDIO_DIR if in_place else DRAFT_DIR / "Audio"
+    # A draft run elsewhere must not record its clips in the bundle's manifest
+    build_paths = {} if in_place else {'manifest_path': str(DRAFT_DIR / "manifest.json"),
+                                       'journal_path': str(DRAFT_DIR / "journal.json")}
+    recipe_files = find_all_recipe_files()
+    if method:
+        recipe_files = [f for f in recipe_files if method in f.parts]
+
+    all_ok = True
+    for language in languages:
+        generator = None if dry_run else UniversalAudioGenerator(
+            language=language, backend=style, cache_dir=None, changed_only=changed_only, **build_paths)
+        clip_count = 0
+        total_seconds = 0.0
+
+        for recipe_file in sorted(recipe_files):
+            with open(recipe_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            recipes = data if isinstance(data, list) else [data]
 
-def generate_quick_audio():
-    """Generate quick placeholder audio files for 2021 Tuomas recipe."""
-    print("🚀 Quick Audio Generator for 2021 Tuomas Recipe")
+            for recipe_index, recipe in enumerate(recipes):
+                title = recipe.get('title', 'Unknown')
+                if recipe_filter and recipe_filter.lower() not in title.lower():
+                    continue
+
+                # Translations fall back to English, as in UniversalAudioGenerator
+                scripts = [(language != SOURCE_LOCALE and s.get(localized_field('audio_script', language)))
+                           or s.get('audio_script', '')
+                           for s in recipe.get('brewing_steps', [])]
+                clip_count += sum(1 for s in scripts if s)
+                total_seconds += sum(estimate_duration(s) for s in scripts if s)
+
+                if dry_run:
+                    print(f"🔍 {language.upper()} {title}: {sum(1 for s in scripts if s)} clips")
+                    continue
+
+                output_dir = get_audio_output_dir(recipe_file, recipe, audio_dir)
+                output_dir.mkdir(parents=True, exist_ok=True)
+                ok = generator.generate_recipe_audio(
+                    recipe=recipe,
+                    output_dir=str(output_dir),
+                    include_preparation=False,
+                    recipe_ref=f"{recipe_file.relative_to(BASE_DIR)}[{recipe_index}]"
+                )
+                all_ok = all_ok and ok
+
+        print(f"📊 {language.upper()}: {clip_count} draft clips, {total_seconds / 60:.1f} min of audio")
+
+    return all_ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Draft placeholder audio for all PerfectBrew recipes')
+    parser.add_argument('--style', default='tone', choices=DRAFT_STYLES,
+                        help='tone: beeps marking start/end, silent: silence, pyttsx3: system voice (default: tone)')
+    parser.add_argument('--language', '-l', default='all', choices=all_locales() + ['all'],
+                        help='Audio language (default: all)')
+    parser.add_argument('--method', choices=['AeroPress', 'V60', 'French_Press', 'Chemex'],
+                        help='Only this brewing method')
+    parser.add_argument('--recipe', help='Filter by recipe title (partial match)')
+    parser.add_argument('--changed-only', action='store_true',
+                        help='Only redraft steps whose script changed since the last run')
+    parser.add_argument('--dry-run', action='store_true', help='List clips without writing them')
+    parser.add_argument('--in-place', action='store_true',
+                        help=f'Overwrite the clips in PerfectBrew/Resources/Audio instead of drafting into {DRAFT_DIR.name}/')
+
+    args = parser.parse_args()
+    languages = all_locales() if args.language == 'all' else [args.language]
+
+    print(f"🚀 Quick Audio Generator ({args.style} drafts)")
     print("=" * 50)
-    
-    # Load recipe
-    recipe_file = "PerfectBrew/Resources/Recipes/AeroPress/World_Champions/2021_Tuomas_Merikanto_Finland/AeroPress_2021_Tuomas_Merikanto_single_serve.json"
-    
-    with open(recipe_file, 'r') as f:
-        recipe = json.load(f)
-    
-    if isinstance(recipe, list):
-        recipe = recipe[0]
-    
-    title = recipe.get('title', 'Unknown Recipe')
-    print(f"📝 Recipe: {title}")
-    
-    # Create output directory
-    output_dir = "PerfectBrew/Resources/Audio/AeroPress/World_Champions/2021_Tuomas_Merikanto"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Generate audio files for each brewing step
-    if 'brewing_steps' in recipe:
-        brewing_steps = recipe['brewing_steps']
-        print(f"🎬 Creating {len(brewing_steps)} audio files...")
-        
-        for i, step in enumerate(brewing_steps, 1):
-            audio_file_name = step.get('audio_file_name', f"step_{i:02d}.mp3")
-            output_path = os.path.join(output_dir, audio_file_name)
-            
-            # Create silent audio file (3 seconds)
-            create_silent_audio(3, filename=output_path)
-            
-            audio_script = step.get('audio_script', '')
-            print(f"    ✅ Created: {audio_file_name}")
-            print(f"       Script: {audio_script[:60]}...")
-    
-    print(f"🎉 Quick audio generation complete!")
-    print(f"📁 Files saved to: {output_dir}")
+    if args.in_place:
+        print("⚠️  --in-place: bundle narration will be replaced by placeholders")
+    else:
+        print(f"📂 Drafting into {DRAFT_DIR.relative_to(BASE_DIR)}/ (use --in-place to overwrite the bundle)")
+
+    start = time.time()
+    ok = generate_draft_audio(args.style, languages, method=args.method, recipe_filter=args.recipe,
+                              changed_only=args.changed_only, dry_run=args.dry_run, in_place=args.in_place)
+    print(f"🎉 Draft audio complete in {time.time() - start:.1f}s")
+    return 0 if ok else 1
 
-if __name__ == "__main__":
-    generate_quick_audio()
 
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Per-language, per-backend speaking rates fitted from generated audio.
+
+A single 2.5 words/second constant underestimates Spanish: Chatterbox reads
+audio_script_es noticeably slower than the English scripts, so steps that
+fit in English can cut off in Spanish. This tool pairs every narrated
+clip's script (recipes, via audio_dedup.collect_clips) with its measured
+duration (audio_durations.py) and fits words/second and characters/second
+for each backend and language. Translated clips are looked up under the name
+the generator writes them (<name>_es.m4a, audio_paths.clip_file_name), since
+recipes rarely link them with audio_file_name_es. The backend that rendered a clip comes from
+the audio build manifest; clips it does not know about are attributed to
+--assume-backend.
+
+The fitted coefficients go to speech_rates.json at the repo root, which is
+committed so lint_audio_scripts.py and validate_aeropress_timers.py predict
+"will cut off" for both languages without running TTS. Whichever of the two
+models fit a language better is the one used for predictions.
+
+Usage:
+    python3 speech_rate.py                         # Fit and write speech_rates.json
+    python3 speech_rate.py --dry-run               # Print the fit only
+    python3 speech_rate.py --assume-backend say    # Attribute unknown clips to say
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from audio_manifest import MANIFEST_PATH
+
+ROOT = Path(__file__).resolve().parent
+RATES_PATH = ROOT / "speech_rates.json"
+DEFAULT_BACKEND = "chatterbox"
+# Used for any language/backend with no calibration yet
+DEFAULT_WORDS_PER_SECOND = 2.5
+# Fewer clips than this give a rate too noisy to replace the default
+MIN_SAMPLES = 5
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def count_chars(text: str) -> int:
+    """Letters and digits only: spacing and punctuation are not spoken."""
+    return len(re.sub(r'[\W_]', '', text))
+
+
+def _fit_rate(units: List[int], seconds: List[float]) -> Dict[str, float]:
+    """Units per second over all clips, and the 90th percentile relative error of it."""
+    rate = sum(units) / sum(seconds)
+    errors = sorted(abs(u / rate - s) / s for u, s in zip(units, seconds))
+    return {"rate": round(rate, 3), "p90_error": round(errors[int(0.9 * (len(errors) - 1))], 3)}
+
+
+def fit_rates(samples: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Fit speaking rates from measured clips.
+
+    Args:
+        samples: Dicts with 'backend', 'language', 'script' and 'duration'
+
+    Returns:
+        backend -> language -> {samples, words_per_second, chars_per_second,
+        words_p90_error, chars_p90_error, model}
+    """
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for sample in samples:
+        if sample['duration'] and count_words(sample['script']):
+            groups.setdefault((sample['backend'], sample['language']), []).append(sample)
+
+    rates: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for (backend, language), group in sorted(groups.items()):
+        if len(group) < MIN_SAMPLES:
+            continue
+        seconds = [sample['duration'] for sample in group]
+        words = _fit_rate([count_words(sample['script']) for sample in group], seconds)
+        chars = _fit_rate([count_chars(sample['script']) for sample in group], seconds)
+        rates.setdefault(backend, {})[language] = {
+            "samples": len(group),
+            "words_per_second": words["rate"],
+            "words_p90_error": words["p90_error"],
+            "chars_per_second": chars["rate"],
+            "chars_p90_error": chars["p90_error"],
+            "model": "chars" if chars["p90_error"] < words["p90_error"] else "words",
+        }
+    return rates
+
+
+class SpeechRates:
+    def __init__(self, path: Path = RATES_PATH):
+        """
+        Load calibrated rates (none if the file does not exist yet).
+
+        Args:
+            path: Location of speech_rates.json
+        """
+        self.rates: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        if Path(path).exists():
+            with Path(path).open("r", encoding="utf-8") as f:
+                self.rates = json.load(f).get("rates", {})
+
+    def calibration(self, language: str, backend: str = DEFAULT_BACKEND) -> Optional[Dict[str, Any]]:
+        """Fitted coefficients for language on backend, if any."""
+        return self.rates.get(backend, {}).get(language)
+
+    def words_per_second(self, language: str, backend: str = DEFAULT_BACKEND) -> float:
+        calibration = self.calibration(language, backend)
+        return calibration["words_per_second"] if calibration else DEFAULT_WORDS_PER_SECOND
+
+    def estimate_seconds(self, text: str, language: str, backend: str = DEFAULT_BACKEND) -> float:
+        """Predicted narration length of text, from the better-fitting model."""
+        calibration = self.calibration(language, backend)
+        if calibration and calibration["model"] == "chars":
+            return count_chars(text) / calibration["chars_per_second"]
+        return count_words(text) / self.words_per_second(language, backend)
+
+
+def collect_samples(assume_backend: str) -> List[Dict[str, Any]]:
+    """Every narrated clip on disk with its script, language, backend and measured duration."""
+    # Imported here: these scan the audio tree, which the validators only need via SpeechRates
+    from audio_dedup import collect_clips
+    from audio_durations import refresh_durations
+
+    durations = refresh_durations()
+    backends = {}
+    if MANIFEST_PATH.exists():
+        with MANIFEST_PATH.open("r", encoding="utf-8") as f:
+            for entry in json.load(f).get("entries", {}).values():
+                if entry.get("backend"):
+                    backends[entry["output_path"]] = entry["backend"]
+
+    samples = []
+    for clip in collect_clips(include_unlinked=True):
+        if clip['path'] is None:
+            continue
+        key = str(clip['path'].relative_to(ROOT))
+        samples.append({
+            'backend': backends.get(key, assume_backend),
+            'language': clip['language'],
+            'script': clip['script'],
+            'duration': durations.get(key, {}).get("duration"),
+        })
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fit per-language speaking rates from measured clips')
+    parser.add_argument('--assume-backend', default=DEFAULT_BACKEND,
+                        help=f'Backend for clips the manifest does not know (default: {DEFAULT_BACKEND})')
+    parser.add_argument('--output', default=str(RATES_PATH), help='Where to write the coefficients')
+    parser.add_argument('--dry-run', action='store_true', help='Print the fit without writing it')
+
+    args = parser.parse_args()
+
+    print("📏 Fitting speaking rates from measured clips...")
+    samples = collect_samples(args.assume_backend)
+    rates = fit_rates(samples)
+    print(f"   {len(samples)} clips with audio on disk")
+
+    if not rates:
+        print(f"❌ No backend/language has {MIN_SAMPLES}+ measured clips")
+        return 1
+
+    for backend, languages in sorted(rates.items()):
+        for language, fit in sorted(languages.items()):
+            print(f"  {backend}/{language}: {fit['samples']} clips, "
+                  f"{fit['words_per_second']:.2f} words/s (±{fit['words_p90_error']:.0%}), "
+                  f"{fit['chars_per_second']:.1f} chars/s (±{fit['chars_p90_error']:.0%}) "
+                  f"→ {fit['model']}")
+
+    if args.dry_run:
+        return 0
+
+    output = Path(args.output)
+    temp_path = output.with_suffix('.json.tmp')
+    with temp_path.open('w', encoding='utf-8') as f:
+        json.dump({"rates": rates}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(temp_path, output)
+    print(f"✅ Wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
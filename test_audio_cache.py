@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Regression tests for audio_cache: cache keys and hard-link reuse.
+
+Runs under pytest or directly: python3 test_audio_cache.py
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+from audio_cache import AudioCache, cache_key
+
+SETTINGS = {"bitrate": "128k", "channels": 2, "sample_rate": 44100}
+
+
+def test_cache_key_covers_every_input():
+    key = cache_key("Pour 200g", "en", "chatterbox", "default", SETTINGS)
+    assert key == cache_key("Pour 200g", "en", "chatterbox", "default", dict(reversed(list(SETTINGS.items()))))
+    assert key != cache_key("Pour 250g", "en", "chatterbox", "default", SETTINGS)
+    assert key != cache_key("Pour 200g", "es", "chatterbox", "default", SETTINGS)
+    assert key != cache_key("Pour 200g", "en", "say", "default", SETTINGS)
+    assert key != cache_key("Pour 200g", "en", "chatterbox", "reference_spanish_best.wav", SETTINGS)
+    assert key != cache_key("Pour 200g", "en", "chatterbox", "default", dict(SETTINGS, channels=1))
+
+
+def test_restore_hard_links_the_stored_clip():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = AudioCache(Path(tmp) / "cache")
+        key = cache_key("Stir gently", "en", "tone", "default", SETTINGS)
+        source = Path(tmp) / "step_01.m4a"
+        source.write_bytes(b"m4a bytes")
+
+        assert not cache.restore(key, str(Path(tmp) / "out" / "step_01.m4a"))
+        cache.store(key, str(source))
+        output = Path(tmp) / "out" / "step_01.m4a"
+        assert cache.restore(key, str(output))
+        assert output.read_bytes() == b"m4a bytes"
+        assert os.path.samefile(output, cache.lookup(key))
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.stats()["entries"] == 1
+
+
+def test_restore_never_writes_through_an_existing_link():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = AudioCache(Path(tmp) / "cache")
+        first, second = (cache_key(text, "en", "tone", "default", SETTINGS) for text in ("Wait", "Press"))
+        for key, data in ((first, b"wait"), (second, b"press")):
+            source = Path(tmp) / f"{key}.m4a"
+            source.write_bytes(data)
+            cache.store(key, str(source))
+
+        output = Path(tmp) / "step.m4a"
+        cache.restore(first, str(output))
+        # The output is a hard link to the first entry; replacing it must not change that entry
+        cache.restore(second, str(output))
+        assert output.read_bytes() == b"press"
+        assert cache.lookup(first).read_bytes() == b"wait"
+
+
+def test_empty_entry_is_a_miss():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = AudioCache(Path(tmp) / "cache")
+        key = cache_key("Wait", "en", "tone", "default", SETTINGS)
+        source = Path(tmp) / "empty.m4a"
+        source.touch()
+        cache.store(key, str(source))
+        assert cache.lookup(key) is None
+        assert not cache.restore(key, str(Path(tmp) / "out.m4a"))
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"🎉 {len(tests)} tests passed")
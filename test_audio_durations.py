@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Regression tests for audio_durations: reading clip lengths from file headers.
+
+Runs under pytest or directly: python3 test_audio_durations.py
+"""
+
+import struct
+import tempfile
+import wave
+from pathlib import Path
+
+from audio_durations import probe_duration
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _mvhd(timescale: int, duration: int, version: int = 0) -> bytes:
+    if version == 1:
+        times = struct.pack(">QQIQ", 0, 0, timescale, duration)
+    else:
+        times = struct.pack(">IIII", 0, 0, timescale, duration)
+    # The rest of mvhd (rate, volume, matrix, next track id) is never read
+    return _box(b"mvhd", bytes([version, 0, 0, 0]) + times + bytes(80))
+
+
+def _m4a(path: Path, moov: bytes, mdat_size: int = 4096, moov_first: bool = False) -> Path:
+    boxes = [_box(b"ftyp", b"M4A \x00\x00\x00\x00"), _box(b"mdat", bytes(mdat_size)), moov]
+    if moov_first:
+        boxes = [boxes[0], boxes[2], boxes[1]]
+    path.write_bytes(b"".join(boxes))
+    return path
+
+
+def test_mvhd_version_0():
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = _m4a(Path(tmp) / "step_01.m4a", _box(b"moov", _mvhd(44100, 44100 * 7 + 22050)))
+        assert probe_duration(clip) == 7.5
+
+
+def test_mvhd_version_1_and_faststart_layout():
+    with tempfile.TemporaryDirectory() as tmp:
+        moov = _box(b"moov", _box(b"udta", b"") + _mvhd(1000, 12480, version=1))
+        clip = _m4a(Path(tmp) / "step_01.m4a", moov, moov_first=True)
+        assert probe_duration(clip) == 12.48
+
+
+def test_64_bit_mdat_size():
+    with tempfile.TemporaryDirectory() as tmp:
+        payload = bytes(64)
+        mdat = struct.pack(">I4sQ", 1, b"mdat", 16 + len(payload)) + payload
+        clip = Path(tmp) / "step_01.m4a"
+        clip.write_bytes(_box(b"ftyp", b"M4A ") + mdat + _box(b"moov", _mvhd(600, 1800)))
+        assert probe_duration(clip) == 3.0
+
+
+def test_unreadable_files_have_no_duration():
+    with tempfile.TemporaryDirectory() as tmp:
+        no_moov = Path(tmp) / "no_moov.m4a"
+        no_moov.write_bytes(_box(b"ftyp", b"M4A ") + _box(b"mdat", bytes(16)))
+        truncated = Path(tmp) / "truncated.m4a"
+        truncated.write_bytes(_box(b"ftyp", b"M4A ") + _box(b"moov", _mvhd(1000, 5000))[:20])
+        zero_timescale = _m4a(Path(tmp) / "zero.m4a", _box(b"moov", _mvhd(0, 5000)))
+        assert probe_duration(no_moov) is None
+        assert probe_duration(truncated) is None
+        assert probe_duration(zero_timescale) is None
+        assert probe_duration(Path(tmp) / "missing.m4a") is None
+
+
+def test_wav_duration():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "notes.wav"
+        with wave.open(str(path), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(22050)
+            wav_file.writeframes(bytes(2 * 22050 * 2))
+        assert probe_duration(path) == 2.0
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"🎉 {len(tests)} tests passed")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Regression tests for audio_journal.AudioJournal, which drives --resume.
+
+Runs under pytest or directly: python3 test_audio_journal.py
+"""
+
+import tempfile
+from pathlib import Path
+
+from audio_journal import AudioJournal
+
+
+def test_resume_skips_only_intact_finished_clips():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal_path = Path(tmp) / "journal.jsonl"
+        done, failed = Path(tmp) / "step_01.m4a", Path(tmp) / "step_02.m4a"
+        done.write_bytes(b"clip one")
+        failed.write_bytes(b"partial")
+        journal = AudioJournal(journal_path)
+        journal.record_success(str(done), "key1")
+        journal.record_failure(str(failed), "key2", attempts=3)
+
+        # A later run reads the journal back from disk
+        resumed = AudioJournal(journal_path)
+        assert resumed.is_complete(str(done), "key1")
+        assert not resumed.is_complete(str(failed), "key2")
+        # The script changed since the clip was written
+        assert not resumed.is_complete(str(done), "key1-edited")
+
+
+def test_damaged_clip_is_not_complete():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal_path = Path(tmp) / "journal.jsonl"
+        clip = Path(tmp) / "step_01.m4a"
+        clip.write_bytes(b"clip one")
+        AudioJournal(journal_path).record_success(str(clip), "key1")
+
+        clip.write_bytes(b"clip 1!!")  # Same size, different bytes
+        assert not AudioJournal(journal_path).is_complete(str(clip), "key1")
+        clip.unlink()
+        assert not AudioJournal(journal_path).is_complete(str(clip), "key1")
+
+
+def test_torn_last_line_is_ignored():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal_path = Path(tmp) / "journal.jsonl"
+        clip = Path(tmp) / "step_01.m4a"
+        clip.write_bytes(b"clip one")
+        AudioJournal(journal_path).record_success(str(clip), "key1")
+        with journal_path.open("a", encoding="utf-8") as f:
+            f.write('{"output_path": "step_02.m4a", "sta')
+
+        resumed = AudioJournal(journal_path)
+        assert resumed.lines == 1
+        assert resumed.is_complete(str(clip), "key1")
+
+
+def test_latest_record_wins_and_compact_keeps_it():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal_path = Path(tmp) / "journal.jsonl"
+        clip = Path(tmp) / "step_01.m4a"
+        journal = AudioJournal(journal_path)
+        journal.record_failure(str(clip), "key1")
+        clip.write_bytes(b"clip one")
+        journal.record_success(str(clip), "key1", attempts=2)
+        journal.compact()
+
+        resumed = AudioJournal(journal_path)
+        assert resumed.lines == 1
+        assert resumed.is_complete(str(clip), "key1")
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"🎉 {len(tests)} tests passed")
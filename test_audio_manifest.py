@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Regression tests for audio_manifest.AudioManifest.plan, which drives --changed-only.
+
+Runs under pytest or directly: python3 test_audio_manifest.py
+"""
+
+import tempfile
+from pathlib import Path
+
+from audio_manifest import AudioManifest, clean_script, entry_key, scope_of, script_hash
+
+REF = "PerfectBrew/Resources/Recipes/V60/Test/test.json[0]"
+
+
+def _entry(directory: Path, script: str, name: str) -> dict:
+    return {"key": script_hash(clean_script(script)), "output_path": str(directory / name)}
+
+
+def _manifest(directory: Path, entries: dict) -> AudioManifest:
+    manifest = AudioManifest(directory / "manifest.json")
+    for key, entry in entries.items():
+        manifest.record(key, entry)
+    manifest.save()
+    # Reload so the plan runs against what a later build would read
+    return AudioManifest(directory / "manifest.json")
+
+
+def test_changed_only_plan():
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for name in ("step_01.m4a", "step_02.m4a", "step_03.m4a", "step_04.m4a"):
+            (directory / name).write_bytes(b"m4a")
+        step = {number: entry_key(REF, number, "en") for number in range(1, 6)}
+        manifest = _manifest(directory, {
+            step[1]: _entry(directory, "Wait 30 seconds.", "step_01.m4a"),
+            step[2]: _entry(directory, "Pour to 100g.", "step_02.m4a"),
+            step[3]: _entry(directory, "Stir gently.", "step_03.m4a"),
+            step[4]: _entry(directory, "Press slowly.", "step_04.m4a"),
+        })
+        current = {
+            step[1]: _entry(directory, "Wait 30 seconds.", "step_01.m4a"),     # untouched
+            step[2]: _entry(directory, "Pour to 120g.", "step_02.m4a"),        # script edited
+            step[3]: _entry(directory, "Stir gently.", "step_03_stir.m4a"),    # renamed clip
+            step[5]: _entry(directory, "Enjoy.", "step_05.m4a"),               # new step
+        }
+
+        plan = manifest.plan(current, {scope_of(step[1])})
+        assert plan["unchanged"] == [step[1]]
+        assert sorted(plan["regenerate"]) == sorted([step[2], step[5]])
+        assert plan["rename"] == [(step[3], str(directory / "step_03.m4a"), str(directory / "step_03_stir.m4a"))]
+        assert plan["delete"] == [(step[4], str(directory / "step_04.m4a"))]
+
+
+def test_missing_clip_is_regenerated():
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        key = entry_key(REF, 1, "es")
+        manifest = _manifest(directory, {key: _entry(directory, "Espera.", "step_01_es.m4a")})
+        plan = manifest.plan({key: _entry(directory, "Espera.", "step_01_es.m4a")}, {scope_of(key)})
+        assert plan["regenerate"] == [key]
+
+
+def test_entries_outside_the_scanned_scopes_are_kept():
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        english, spanish = entry_key(REF, 1, "en"), entry_key(REF, 1, "es")
+        manifest = _manifest(directory, {spanish: _entry(directory, "Espera.", "step_01_es.m4a")})
+        # An English-only run must not delete the Spanish clips
+        plan = manifest.plan({english: _entry(directory, "Wait.", "step_01.m4a")}, {scope_of(english)})
+        assert plan["delete"] == []
+
+
+def test_reused_output_path_is_not_deleted():
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        old, new = entry_key(REF, 2, "en"), entry_key(REF, 1, "en")
+        manifest = _manifest(directory, {old: _entry(directory, "Wait.", "step_02.m4a")})
+        # Step 1 was removed and step 2 moved up, taking over its clip path
+        plan = manifest.plan({new: _entry(directory, "Wait.", "step_02.m4a")}, {scope_of(new)})
+        assert plan["delete"] == [(old, None)]
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"🎉 {len(tests)} tests passed")
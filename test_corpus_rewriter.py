@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for corpus_rewriter: all-or-nothing commits and crash recovery.
+
+Runs under pytest or directly: python3 test_corpus_rewriter.py
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import corpus_rewriter
+from corpus_rewriter import RewriteError, _temp_path, _write_journal, recover, rewrite_corpus, serialize
+
+
+def _corpus(directory: Path, count: int = 3) -> list:
+    paths = []
+    for i in range(count):
+        path = directory / f"recipe_{i}.json"
+        path.write_bytes(serialize([{"title": f"Recipe {i}"}]))
+        paths.append(path)
+    return paths
+
+
+def _add_title_es(data, path):
+    data[0]["title_es"] = data[0]["title"].replace("Recipe", "Receta")
+    return True
+
+
+def test_rewrite_commits_every_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Path(tmp) / "journal.json"
+        paths = _corpus(Path(tmp))
+        records = rewrite_corpus(paths, _add_title_es, journal_path=journal)
+        assert all(record["changed"] for record in records)
+        assert all(json.loads(path.read_text())[0]["title_es"].startswith("Receta") for path in paths)
+        assert not journal.exists()
+        assert not list(Path(tmp).glob(".*.tmp"))
+
+
+def test_unchanged_files_are_not_rewritten():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _corpus(Path(tmp))
+        mtimes = [path.stat().st_mtime_ns for path in paths]
+        records = rewrite_corpus(paths, lambda data, path: None, journal_path=Path(tmp) / "journal.json")
+        assert not any(record["changed"] for record in records)
+        assert [path.stat().st_mtime_ns for path in paths] == mtimes
+
+
+def test_bad_file_rolls_back_the_whole_batch():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Path(tmp) / "journal.json"
+        paths = _corpus(Path(tmp))
+        paths[1].write_text("{broken", encoding="utf-8")
+        before = [path.read_bytes() for path in paths]
+        try:
+            rewrite_corpus(paths, _add_title_es, journal_path=journal)
+        except RewriteError as e:
+            assert e.failures[0][0] == paths[1]
+        else:
+            raise AssertionError("expected RewriteError")
+        assert [path.read_bytes() for path in paths] == before
+        assert not journal.exists()
+        assert not list(Path(tmp).glob(".*.tmp"))
+
+
+def test_failed_rename_restores_replaced_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Path(tmp) / "journal.json"
+        paths = _corpus(Path(tmp))
+        before = [path.read_bytes() for path in paths]
+        real_replace = os.replace
+
+        def flaky_replace(source, target):
+            # Fail the second recipe's commit rename only
+            if Path(target) == paths[1] and Path(source) == _temp_path(paths[1]):
+                raise OSError("disk full")
+            return real_replace(source, target)
+
+        with mock.patch.object(corpus_rewriter.os, "replace", flaky_replace):
+            try:
+                rewrite_corpus(paths, _add_title_es, jobs=1, journal_path=journal)
+            except RewriteError:
+                pass
+            else:
+                raise AssertionError("expected RewriteError")
+        assert [path.read_bytes() for path in paths] == before
+        assert not journal.exists()
+        assert not list(Path(tmp).glob(".*.tmp"))
+
+
+def test_recover_rolls_back_an_interrupted_staging():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Path(tmp) / "journal.json"
+        paths = _corpus(Path(tmp), 2)
+        before = [path.read_bytes() for path in paths]
+        # Crash while staging: one temp file written, renames never started
+        _temp_path(paths[0]).write_bytes(b"half-written")
+        _write_journal(journal, "staging", [(_temp_path(path), path) for path in paths])
+
+        assert recover(journal) == "rolled back"
+        assert [path.read_bytes() for path in paths] == before
+        assert not _temp_path(paths[0]).exists()
+        assert not journal.exists()
+
+
+def test_recover_rolls_forward_an_interrupted_commit():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Path(tmp) / "journal.json"
+        paths = _corpus(Path(tmp), 2)
+        new = [serialize([{"title": f"Recipe {i}", "title_es": f"Receta {i}"}]) for i in range(2)]
+        # Crash while committing: the first file was renamed, the second is still staged
+        paths[0].write_bytes(new[0])
+        _temp_path(paths[1]).write_bytes(new[1])
+        _write_journal(journal, "committing", [(_temp_path(path), path) for path in paths])
+
+        assert recover(journal) == "rolled forward"
+        assert [path.read_bytes() for path in paths] == new
+        assert not journal.exists()
+
+
+def test_next_rewrite_recovers_first():
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Path(tmp) / "journal.json"
+        paths = _corpus(Path(tmp), 1)
+        _temp_path(paths[0]).write_bytes(b"stale")
+        _write_journal(journal, "staging", [(_temp_path(paths[0]), paths[0])])
+        rewrite_corpus(paths, _add_title_es, journal_path=journal)
+        assert json.loads(paths[0].read_text())[0]["title_es"] == "Receta 0"
+        assert recover(journal) is None
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"🎉 {len(tests)} tests passed")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Regression tests for translation_engine.TranslationEngine.
+
+Runs under pytest or directly: python3 test_translation_engine.py
+"""
+
+import re
+
+from translation_engine import TranslationEngine
+
+
+def test_regex_first_rule_beats_later_literal_rule():
+    """Rules that cannot be bucketed by first character keep their author order."""
+    engine = TranslationEngine([
+        (r"\bPour slowly", "Vierte lentamente"),
+        (r"(\d+)g coffee", r"\1g de café"),
+        ("Pour", "B"),
+        ("1", "one"),
+        ("coffee", "café"),
+    ])
+    assert engine.translate("Pour slowly") == "Vierte lentamente"
+    assert engine.translate("15g coffee") == "15g de café"
+    # The later plain rules still apply where the earlier ones do not match
+    assert engine.translate("Pour 1 coffee") == "B one café"
+
+
+def test_optional_first_character_rule_keeps_order():
+    engine = TranslationEngine([(r"x?Stir", "Revuelve"), ("S", "?")])
+    assert engine.translate("Stir") == "Revuelve"
+    assert engine.translate("xStir") == "Revuelve"
+
+
+def test_regex_rules_in_author_order_within_bucket():
+    engine = TranslationEngine([
+        (r"Press (\d+)s", r"Presiona \1s"),
+        (r"Press", "Presiona"),
+    ], ignore_case=True)
+    assert engine.translate("press 30s now") == "Presiona 30s now"
+    assert engine.translate("Press firmly") == "Presiona firmly"
+
+
+def test_literal_longest_phrase_wins():
+    engine = TranslationEngine([("water", "agua"), ("hot water", "agua caliente")], literal=True)
+    assert engine.translate("Pour hot water and water") == "Pour agua caliente and agua"
+
+
+def test_replaced_text_is_not_rewritten():
+    engine = TranslationEngine([("This", "Esto"), ("Esto", "WRONG")], literal=True)
+    assert engine.translate("This") == "Esto"
+
+
+def test_per_rule_ignore_case():
+    engine = TranslationEngine([("stir", "revuelve", re.IGNORECASE), ("Wait", "Espera")])
+    assert engine.translate("Stir, then wait") == "revuelve, then wait"
+
+
+def test_backreference_in_pattern_is_rejected():
+    try:
+        TranslationEngine([(r"(a)\1", "b")])
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"🎉 {len(tests)} tests passed")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Regression tests for translation_memory.TranslationMemory.
+
+Runs under pytest or directly: python3 test_translation_memory.py
+"""
+
+from translation_memory import TranslationMemory, aligned
+
+
+def test_misaligned_corpus_pair_is_dropped():
+    memory = TranslationMemory()
+    memory.add_pair("Wait for bloom to complete", "Primer vertido: Vierte lentamente hasta 200g en círculos.", "recipes")
+    assert memory.exact("Wait for bloom to complete") is None
+    assert len(memory.misaligned) == 1
+
+
+def test_curated_pairs_skip_the_alignment_check():
+    memory = TranslationMemory()
+    memory.add_pair("Pour to the top", "Vierte hasta 200g. Luego espera.", "catalog")
+    assert memory.translate("Pour to the top") == "Vierte hasta 200g. Luego espera."
+
+
+def test_curated_only_ignores_corpus_hits():
+    memory = TranslationMemory()
+    memory.add_pair("Stir gently", "Revuelve suavemente", "recipes")
+    assert memory.translate("Stir gently") == "Revuelve suavemente"
+    assert memory.translate("Stir gently", curated_only=True) is None
+    assert memory.lookup("Stir gently")["curated"] is False
+
+
+def test_half_translated_pair_is_dropped():
+    memory = TranslationMemory()
+    memory.add_pair("Wait for bloom to complete", "Espera bloom to complete", "generated")
+    assert memory.exact("Wait for bloom to complete") is None
+    # Jargon and brand names kept in English are not leftovers
+    assert aligned("Kaldi's Coffee - Single Serve", "Kaldi's Coffee - Individual")
+    assert aligned("Pour for the bloom", "Vierte para el bloom")
+
+
+def test_aligned_checks_numbers_units_and_sentences():
+    assert aligned("Pour 1.5 oz. Wait.", "Vierte 1,5 oz. Espera.")
+    assert not aligned("Pour 200g", "Vierte 200ml")
+    assert not aligned("Pour 200g", "Vierte 250g")
+    assert not aligned("Pour. Wait.", "Vierte y espera.")
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"🎉 {len(tests)} tests passed")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+translation_catalog.py
+
+Per-recipe translation catalogs, loaded lazily.
+
+The hand-written recipe translations used to live in translate_all_recipes.py
+as one 1,000-line dict literal, parsed and built on every import even to
+translate a single file. Each recipe's entry is now its own JSON file:
+
+    translation_catalogs/<lang>/<translation key>.json
+
+where the key is the recipe file name without .json (get_translation_key)
+and the content has the same shape as before (title_<lang>, notes_<lang>,
+preparation_steps_<lang>, brewing_steps[i].instruction_<lang>, ...).
+load_catalog() reads only the file it is asked for, so translating one
+recipe costs one small JSON read, and another language is another
+directory rather than more startup work.
+
+Tools that need every entry (the translation memory, bulk runs) use
+load_all_catalogs(), which reads a pickle in .translation_cache/ when it is
+newer than every catalog file and rebuilds it otherwise. The directory lives
+outside PerfectBrew/ so the catalogs are never copied into the app bundle.
+
+Usage:
+    python3 translation_catalog.py                 # List catalogs per language
+    python3 translation_catalog.py --compile       # Rebuild the pickle cache
+    python3 translation_catalog.py --check         # Validate every catalog file
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent
+CATALOG_DIR = ROOT / "translation_catalogs"
+CACHE_DIR = ROOT / ".translation_cache"
+# Bumped whenever the pickled layout changes
+CACHE_VERSION = 1
+
+
+def catalog_path(key: str, language: str = "es", catalog_dir: Path = CATALOG_DIR) -> Path:
+    return catalog_dir / language / f"{key}.json"
+
+
+def catalog_keys(language: str = "es", catalog_dir: Path = CATALOG_DIR) -> List[str]:
+    """Translation keys with a catalog file, without reading any of them."""
+    directory = catalog_dir / language
+    if not directory.is_dir():
+        return []
+    return sorted(path.stem for path in directory.glob("*.json"))
+
+
+def has_catalog(key: str, language: str = "es") -> bool:
+    return catalog_path(key, language).exists()
+
+
+@lru_cache(maxsize=None)
+def load_catalog(key: str, language: str = "es") -> Optional[Dict[str, Any]]:
+    """Catalog entry for one translation key, or None if it has none."""
+    path = catalog_path(key, language)
+    if not path.exists():
+        return None
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_catalog(key: str, translation: Dict[str, Any], language: str = "es",
+                  catalog_dir: Path = CATALOG_DIR) -> Path:
+    """Atomically write one catalog entry."""
+    path = catalog_path(key, language, catalog_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".json.tmp")
+    with temp_path.open("w", encoding="utf-8") as f:
+        json.dump(translation, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(temp_path, path)
+    load_catalog.cache_clear()
+    return path
+
+
+def _fingerprint(language: str, catalog_dir: Path) -> Dict[str, List[int]]:
+    result = {}
+    for path in sorted((catalog_dir / language).glob("*.json")):
+        stat = path.stat()
+        result[path.stem] = [stat.st_mtime_ns, stat.st_size]
+    return result
+
+
+def compile_cache(language: str = "es", catalog_dir: Path = CATALOG_DIR,
+                  cache_dir: Path = CACHE_DIR) -> Dict[str, Dict[str, Any]]:
+    """Read every catalog file for language and pickle the result."""
+    fingerprint = _fingerprint(language, catalog_dir)
+    catalogs = {}
+    for key in fingerprint:
+        with catalog_path(key, language, catalog_dir).open("r", encoding="utf-8") as f:
+            catalogs[key] = json.load(f)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = cache_dir / f"catalogs_{language}.pickle"
+    temp_path = cache_path.with_suffix(".pickle.tmp")
+    with temp_path.open("wb") as f:
+        pickle.dump({"version": CACHE_VERSION, "fingerprint": fingerprint, "catalogs": catalogs},
+                    f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, cache_path)
+    return catalogs
+
+
+def load_all_catalogs(language: str = "es", use_cache: bool = True, catalog_dir: Path = CATALOG_DIR,
+                      cache_dir: Path = CACHE_DIR) -> Dict[str, Dict[str, Any]]:
+    """
+    Every catalog entry for language.
+
+    Args:
+        language: Catalog language
+        use_cache: Read (and refresh) the pickle cache instead of parsing every file
+
+    Returns:
+        Translation key -> catalog entry
+    """
+    if not (catalog_dir / language).is_dir():
+        return {}
+    if not use_cache:
+        return {key: json.loads(catalog_path(key, language, catalog_dir).read_text(encoding="utf-8"))
+                for key in catalog_keys(language, catalog_dir)}
+
+    cache_path = cache_dir / f"catalogs_{language}.pickle"
+    if cache_path.exists():
+        try:
+            with cache_path.open("rb") as f:
+                cached = pickle.load(f)
+            if (cached.get("version") == CACHE_VERSION
+                    and cached.get("fingerprint") == _fingerprint(language, catalog_dir)):
+                return cached["catalogs"]
+        except (pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+    return compile_cache(language, catalog_dir, cache_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect and cache the per-recipe translation catalogs')
+    parser.add_argument('--compile', action='store_true', help='Rebuild the pickle cache for every language')
+    parser.add_argument('--check', action='store_true', help='Parse every catalog file and report errors')
+
+    args = parser.parse_args()
+    languages = sorted(path.name for path in CATALOG_DIR.iterdir() if path.is_dir()) if CATALOG_DIR.is_dir() else []
+
+    print("🌍 TRANSLATION CATALOGS")
+    print("=" * 60)
+    errors = 0
+    for language in languages:
+        keys = catalog_keys(language)
+        print(f"  {language}: {len(keys)} recipes")
+        if args.check:
+            for key in keys:
+                try:
+                    entry = json.loads(catalog_path(key, language).read_text(encoding="utf-8"))
+                    if not isinstance(entry, dict):
+                        raise ValueError("top level is not an object")
+                except ValueError as e:
+                    print(f"  ❌ {language}/{key}.json: {e}")
+                    errors += 1
+        if args.compile:
+            compile_cache(language)
+            print(f"  ✅ Cached {CACHE_DIR.name}/catalogs_{language}.pickle")
+
+    if args.check and not errors:
+        print("✅ All catalogs parse")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+translation_engine.py
+
+Compiled, single-pass phrase translation for the Spanish recipe tools.
+
+The translation scripts used to loop over hundreds of (English, Spanish)
+pairs calling str.replace / re.sub once per pair: O(patterns x text) per
+string, and every replacement ran over the output of the previous ones, so
+"This" could become "Esto" in one pass and "Esto" be rewritten again by a
+later rule. TranslationEngine joins all rules into one alternation regex
+and substitutes in a single left-to-right scan: at each position the first
+matching rule wins, and replaced text is never looked at again.
+
+  literal=True  - rules are plain phrases, compiled into a prefix trie
+                  (one regex whose branches share prefixes), so each
+                  position costs a walk down the trie and the longest
+                  phrase wins: "hot water" beats "water"
+  literal=False - rules are regexes (with \\1-style replacements) kept in
+                  the author's order, which lists specific patterns first.
+                  They are bucketed by their first character behind a
+                  one-character lookahead, so most positions are rejected
+                  after a handful of checks; rules that do not start with a
+                  plain character are repeated in every bucket at their
+                  own place, so earlier rules still win
+
+Regex rules may carry their own re flags as a third element; only
+re.IGNORECASE is honoured, applied to that rule alone. Literal engines use
+the engine-wide ignore_case.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+Rule = Union[Tuple[str, str], Tuple[str, str, int]]
+
+# A backreference inside a pattern would point at the wrong group once merged
+_PATTERN_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _trie_regex(phrases: Iterable[str]) -> str:
+    """Regex matching any of phrases, longest first, with shared prefixes factored out."""
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def node_regex(node: dict) -> str:
+        branches = [re.escape(char) + node_regex(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional: try the longer phrase before stopping at this one
+        return f"(?:{body})?" if "" in node else body
+
+    return node_regex(trie)
+
+
+def _first_chars(pattern: str, ignore_case: bool) -> Optional[str]:
+    """Characters a regex match must start with, or None if that is not obvious."""
+    if not pattern or pattern[0] in "\\.^$*+?{}[]|()":
+        return None
+    if len(pattern) > 1 and pattern[1] in "*?{":
+        # Optional first character
+        return None
+    depth, escaped, in_class = 0, False, False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char in "()":
+            depth += 1 if char == "(" else -1
+        elif char == "|" and depth == 0:
+            # Top-level alternation: other branches may start elsewhere
+            return None
+    char = pattern[0]
+    return char.lower() + char.upper() if ignore_case and char.lower() != char.upper() else char
+
+
+class TranslationEngine:
+    def __init__(self, rules: Iterable[Rule], literal: bool = False, ignore_case: bool = False,
+                 whole_words: bool = False):
+        """
+        Compile rules into one matcher.
+
+        Args:
+            rules: (pattern, replacement) or (pattern, replacement, flags) tuples
+            literal: Treat patterns as plain text and match the longest first
+            ignore_case: Case-insensitive matching (default for regex rules without flags)
+            whole_words: Only match at word boundaries (literal rules only)
+        """
+        self.literal = literal
+        self.ignore_case = ignore_case
+        if literal:
+            self._compile_literal(rules, whole_words)
+        else:
+            self._compile_regex(rules)
+
+    def _compile_literal(self, rules: Iterable[Rule], whole_words: bool) -> None:
+        self._lookup: Dict[str, str] = {}
+        for rule in rules:
+            key = rule[0].lower() if self.ignore_case else rule[0]
+            # Earlier rules win over later ones for the same phrase
+            if key:
+                self._lookup.setdefault(key, rule[1])
+        self.rule_count = len(self._lookup)
+        if not self._lookup:
+            self._regex = None
+            return
+        source = _trie_regex(self._lookup)
+        if whole_words:
+            source = rf"\b{source}\b"
+        self._regex = re.compile(source, re.IGNORECASE if self.ignore_case else 0)
+
+    def _compile_regex(self, rules: Iterable[Rule]) -> None:
+        self._replacements: List[str] = []
+        self._rule_patterns: List[re.Pattern] = []
+        # (rule index, pattern source, possible first characters or None)
+        entries: List[Tuple[int, str, Optional[str]]] = []
+        bucket_chars: Dict[str, set] = {}
+
+        for rule in rules:
+            pattern, replacement = rule[0], rule[1]
+            flags = rule[2] if len(rule) > 2 else (re.IGNORECASE if self.ignore_case else 0)
+            if not pattern:
+                continue
+            if _PATTERN_BACKREF_RE.search(pattern):
+                raise ValueError(f"Backreferences inside patterns are not supported: {pattern!r}")
+            rule_ignore_case = bool(flags & re.IGNORECASE)
+            source = f"(?i:{pattern})" if rule_ignore_case else pattern
+            self._replacements.append(replacement)
+            # Re-matched on its own to expand \1 with the rule's own group numbers
+            self._rule_patterns.append(re.compile(source))
+
+            chars = _first_chars(pattern, rule_ignore_case)
+            entries.append((len(self._replacements) - 1, source, chars))
+            if chars is not None:
+                # Same letter in any case shares a bucket
+                bucket_chars.setdefault(chars[0].lower(), set()).update(chars)
+
+        self.rule_count = len(self._replacements)
+        branches = []
+        for copy, (key, chars) in enumerate(bucket_chars.items()):
+            # Rules that may start anywhere are repeated in every bucket at their
+            # own index, so author order holds at every position
+            alternatives = [f"(?P<r{index}_{copy}>{source})" for index, source, first in entries
+                            if first is None or first[0].lower() == key]
+            char_class = "".join(re.escape(char) for char in sorted(chars))
+            branches.append(f"(?=[{char_class}])(?:{'|'.join(alternatives)})")
+        # Positions no bucket covers can only match the unbucketed rules
+        branches.extend(f"(?P<r{index}>{source})" for index, source, first in entries if first is None)
+        self._regex = re.compile("|".join(branches)) if branches else None
+
+    def _substitute(self, match: re.Match) -> str:
+        if self.literal:
+            text = match.group(0)
+            return self._lookup[text.lower() if self.ignore_case else text]
+        index = int(match.lastgroup[1:].split("_")[0])
+        rule_match = self._rule_patterns[index].match(match.string, match.start(), match.end())
+        return rule_match.expand(self._replacements[index]) if rule_match else match.group(0)
+
+    def translate(self, text: str) -> str:
+        """Apply every rule to text in one scan."""
+        if not text or self._regex is None:
+            return text
+        return self._regex.sub(self._substitute, text)
+
+    __call__ = translate
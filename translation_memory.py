@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+translation_memory.py
+
+One translation memory for every Spanish source in the repo, keyed on
+normalized English segments.
+
+Spanish text used to come from four places that could disagree: the
+per-recipe catalogs of translate_all_recipes.py, the hand-written
+manual_translations_es.json, the generated recipes_es.json, and the phrase
+dictionaries of the translation scripts. TranslationMemory loads them all,
+plus the _es fields already in the recipe corpus, in priority order:
+
+  manual     - Resources/Translations/manual_translations_<lang>.json
+  catalog    - translation_catalogs/<lang>/*.json (translation_catalog.py)
+  phrases    - literal phrase dictionaries (TERMS, TEXT_REPLACEMENTS, ...)
+  recipes    - _<lang> fields of the recipe JSON files
+  generated  - Resources/Translations/recipes_<lang>.json
+
+The first three are curated. The last two are machine output or fields
+that may have drifted out of line with their English (a step's Spanish
+left behind when steps were inserted), so their pairs are only stored if
+they pass aligned(): same numbers, same units, same sentence count, and no
+English word of the source left untranslated (recipes_<lang>.json is the
+old word-replacement generator's output, full of "Espera bloom to
+complete"). Hits on them carry curated=False, and callers let their rule
+engines run first.
+
+Every field is stored as a segment; when a field and its translation split
+into the same number of sentences, each sentence is stored too, so a new
+recipe reusing one sentence still gets a hit. The first source to provide
+a segment wins; later disagreeing translations are kept as conflicts.
+
+Lookups are a dict hit on the normalized text, then a sentence-by-sentence
+exact match, then a character-trigram index scored by Dice similarity. A
+fuzzy hit is only accepted when the numbers in both English texts agree, so
+"Pour 120g" never borrows the Spanish for "Pour 100g".
+
+Usage:
+    python3 translation_memory.py                       # Summary by source
+    python3 translation_memory.py --lookup "Stir gently 3 times"
+    python3 translation_memory.py --conflicts
+    python3 translation_memory.py --export tm_es.json
+"""
+
+import argparse
+import json
+import re
+import sys
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from translation_catalog import load_all_catalogs
+
+ROOT = Path(__file__).resolve().parent
+RECIPES_DIR = ROOT / "PerfectBrew" / "Resources" / "Recipes"
+TRANSLATIONS_DIR = ROOT / "PerfectBrew" / "Resources" / "Translations"
+# Minimum Dice similarity of character trigrams for a fuzzy hit
+FUZZY_THRESHOLD = 0.85
+# Sources whose pairs were written or reviewed by a person, in priority order
+CURATED_ORIGINS = ("manual", "catalog", "phrases")
+
+_QUOTES = str.maketrans({"‘": "'", "’": "'", "“": '"', "”": '"', "–": "-", "—": "-"})
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_NUMBER_RE = re.compile(r"\d+(?:[.,:]\d+)?")
+_WORD_RE = re.compile(r"[^\W\d_]+")
+# English words no Spanish sentence uses; coffee jargon kept in Spanish (bloom,
+# bypass, drawdown) and brand names (Kaldi's Coffee) are deliberately absent
+ENGLISH_WORDS = frozenset("""
+    about after and are around before between for from gently into is it let
+    minutes of off over pour press seconds should slowly stir the then this to
+    until wait water when while will with you your
+""".split())
+_UNIT_RE = re.compile(r"\d\s*(g|ml|l|oz|°[cf]?|%)(?![^\W\d_])", re.IGNORECASE)
+
+
+def normalize_segment(text: str) -> str:
+    """Key for a segment: NFKC, casefolded, straight quotes, single spaces."""
+    text = unicodedata.normalize("NFKC", text).translate(_QUOTES).casefold()
+    return " ".join(text.split())
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence for sentence in _SENTENCE_RE.split(text.strip()) if sentence]
+
+
+def untranslated_words(source: str, translation: str) -> List[str]:
+    """English words of source still present (in lowercase) in translation."""
+    source_words = {word.casefold() for word in _WORD_RE.findall(source)}
+    return sorted({word for word in _WORD_RE.findall(translation)
+                   if word.islower() and word in ENGLISH_WORDS and word in source_words})
+
+
+def aligned(source: str, translation: str) -> bool:
+    """
+    Whether a translation plausibly says what source says: same numbers,
+    units and sentence count, and no English left from the source.
+    """
+    def numbers(text: str) -> List[str]:
+        # 1.5 and 1,5 are the same quantity
+        return sorted(number.replace(",", ".") for number in _NUMBER_RE.findall(text))
+
+    def units(text: str) -> List[str]:
+        return sorted(unit.casefold() for unit in _UNIT_RE.findall(text))
+
+    return (numbers(source) == numbers(translation) and units(source) == units(translation)
+            and len(split_sentences(source)) == len(split_sentences(translation))
+            and not untranslated_words(source, translation))
+
+
+def _trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def translation_pairs(recipe: Dict[str, Any], translation: Dict[str, Any],
+                      language: str = "es") -> Iterator[Tuple[str, str, str]]:
+    """
+    Aligned (field, English, translated) texts of a recipe.
+
+    Args:
+        recipe: English recipe dict
+        translation: Dict shaped like a catalog / manual translation entry
+            (title_<lang>, brewing_steps[i].instruction_<lang>, ...); a
+            recipe with its own _<lang> fields works too
+        language: Suffix of the translated fields
+    """
+    suffix = f"_{language}"
+    for field in ("title", "notes"):
+        if recipe.get(field) and translation.get(field + suffix):
+            yield field, recipe[field], translation[field + suffix]
+
+    english_steps = recipe.get("preparation_steps") or []
+    translated_steps = translation.get("preparation_steps" + suffix) or []
+    if len(english_steps) == len(translated_steps):
+        for english, translated in zip(english_steps, translated_steps):
+            yield "preparation_steps", english, translated
+
+    english_steps = recipe.get("brewing_steps") or []
+    translated_steps = translation.get("brewing_steps") or []
+    # A catalog written for an older version of the recipe no longer lines up step by step
+    if len(english_steps) == len(translated_steps):
+        for step, step_trans in zip(english_steps, translated_steps):
+            for field in ("instruction", "short_instruction", "audio_script"):
+                if step.get(field) and step_trans.get(field + suffix):
+                    yield field, step[field], step_trans[field + suffix]
+
+    wte, wte_trans = recipe.get("what_to_expect"), translation.get("what_to_expect")
+    if isinstance(wte, dict) and isinstance(wte_trans, dict):
+        for field in ("description", "audio_script"):
+            if wte.get(field) and wte_trans.get(field + suffix):
+                yield f"what_to_expect.{field}", wte[field], wte_trans[field + suffix]
+
+
+class TranslationMemory:
+    def __init__(self, language: str = "es"):
+        """
+        Empty memory for one target language.
+
+        Args:
+            language: Target language code
+        """
+        self.language = language
+        self.segments: Dict[str, Dict[str, str]] = {}
+        self.conflicts: List[Dict[str, str]] = []
+        self.misaligned: List[Dict[str, str]] = []
+        self._keys: List[str] = []
+        self._trigrams: List[Set[str]] = []
+        self._postings: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def add(self, source: str, translation: str, origin: str) -> bool:
+        """Store a segment unless a higher-priority source already has it. Returns True if stored."""
+        key = normalize_segment(source)
+        if not key or not translation.strip() or key == normalize_segment(translation):
+            # Untranslated copies are not translations
+            return False
+        existing = self.segments.get(key)
+        if existing:
+            if existing["translation"] != translation:
+                self.conflicts.append({"source": source, "kept": existing["translation"],
+                                       "kept_origin": existing["origin"], "dropped": translation,
+                                       "dropped_origin": origin})
+            return False
+
+        self.segments[key] = {"source": source, "translation": translation, "origin": origin}
+        index = len(self._keys)
+        grams = _trigrams(key)
+        self._keys.append(key)
+        self._trigrams.append(grams)
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(index)
+        return True
+
+    def add_pair(self, source: str, translation: str, origin: str) -> None:
+        """Store a field and, when they align one to one, its sentences. Uncurated pairs must pass aligned()."""
+        if origin not in CURATED_ORIGINS and not aligned(source, translation):
+            self.misaligned.append({"source": source, "translation": translation, "origin": origin})
+            return
+        self.add(source, translation, origin)
+        sentences, translated = split_sentences(source), split_sentences(translation)
+        if len(sentences) > 1 and len(sentences) == len(translated):
+            for english, spanish in zip(sentences, translated):
+                self.add(english, spanish, origin)
+
+    def _hit(self, segment: Dict[str, str], score: float) -> Dict[str, Any]:
+        return dict(segment, score=score, curated=segment["origin"] in CURATED_ORIGINS)
+
+    def exact(self, text: str) -> Optional[Dict[str, Any]]:
+        segment = self.segments.get(normalize_segment(text))
+        return self._hit(segment, 1.0) if segment else None
+
+    def fuzzy(self, text: str, threshold: float = FUZZY_THRESHOLD, limit: int = 5) -> List[Dict[str, Any]]:
+        """Stored segments most similar to text, best first, scored by trigram Dice similarity."""
+        grams = _trigrams(normalize_segment(text))
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+
+        matches = []
+        for index, count in shared.items():
+            score = 2 * count / (len(grams) + len(self._trigrams[index]))
+            if score >= threshold:
+                matches.append((score, index))
+        matches.sort(key=lambda match: (-match[0], match[1]))
+        return [self._hit(self.segments[self._keys[index]], round(score, 3)) for score, index in matches[:limit]]
+
+    def lookup(self, text: str, threshold: float = FUZZY_THRESHOLD,
+               curated_only: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Best translation for text, or None.
+
+        Args:
+            curated_only: Ignore segments from the recipe corpus and generated files
+
+        Returns:
+            Dict with 'source', 'translation', 'origin', 'curated' and 'score'
+            (1.0 for exact and sentence-by-sentence hits)
+        """
+        def usable(hit: Optional[Dict[str, Any]]) -> bool:
+            return bool(hit) and (hit["curated"] or not curated_only)
+
+        hit = self.exact(text)
+        if usable(hit):
+            return hit
+
+        sentences = split_sentences(text)
+        if len(sentences) > 1:
+            hits = [self.exact(sentence) for sentence in sentences]
+            if all(usable(hit) for hit in hits):
+                return {"source": text, "translation": " ".join(hit["translation"] for hit in hits),
+                        "origin": "+".join(sorted({hit["origin"] for hit in hits})), "score": 1.0,
+                        "curated": all(hit["curated"] for hit in hits)}
+
+        numbers = _NUMBER_RE.findall(text)
+        for candidate in self.fuzzy(text, threshold):
+            if usable(candidate) and _NUMBER_RE.findall(candidate["source"]) == numbers:
+                return candidate
+        return None
+
+    def translate(self, text: str, threshold: float = FUZZY_THRESHOLD, curated_only: bool = False) -> Optional[str]:
+        hit = self.lookup(text, threshold, curated_only)
+        return hit["translation"] if hit else None
+
+
+def _recipe_files(recipes_dir: Path) -> Dict[str, Path]:
+    """Recipe file stem (the catalogs' key) -> path."""
+    return {path.stem: path for path in sorted(recipes_dir.rglob("*.json"))}
+
+
+def _load_recipe(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except ValueError:
+        # A broken recipe teaches nothing; the tool rewriting it reports the error
+        return None
+    recipe = data[0] if isinstance(data, list) and data else data
+    return recipe if isinstance(recipe, dict) else None
+
+
+def _add_catalog(memory: TranslationMemory, catalog: Dict[str, Any], recipes: Dict[str, Path],
+                 origin: str) -> None:
+    for key, translation in catalog.items():
+        if key in recipes and isinstance(translation, dict):
+            recipe = _load_recipe(recipes[key])
+            if recipe:
+                for _, english, translated in translation_pairs(recipe, translation, memory.language):
+                    memory.add_pair(english, translated, origin)
+
+
+def _phrase_dictionaries() -> List[Tuple[str, str]]:
+    # Imported here: these modules import this one
+    import complete_all_translations
+    import complete_spanish_translations
+    import generate_spanish_translations
+    import translate_all_recipes
+
+    pairs = list(translate_all_recipes.TERMS.items())
+    pairs += list(complete_all_translations.TRANSLATIONS.items())
+    pairs += complete_spanish_translations.TITLE_REPLACEMENTS + complete_spanish_translations.TEXT_REPLACEMENTS
+    pairs += list(generate_spanish_translations.TITLE_REPLACEMENTS.items())
+    return pairs
+
+
+def build_memory(language: str = "es", recipes_dir: Path = RECIPES_DIR,
+                 translations_dir: Path = TRANSLATIONS_DIR) -> TranslationMemory:
+    """Load every translation source for language, highest priority first."""
+    memory = TranslationMemory(language)
+    recipes = _recipe_files(recipes_dir)
+
+    manual_path = translations_dir / f"manual_translations_{language}.json"
+    if manual_path.exists():
+        with manual_path.open("r", encoding="utf-8") as f:
+            _add_catalog(memory, json.load(f).get("translations", {}), recipes, "manual")
+
+    _add_catalog(memory, load_all_catalogs(language), recipes, "catalog")
+
+    if language == "es":
+        for english, translated in _phrase_dictionaries():
+            memory.add(english, translated, "phrases")
+
+    for path in recipes.values():
+        recipe = _load_recipe(path)
+        if recipe:
+            for _, english, translated in translation_pairs(recipe, recipe, language):
+                memory.add_pair(english, translated, "recipes")
+
+    generated_path = translations_dir / f"recipes_{language}.json"
+    if generated_path.exists():
+        with generated_path.open("r", encoding="utf-8") as f:
+            _add_catalog(memory, json.load(f).get("translations", {}), recipes, "generated")
+    return memory
+
+
+@lru_cache(maxsize=None)
+def load_memory(language: str = "es") -> TranslationMemory:
+    """build_memory(language), built once per process."""
+    return build_memory(language)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the unified translation memory')
+    parser.add_argument('--language', default='es', help='Target language (default: es)')
+    parser.add_argument('--lookup', help='Translate one English text')
+    parser.add_argument('--threshold', type=float, default=FUZZY_THRESHOLD,
+                        help=f'Minimum fuzzy similarity (default: {FUZZY_THRESHOLD})')
+    parser.add_argument('--conflicts', action='store_true', help='List segments the sources disagree on')
+    parser.add_argument('--export', help='Write every segment to this JSON file')
+
+    args = parser.parse_args()
+    memory = build_memory(args.language)
+
+    if args.lookup:
+        hit = memory.lookup(args.lookup, args.threshold)
+        if not hit:
+            print("❌ No match")
+            for candidate in memory.fuzzy(args.lookup, threshold=0.5, limit=3):
+                print(f"   ~{candidate['score']:.2f} [{candidate['origin']}] {candidate['source']}")
+            return 1
+        note = "" if hit["curated"] else ", uncurated"
+        print(f"✅ [{hit['origin']}, {hit['score']:.2f}{note}] {hit['translation']}")
+        if hit["score"] < 1.0:
+            print(f"   matched: {hit['source']}")
+        return 0
+
+    print(f"🧠 TRANSLATION MEMORY ({args.language})")
+    print("=" * 60)
+    origins = Counter(segment["origin"] for segment in memory.segments.values())
+    for origin in CURATED_ORIGINS + ("recipes", "generated"):
+        print(f"  {origin}: {origins.get(origin, 0)} segments")
+    print(f"  Total: {len(memory)} segments, {len(memory.conflicts)} conflicts, "
+          f"{len(memory.misaligned)} misaligned pairs dropped")
+
+    if args.conflicts:
+        for conflict in memory.conflicts:
+            print(f"\n⚠️  {conflict['source']}")
+            print(f"   kept    [{conflict['kept_origin']}] {conflict['kept']}")
+            print(f"   dropped [{conflict['dropped_origin']}] {conflict['dropped']}")
+
+    if args.export:
+        with open(args.export, "w", encoding="utf-8") as f:
+            json.dump({"language": args.language, "segments": list(memory.segments.values())},
+                      f, indent=2, ensure_ascii=False)
+        print(f"📄 Wrote {args.export}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
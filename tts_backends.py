@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+TTS backends for PerfectBrew audio generation.
+
+Every engine the audio scripts have used sits behind the same small interface:
+
+  chatterbox - Chatterbox neural TTS (final renders; slow, needs torch)
+  pyttsx3    - local system voices through pyttsx3 (quick drafts)
+  say        - macOS 'say' command (quick drafts, macOS only)
+  silent     - silence sized from the word count (timing placeholders, instant)
+  tone       - like silent, with a beep marking the start and end of the clip
+
+A backend turns cleaned script text into a mono float waveform at its
+sample_rate; folder naming, step iteration, caching and M4A encoding stay in
+UniversalAudioGenerator. Each backend declares a cost profile so callers can
+pick drafts vs. final renders knowingly.
+
+Chatterbox can clone a reference voice (e.g. reference_spanish_best.wav).
+The speaker conditioning for each reference clip is computed once and kept
+in .audio_cache/voices/, so every step, run and worker reuses it. load()
+ends with a timed warmup so the first real step is not the slow one.
+
+Usage:
+    python3 tts_backends.py              # List backends and their cost profiles
+    python3 universal_audio_generator.py --backend pyttsx3 ...
+    python3 universal_audio_generator.py --voice reference_spanish_best.wav ...
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from audio_cache import CACHE_DIR
+
+# Speaker conditioning computed from reference clips, one file per clip
+VOICE_CACHE_DIR = CACHE_DIR / "voices"
+
+# Average narration speed, shared with validate_aeropress_timers.py
+WORDS_PER_SECOND = 2.5
+
+
+def estimate_duration(text: str) -> float:
+    """Seconds a script takes to narrate, estimated from its word count."""
+    return max(1, len(text.split())) / WORDS_PER_SECOND
+
+
+def _read_wav(path: str, sample_rate: int) -> np.ndarray:
+    """Read a 16-bit WAV as a mono float waveform at sample_rate."""
+    with wave.open(path, 'rb') as wav_file:
+        channels = wav_file.getnchannels()
+        source_rate = wav_file.getframerate()
+        frames = wav_file.readframes(wav_file.getnframes())
+
+    wav = np.frombuffer(frames, dtype='<i2').astype(np.float32) / 32768.0
+    if channels > 1:
+        wav = wav.reshape(-1, channels).mean(axis=1)
+    if source_rate != sample_rate and len(wav):
+        # Linear resampling is plenty for draft voices
+        target_length = int(len(wav) * sample_rate / source_rate)
+        wav = np.interp(np.linspace(0, len(wav) - 1, target_length),
+                        np.arange(len(wav)), wav).astype(np.float32)
+    return wav
+
+
+# Backend name -> class, filled in by @register_backend
+BACKENDS = {}
+
+
+def register_backend(backend_class):
+    """Add a TTSBackend subclass to the registry under its name."""
+    BACKENDS[backend_class.name] = backend_class
+    return backend_class
+
+
+class TTSBackend:
+    """
+    Base class for TTS backends.
+
+    Subclasses set name, voice, sample_rate and cost, and implement
+    synthesize(). load() is called once per process before the first
+    synthesize(); heavy imports belong there, not at module level.
+    """
+    name = 'base'
+    voice = 'default'
+    sample_rate = 22050
+    # load_seconds: one-off startup; realtime_factor: synthesis seconds per
+    # second of audio; memory_mb: resident model size; quality: draft or final
+    cost: Dict[str, Any] = {}
+
+    def __init__(self, device: str = 'cpu', language: str = 'en', voice_prompt: Optional[str] = None):
+        self.device = device
+        self.language = language
+        self.voice_prompt = voice_prompt
+
+    def load(self) -> None:
+        """Load the engine (no-op for engines without a model)."""
+
+    def warmup(self) -> None:
+        """Run a throwaway synthesis so the first real step is not the slow one."""
+
+    def set_threads(self, threads: int) -> None:
+        """Limit the engine's intra-op threads (for worker pools)."""
+
+    def synthesize(self, text: str) -> np.ndarray:
+        """Synthesize one script as a 1-D float waveform in [-1, 1]."""
+        raise NotImplementedError
+
+
+@register_backend
+class ChatterboxBackend(TTSBackend):
+    name = 'chatterbox'
+    sample_rate = 22050
+    cost = {'load_seconds': 30, 'realtime_factor': 3.0, 'memory_mb': 3000, 'quality': 'final'}
+    EXAGGERATION = 0.5
+    WARMUP_TEXT = "Bloom the coffee for thirty seconds."
+
+    def __init__(self, device: str = 'cpu', language: str = 'en', voice_prompt: Optional[str] = None):
+        super().__init__(device, language, voice_prompt)
+        self.tts = None
+        if voice_prompt:
+            # Voice identity (and audio cache key) follows the reference clip's content
+            self.voice_hash = self._voice_hash(voice_prompt)
+            self.voice = f"{Path(voice_prompt).stem}-{self.voice_hash[:12]}"
+
+    def _voice_hash(self, voice_prompt: str) -> str:
+        digest = hashlib.sha256(f"exaggeration={self.EXAGGERATION}\n".encode())
+        with open(voice_prompt, 'rb') as f:
+            digest.update(f.read())
+        return digest.hexdigest()
+
+    def load(self) -> None:
+        from chatterbox.tts import ChatterboxTTS
+
+        print("Loading Chatterbox TTS model...")
+        self.tts = ChatterboxTTS.from_pretrained(device=self.device)
+        print("Model loaded successfully!")
+        if self.voice_prompt:
+            self._load_conditionals()
+
+    def _load_conditionals(self) -> None:
+        """Use cached speaker conditioning for the reference clip, computing it once."""
+        from chatterbox.tts import Conditionals
+
+        cached = VOICE_CACHE_DIR / f"{self.voice_hash}.pt"
+        if cached.exists():
+            self.tts.conds = Conditionals.load(cached, map_location=self.device)
+            print(f"🎙️  Voice conditioning loaded from cache: {self.voice}")
+            return
+
+        start = time.time()
+        self.tts.prepare_conditionals(self.voice_prompt, exaggeration=self.EXAGGERATION)
+        VOICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Publish atomically; several workers may compute the same voice at once
+        temp_path = VOICE_CACHE_DIR / f"{self.voice_hash}.{os.getpid()}.tmp"
+        self.tts.conds.save(temp_path)
+        os.replace(temp_path, cached)
+        print(f"🎙️  Voice conditioning computed in {time.time() - start:.1f}s and cached: {self.voice}")
+
+    def warmup(self) -> None:
+        start = time.time()
+        self.tts.generate(self.WARMUP_TEXT)
+        print(f"🔥 Warmup synthesis took {time.time() - start:.1f}s")
+
+    def set_threads(self, threads: int) -> None:
+        import torch
+
+        torch.set_num_threads(threads)
+
+    def _to_waveform(self, wav) -> np.ndarray:
+        """Model output (tensor or array) as a 1-D numpy waveform."""
+        # Convert to numpy array if needed
+        if hasattr(wav, 'cpu'):
+            wav = wav.cpu().numpy()
+        return np.asarray(wav).reshape(-1)
+
+    def synthesize(self, text: str) -> np.ndarray:
+        return self._to_waveform(self.tts.generate(text))
+
+
+@register_backend
+class Pyttsx3Backend(TTSBackend):
+    name = 'pyttsx3'
+    sample_rate = 22050
+    cost = {'load_seconds': 1, 'realtime_factor': 0.1, 'memory_mb': 50, 'quality': 'draft'}
+
+    def __init__(self, device: str = 'cpu', language: str = 'en', voice_prompt: Optional[str] = None):
+        super().__init__(device, language, voice_prompt)
+        self.engine = None
+
+    def load(self) -> None:
+        import pyttsx3
+
+        print("Loading lightweight TTS engine...")
+        self.engine = pyttsx3.init()
+        voices = self.engine.getProperty('voices') or []
+        # Prefer a voice for the target language, else the first available one
+        matching = [v for v in voices if any(self.language in str(lang) for lang in (v.languages or []))]
+        if matching or voices:
+            # Not stored in self.voice: the cache key must not depend on load()
+            self.engine.setProperty('voice', (matching or voices)[0].id)
+        self.engine.setProperty('rate', 150)  # Speed of speech
+        self.engine.setProperty('volume', 0.9)  # Volume level
+        print("✅ Lightweight TTS engine loaded successfully!")
+
+    def synthesize(self, text: str) -> np.ndarray:
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_wav:
+            temp_path = temp_wav.name
+        try:
+            self.engine.save_to_file(text, temp_path)
+            self.engine.runAndWait()
+            return _read_wav(temp_path, self.sample_rate)
+        finally:
+            os.unlink(temp_path)
+
+
+@register_backend
+class SayBackend(TTSBackend):
+    name = 'say'
+    sample_rate = 22050
+    cost = {'load_seconds': 0, 'realtime_factor': 0.05, 'memory_mb': 0, 'quality': 'draft'}
+    VOICES = {'en': 'Samantha', 'es': 'Monica'}
+
+    def __init__(self, device: str = 'cpu', language: str = 'en', voice_prompt: Optional[str] = None):
+        super().__init__(device, language, voice_prompt)
+        self.voice = self.VOICES.get(language, 'Samantha')
+
+    def load(self) -> None:
+        if shutil.which('say') is None:
+            raise RuntimeError("The 'say' backend needs macOS")
+
+    def synthesize(self, text: str) -> np.ndarray:
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_wav:
+            temp_path = temp_wav.name
+        try:
+            cmd = [
+                'say',
+                '-v', self.voice,
+                '-r', '180',       # Speaking rate (words per minute)
+                '--file-format=WAVE',
+                f'--data-format=LEI16@{self.sample_rate}',
+                '-o', temp_path,
+                text
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"say failed: {result.stderr}")
+            return _read_wav(temp_path, self.sample_rate)
+        finally:
+            os.unlink(temp_path)
+
+
+@register_backend
+class SilentBackend(TTSBackend):
+    name = 'silent'
+    sample_rate = 22050
+    cost = {'load_seconds': 0, 'realtime_factor': 0.0, 'memory_mb': 0, 'quality': 'placeholder'}
+
+    def synthesize(self, text: str) -> np.ndarray:
+        return np.zeros(int(estimate_duration(text) * self.sample_rate), dtype=np.float32)
+
+
+@register_backend
+class ToneBackend(TTSBackend):
+    name = 'tone'
+    sample_rate = 22050
+    cost = {'load_seconds': 0, 'realtime_factor': 0.0, 'memory_mb': 0, 'quality': 'placeholder'}
+    BEEP_SECONDS = 0.15
+
+    def _beep(self, frequency: float) -> np.ndarray:
+        t = np.arange(int(self.BEEP_SECONDS * self.sample_rate), dtype=np.float32) / self.sample_rate
+        # Hann envelope so the beep does not click
+        envelope = np.hanning(len(t)).astype(np.float32)
+        return 0.3 * envelope * np.sin(2 * np.pi * frequency * t, dtype=np.float32)
+
+    def synthesize(self, text: str) -> np.ndarray:
+        wav = np.zeros(int(estimate_duration(text) * self.sample_rate), dtype=np.float32)
+        start, end = self._beep(880.0), self._beep(440.0)
+        if len(wav) >= len(start) + len(end):
+            # High beep when the clip starts, low beep just before it ends
+            wav[:len(start)] = start
+            wav[-len(end):] = end
+        return wav
+
+
+BACKEND_CHOICES = list(BACKENDS)
+
+
+def get_backend(name: str, device: str = 'cpu', language: str = 'en',
+                voice_prompt: Optional[str] = None) -> TTSBackend:
+    """
+    Create a TTS backend by name (see BACKEND_CHOICES).
+
+    Args:
+        voice_prompt: Reference clip to clone (backends that cannot clone ignore it)
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown TTS backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+    return BACKENDS[name](device=device, language=language, voice_prompt=voice_prompt)
+
+
+def main():
+    print("🎙️  TTS backends")
+    for name, backend_class in BACKENDS.items():
+        cost = backend_class.cost
+        print(f"   {name:<11} {cost['quality']:<12} load ~{cost['load_seconds']}s, "
+              f"{cost['realtime_factor']}x realtime, ~{cost['memory_mb']} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,30 +8,172 @@ import json
 import os
 import re
 import argparse
+import multiprocessing
+import signal
+import time
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional
-from chatterbox.tts import ChatterboxTTS
-import torch
 import numpy as np
+from audio_cache import AudioCache, CACHE_DIR, cache_key
+from audio_journal import AudioJournal, JOURNAL_PATH
+from audio_encoder import ENCODER_CHOICES, ENCODING_PROFILES, PROFILE_CHOICES, get_encoder, to_pcm16
+from audio_postprocess import POSTPROCESS_SETTINGS, postprocess
+from audio_manifest import AudioManifest, MANIFEST_PATH, ROOT, clean_script, entry_key, relative_path, script_hash
+from audio_paths import clip_file_name
+from locale_fields import SOURCE_LOCALE, all_locales, localized_field
+from tts_backends import BACKEND_CHOICES, get_backend
+
+# Generator owned by each long-lived worker process (see _init_worker)
+_worker_generator = None
+
+
+class JobTimeoutError(Exception):
+    pass
+
+
+def _timeout_handler(signum, frame):
+    raise JobTimeoutError("TTS generation timed out")
+
+
+@contextmanager
+def _job_timeout(seconds: Optional[int]):
+    """Abort the enclosed synthesis with JobTimeoutError after seconds (SIGALRM)."""
+    if not seconds or not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _timeout_handler)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)  # Cancel any pending alarm
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _init_worker(threads: int, generator_kwargs: Dict[str, Any]) -> None:
+    """Load the TTS model once per worker process."""
+    global _worker_generator
+    _worker_generator = UniversalAudioGenerator(**generator_kwargs)
+    # Split the cores between workers instead of letting every worker grab all of them
+    _worker_generator.backend.set_threads(threads)
+
+
+def _run_worker_job(job: Dict[str, Any]) -> tuple:
+    """Synthesize one step job inside a worker process."""
+    ok = _worker_generator._generate_audio_job(job)
+    return job['output_path'], ok, _worker_generator.clip_durations.get(job['output_path'])
+
 
 class UniversalAudioGenerator:
-    def __init__(self, device: str = "cpu", language: str = "en"):
+    def __init__(self, device: str = "cpu", language: str = "en", workers: int = 1,
+                 cache_dir: Optional[str] = str(CACHE_DIR),
+                 changed_only: bool = False,
+                 manifest_path: str = str(MANIFEST_PATH),
+                 encoder: str = "auto",
+                 stream: bool = False,
+                 stream_threshold: int = 400,
+                 backend: str = "chatterbox",
+                 resume: bool = False,
+                 retries: int = 2,
+                 job_timeout: Optional[int] = None,
+                 journal_path: Optional[str] = str(JOURNAL_PATH),
+                 voice: Optional[str] = None,
+                 profile: str = "standard",
+                 postprocess: bool = True):
         """
         Initialize the universal audio generator.
         
         Args:
             device: Device to use (cpu or cuda)
             language: Language for audio generation (en or es)
+            workers: Number of worker processes (1 = synthesize in this process)
+            cache_dir: TTS output cache directory (None disables the cache)
+            changed_only: Only regenerate, rename or delete clips whose step changed
+                since the last run recorded in the manifest
+            manifest_path: Audio build manifest location
+            encoder: M4A encoder backend (auto, pyav, pipe or file)
+            stream: Synthesize long scripts sentence by sentence, pushing each chunk
+                straight to the encoder so memory stays flat
+            stream_threshold: Minimum cleaned script length (chars) that is streamed
+            backend: TTS backend (chatterbox, pyttsx3, say, silent or tone)
+            resume: Skip jobs the journal shows as finished with an intact file
+            retries: Extra attempts for failed jobs, with exponential backoff
+            job_timeout: Seconds one script may take to synthesize (None = no limit)
+            journal_path: Job journal location (None disables journaling)
+            voice: Reference clip to clone (e.g. reference_spanish_best.wav); its
+                conditioning is computed once and cached on disk
+            profile: AAC encoding profile (standard, speech or speech-he)
+            postprocess: Trim leading/trailing silence and normalize loudness before
+                encoding (placeholder backends are never post-processed)
         """
         self.device = device
         self.language = language
-        self.tts = None
-        self._load_model()
+        self.workers = max(1, workers)
+        self.cache_dir = cache_dir
+        self.cache = AudioCache(cache_dir) if cache_dir else None
+        self.changed_only = changed_only
+        self.manifest_path = manifest_path
+        self._manifest = None
+        self.encoder_name = encoder
+        self.profile = profile
+        self.encoder_settings = ENCODING_PROFILES[profile]
+        self.encoder = get_encoder(encoder, self.encoder_settings)
+        self.stream = stream
+        self.stream_threshold = stream_threshold
+        self.backend_name = backend
+        self.voice = voice
+        self.backend = get_backend(backend, device=device, language=language, voice_prompt=voice)
+        # Placeholder clips are sized from word count on purpose; trimming would erase them
+        self.postprocess = postprocess and self.backend.cost.get('quality') != 'placeholder'
+        # Output path -> seconds of audio in the clip written there (after trimming)
+        self.clip_durations: Dict[str, float] = {}
+        self.resume = resume
+        self.retries = max(0, retries)
+        self.job_timeout = job_timeout
+        self.journal = AudioJournal(journal_path) if journal_path else None
+        self._pool = None
+        if self.workers == 1:
+            self._load_model()
     
     def _load_model(self):
-        """Load the TTS model."""
-        print("Loading Chatterbox TTS model...")
-        self.tts = ChatterboxTTS.from_pretrained(device=self.device)
-        print("Model loaded successfully!")
+        """Load the TTS model and warm it up so per-step latency is steady."""
+        self.backend.load()
+        self.backend.warmup()
+    
+    def _get_pool(self):
+        """Start the worker pool on first use; workers stay alive until close()."""
+        if self._pool is None:
+            threads = max(1, (os.cpu_count() or 1) // self.workers)
+            print(f"Starting {self.workers} {self.backend_name} workers ({threads} threads each)...")
+            # spawn: forked children inherit torch's thread pools in a broken state
+            context = multiprocessing.get_context("spawn")
+            self._pool = context.Pool(
+                processes=self.workers,
+                initializer=_init_worker,
+                initargs=(threads, {
+                    'device': self.device,
+                    'language': self.language,
+                    'cache_dir': self.cache_dir,
+                    'encoder': self.encoder_name,
+                    'profile': self.profile,
+                    'postprocess': self.postprocess,
+                    'stream': self.stream,
+                    'stream_threshold': self.stream_threshold,
+                    'backend': self.backend_name,
+                    'job_timeout': self.job_timeout,
+                    'voice': self.voice,
+                    # Only the parent process writes the journal
+                    'journal_path': None,
+                })
+            )
+        return self._pool
+    
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
     
     def _validate_audio_duration(self, text: str, max_duration_seconds: int, step_name: str) -> str:
         """
@@ -84,140 +226,159 @@ class UniversalAudioGenerator:
     
     def _clean_text(self, text: str) -> str:
         """Clean text for better TTS output."""
-        # Remove special characters that might cause TTS issues
-        text = re.sub(r'[^\w\s.,!?;:\-()]', '', text)
+        return clean_script(text)
+    
+    def _get_audio_script(self, step: Dict[str, Any]) -> str:
+        """Return the step's audio_script for the current language (AEC-13)."""
+        if self.language != SOURCE_LOCALE:
+            # Fallback to English if the translation is not available
+            return step.get(localized_field('audio_script', self.language)) or step.get('audio_script', '')
+        return step.get('audio_script', '')
+    
+    def _cache_key(self, clean_text: str) -> str:
+        """Cache key for a cleaned script under the current voice and encoder."""
+        settings = self.encoder_settings
+        if self.postprocess:
+            settings = dict(settings, postprocess=POSTPROCESS_SETTINGS)
+        return cache_key(clean_text, self.language, self.backend.name, self.backend.voice, settings)
+    
+    def _restore_from_cache(self, step: Dict[str, Any], output_path: str) -> bool:
+        """Reuse a previously synthesized clip for this exact script, if cached."""
+        audio_script = self._get_audio_script(step)
+        if self.cache is None or not audio_script:
+            return False
+        return self.cache.restore(self._cache_key(self._clean_text(audio_script)), output_path)
+    
+    def _prepare_text(self, step: Dict[str, Any]) -> Optional[str]:
+        """Pick and clean the step's script; None if there is nothing to say."""
+        audio_script = self._get_audio_script(step)
+        if (self.language != SOURCE_LOCALE and audio_script
+                and not step.get(localized_field('audio_script', self.language))):
+            print(f"    ⚠️  No {self.language} audio_script, falling back to English")
+        
+        if not audio_script:
+            print(f"    ❌ No audio_script found in step")
+            return None
+        
+        # Clean text for better TTS output
+        return self._clean_text(audio_script)
+    
+    def _split_sentences(self, clean_text: str) -> List[str]:
+        """Split a cleaned script into sentences for streaming synthesis."""
+        return [s for s in re.split(r'(?<=[.!?])\s+', clean_text) if s.strip()]
+    
+    def _stream_audio(self, clean_text: str, output_path: str, key: Optional[str]) -> bool:
+        """
+        Synthesize a long script one sentence at a time, handing each chunk to the
+        encoder as soon as it exists. Only one sentence's waveform is alive at once.
+        """
+        sentences = self._split_sentences(clean_text)
+        print(f"    Streaming {len(sentences)} sentences to the encoder...")
         
-        # Normalize spacing
-        text = re.sub(r'\s+', ' ', text)
+        sample_rate = self.backend.sample_rate
+        writer = self.encoder.open_stream(sample_rate, output_path)
+        completed = False
+        samples = 0
+        try:
+            for sentence in sentences:
+                wav = self.backend.synthesize(sentence)
+                if self.postprocess:
+                    # Per sentence: the pad left on each side becomes the pause between them
+                    wav = postprocess(wav, sample_rate)
+                samples += len(wav)
+                writer.write(to_pcm16(wav))
+            completed = True
+        finally:
+            success = writer.close() and completed
+            if not completed and os.path.exists(output_path):
+                # Never leave a truncated clip behind
+                os.unlink(output_path)
         
-        # Add natural pauses
-        text = text.replace('.', '. ')
-        text = text.replace(',', ', ')
-        text = text.replace(':', ': ')
-        text = text.replace(';', '; ')
+        self.clip_durations[output_path] = samples / sample_rate
+        return self._finish_output(success, output_path, key)
+    
+    def _write_audio(self, wav: np.ndarray, output_path: str, key: Optional[str]) -> bool:
+        """Post-process and encode a waveform to M4A, verify it and add it to the cache."""
+        if self.postprocess:
+            wav = postprocess(wav, self.backend.sample_rate)
+        self.clip_durations[output_path] = len(wav) / self.backend.sample_rate
+        # Convert to M4A format for iOS compatibility
+        success = self.encoder.encode(to_pcm16(wav), self.backend.sample_rate, output_path)
+        return self._finish_output(success, output_path, key)
+    
+    def _finish_output(self, success: bool, output_path: str, key: Optional[str]) -> bool:
+        """Verify an encoded clip and add it to the cache."""
+        if success and os.path.exists(output_path):
+            print(f"    ✅ Audio file saved as M4A: {os.path.getsize(output_path)} bytes")
         
-        return text.strip()
+        # Verify file was created and has content
+        if success and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            if self.cache is not None:
+                self.cache.store(key, output_path)
+            return True
+        else:
+            print(f"    ❌ Audio file is empty or not created")
+            return False
     
-    def _generate_audio_file(self, step: Dict[str, Any], output_path: str) -> bool:
-        """Generate audio file from step's audio_script using TTS."""
+    def _generate_audio_job(self, job: Dict[str, Any]) -> bool:
+        """Generate the audio file for one job from its step's audio_script."""
+        clean_text = self._prepare_text(job['step'])
+        if clean_text is None:
+            return False
+        
+        output_path = job['output_path']
+        key = self._cache_key(clean_text) if self.cache is not None else None
+        if key and self.cache.restore(key, output_path):
+            print(f"    ♻️  Reused cached audio: {os.path.basename(output_path)}")
+            return True
+        
+        print(f"    Generating audio for: {clean_text[:50]}...")
         try:
-            # AEC-13: Get audio_script based on language setting
-            if self.language == 'es':
-                audio_script = step.get('audio_script_es', '')
-                if not audio_script:
-                    # Fallback to English if Spanish not available
-                    audio_script = step.get('audio_script', '')
-                    print(f"    ⚠️  No Spanish audio_script, falling back to English")
-            else:
-                audio_script = step.get('audio_script', '')
-            
-            if not audio_script:
-                print(f"    ❌ No audio_script found in step")
-                return False
-            
-            # Clean text for better TTS output
-            clean_text = self._clean_text(audio_script)
-            
-            print(f"    Generating audio for: {clean_text[:50]}...")
-            
-            # Generate audio directly from audio_script (no enhancement needed)
-            wav = self.tts.generate(clean_text)
-            
-            # Convert to numpy array if needed
-            if isinstance(wav, torch.Tensor):
-                wav = wav.cpu().numpy()
-            
-            # Ensure it's a 1D array
-            if wav.ndim > 1:
-                wav = wav.flatten()
-            
-            # Convert to M4A format for iOS compatibility
-            import subprocess
-            import tempfile
-            
-            # Create temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_wav:
-                from scipy.io import wavfile
-                wavfile.write(temp_wav.name, 22050, (wav * 32767).astype(np.int16))
-                
-                # Convert WAV to M4A using ffmpeg
-                try:
-                    cmd = [
-                        'ffmpeg',
-                        '-i', temp_wav.name,           # Input WAV file
-                        '-c:a', 'aac',                 # Audio codec: AAC
-                        '-b:a', '128k',                # Audio bitrate: 128kbps
-                        '-ar', '44100',                # Sample rate: 44.1kHz
-                        '-ac', '2',                    # Stereo
-                        '-y',                          # Overwrite output file
-                        output_path
-                    ]
-                    
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-                    
-                    if result.returncode == 0:
-                        print(f"    ✅ Audio file saved as M4A: {os.path.getsize(output_path)} bytes")
-                        success = True
-                    else:
-                        print(f"    ❌ FFmpeg conversion failed: {result.stderr}")
-                        success = False
-                        
-                except FileNotFoundError:
-                    print(f"    ❌ FFmpeg not found. Please install ffmpeg: brew install ffmpeg")
-                    success = False
-                finally:
-                    # Clean up temporary file
-                    try:
-                        os.unlink(temp_wav.name)
-                    except:
-                        pass
-            
-            # Verify file was created and has content
-            if success and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                return True
-            else:
-                print(f"    ❌ Audio file is empty or not created")
-                return False
-                
+            with _job_timeout(self.job_timeout):
+                if self.stream and len(clean_text) >= self.stream_threshold:
+                    return self._stream_audio(clean_text, output_path, key)
+                # Generate audio directly from audio_script (no enhancement needed)
+                start = time.time()
+                wav = self.backend.synthesize(clean_text)
+                print(f"    ⏱️  Synthesized in {time.time() - start:.1f}s")
+            return self._write_audio(wav, output_path, key)
         except Exception as e:
             print(f"    ❌ Error generating audio: {e}")
             return False
     
-    def generate_recipe_audio(self, recipe: Dict[str, Any], output_dir: str, 
-                            include_preparation: bool = True, 
-                            include_brewing: bool = True, 
-                            include_notes: bool = True) -> bool:
+    def _generate_audio_file(self, step: Dict[str, Any], output_path: str) -> bool:
+        """Generate audio file from step's audio_script using TTS."""
+        return self._generate_audio_job({'step': step, 'output_path': output_path})
+    
+    def _collect_recipe_jobs(self, recipe: Dict[str, Any], output_dir: str,
+                             include_preparation: bool = True,
+                             include_brewing: bool = True,
+                             include_notes: bool = True,
+                             recipe_ref: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Generate audio for a specific recipe using ONLY the audio_script field.
+        Build the list of audio jobs (one per step) for a recipe.
         
-        Args:
-            recipe: Recipe dictionary from JSON
-            output_dir: Output directory for audio files
-            include_preparation: Whether to generate preparation step audio
-            include_brewing: Whether to generate brewing step audio
-            include_notes: Whether to generate notes audio
-        
-        Returns:
-            bool: True if successful, False otherwise
+        Each job is a dict with the source 'step' (or what_to_expect) dict, the
+        'output_path' of the M4A file to produce and, when recipe_ref is given,
+        the identity used by the audio build manifest.
         """
         title = recipe.get('title', 'Unknown Recipe')
-        print(f"\n🎵 Generating audio for: {title}")
         
         # Create output directory with recipe name
         recipe_folder = self._convert_title_to_folder_name(title)
         recipe_output_dir = os.path.join(output_dir, recipe_folder)
         os.makedirs(recipe_output_dir, exist_ok=True)
         
-        success = True
+        jobs = []
         
-        # Generate preparation step audio
+        # Preparation steps have no audio
         if include_preparation and 'preparation_steps' in recipe:
             preparation_steps = recipe['preparation_steps']
             for i, step in enumerate(preparation_steps, 1):
                 # Skip preparation steps - they don't have audio_script
                 print(f"    ⚠️  Skipping preparation step {i}: preparation steps don't have audio_script")
         
-        # Generate brewing step audio
+        # Brewing step audio
         if include_brewing and 'brewing_steps' in recipe:
             brewing_steps = recipe['brewing_steps']
             for i, step in enumerate(brewing_steps, 1):
@@ -229,64 +390,230 @@ class UniversalAudioGenerator:
                 
                 print(f"    Using audio_script for step {i} ({len(audio_script)} chars)")
                 
-                # AEC-13: Use language-specific audio_file_name
-                if self.language == 'es':
-                    audio_file_name = step.get('audio_file_name_es') or step.get('audio_file_name', f"step_{i:02d}_es.m4a")
-                    # Ensure _es suffix if using fallback
-                    if not step.get('audio_file_name_es') and '_es' not in audio_file_name:
-                        base_name = audio_file_name.rsplit('.', 1)[0] if '.' in audio_file_name else audio_file_name
-                        audio_file_name = f"{base_name}_es.m4a"
-                else:
-                    audio_file_name = step.get('audio_file_name', f"step_{i:02d}.m4a")
-                
-                # Convert any existing extension to .m4a
-                if '.' in audio_file_name:
-                    audio_file_name = audio_file_name.rsplit('.', 1)[0] + '.m4a'
-                else:
-                    audio_file_name = audio_file_name + '.m4a'
+                # AEC-13: Use language-specific audio_file_name (always written as .m4a)
+                audio_file_name = clip_file_name(step, self.language, f"step_{i:02d}")
                 output_path = os.path.join(recipe_output_dir, audio_file_name)
-                if not self._generate_audio_file(step, output_path):
-                    success = False
+                jobs.append({'title': title, 'step': step, 'output_path': output_path,
+                             'recipe_ref': recipe_ref, 'step_index': i})
         
-        # Generate notes/what_to_expect audio
+        # Notes/what_to_expect audio
         if include_notes and 'what_to_expect' in recipe:
             what_to_expect = recipe['what_to_expect']
             if isinstance(what_to_expect, dict):
                 # AEC-13: Use language-specific audio_script
-                if self.language == 'es':
-                    audio_script = what_to_expect.get('audio_script_es') or what_to_expect.get('audio_script')
-                    if what_to_expect.get('audio_script_es'):
-                        print(f"    Using Spanish audio_script for what_to_expect ({len(audio_script)} chars)")
+                if self.language != SOURCE_LOCALE:
+                    translated = what_to_expect.get(localized_field('audio_script', self.language))
+                    audio_script = translated or what_to_expect.get('audio_script')
+                    if translated:
+                        print(f"    Using {self.language} audio_script for what_to_expect ({len(audio_script)} chars)")
                     else:
-                        print(f"    ⚠️  No Spanish audio_script for what_to_expect, using English")
+                        print(f"    ⚠️  No {self.language} audio_script for what_to_expect, using English")
                 else:
                     audio_script = what_to_expect.get('audio_script')
                 
                 if audio_script:
                     print(f"    Using audio_script for what_to_expect ({len(audio_script)} chars)")
                     
-                    # AEC-13: Use language-specific audio_file_name
-                    if self.language == 'es':
-                        audio_file_name = what_to_expect.get('audio_file_name_es') or what_to_expect.get('audio_file_name', "intro_es.m4a")
-                        # Ensure _es suffix if using fallback
-                        if not what_to_expect.get('audio_file_name_es') and '_es' not in audio_file_name:
-                            base_name = audio_file_name.rsplit('.', 1)[0] if '.' in audio_file_name else audio_file_name
-                            audio_file_name = f"{base_name}_es.m4a"
-                    else:
-                        audio_file_name = what_to_expect.get('audio_file_name', "intro.m4a")
-                    
-                    # Convert any existing extension to .m4a
-                    if '.' in audio_file_name:
-                        audio_file_name = audio_file_name.rsplit('.', 1)[0] + '.m4a'
-                    else:
-                        audio_file_name = audio_file_name + '.m4a'
-                        
+                    # AEC-13: Use language-specific audio_file_name (always written as .m4a)
+                    audio_file_name = clip_file_name(what_to_expect, self.language, "intro")
                     output_path = os.path.join(recipe_output_dir, audio_file_name)
-                    if not self._generate_audio_file(what_to_expect, output_path):
-                        success = False
+                    jobs.append({'title': title, 'step': what_to_expect, 'output_path': output_path,
+                                 'recipe_ref': recipe_ref, 'step_index': 'what_to_expect'})
                 else:
                     print(f"    ⚠️  Skipping what_to_expect: no audio_script")
         
+        return jobs
+    
+    def _job_key(self, job: Dict[str, Any]) -> Optional[str]:
+        """Cache key of a job's cleaned script (None if it has no script)."""
+        audio_script = self._get_audio_script(job['step'])
+        return self._cache_key(self._clean_text(audio_script)) if audio_script else None
+    
+    def _journal_result(self, job: Dict[str, Any], final: bool) -> None:
+        """Journal a finished job; failures are only journaled once retries are exhausted."""
+        if self.journal is None:
+            return
+        if job['ok']:
+            self.journal.record_success(job['output_path'], self._job_key(job), job['attempts'])
+        elif final:
+            self.journal.record_failure(job['output_path'], self._job_key(job), job['attempts'])
+    
+    def _run_jobs(self, jobs: List[Dict[str, Any]]) -> bool:
+        """
+        Synthesize a list of jobs, skipping journaled ones with --resume and
+        retrying failures with exponential backoff.
+        
+        Returns:
+            bool: True if every job produced a valid audio file
+        """
+        pending = []
+        for job in jobs:
+            job['attempts'] = 0
+            if self.resume and self.journal and self.journal.is_complete(job['output_path'], self._job_key(job)):
+                print(f"    ⏭️  Already done: {os.path.basename(job['output_path'])}")
+                job['ok'] = True
+            else:
+                pending.append(job)
+        
+        for attempt in range(self.retries + 1):
+            if not pending:
+                break
+            if attempt:
+                delay = 2 ** attempt
+                print(f"    🔁 Retrying {len(pending)} failed jobs in {delay}s "
+                      f"(attempt {attempt + 1}/{self.retries + 1})...")
+                time.sleep(delay)
+            final = attempt == self.retries
+            self._run_attempt(pending, final)
+            pending = [job for job in pending if not job['ok']]
+        
+        return all(job['ok'] for job in jobs)
+    
+    def _run_attempt(self, jobs: List[Dict[str, Any]], final: bool) -> None:
+        """Synthesize a list of jobs once, in this process or on the worker pool."""
+        for job in jobs:
+            job['attempts'] += 1
+        
+        if self.workers == 1:
+            for job in jobs:
+                job['ok'] = self._generate_audio_job(job)
+                job['duration'] = self.clip_durations.get(job['output_path'])
+                self._journal_result(job, final)
+            return
+        
+        # Resolve cache hits here so workers only receive real synthesis work
+        pending = []
+        for job in jobs:
+            if self._restore_from_cache(job['step'], job['output_path']):
+                print(f"    ♻️  Reused cached audio: {os.path.basename(job['output_path'])}")
+                job['ok'] = True
+                self._journal_result(job, final)
+            else:
+                pending.append(job)
+        if not pending:
+            return
+        
+        by_path = {job['output_path']: job for job in pending}
+        done = 0
+        for output_path, ok, duration in self._get_pool().imap_unordered(_run_worker_job, pending):
+            done += 1
+            status = "✅" if ok else "❌"
+            print(f"    {status} [{done}/{len(pending)}] {os.path.basename(output_path)}")
+            by_path[output_path]['ok'] = ok
+            by_path[output_path]['duration'] = duration
+            # Journal as results arrive so a crash loses at most the jobs in flight
+            self._journal_result(by_path[output_path], final)
+    
+    def _get_manifest(self) -> AudioManifest:
+        """Load the audio build manifest on first use."""
+        if self._manifest is None:
+            self._manifest = AudioManifest(self.manifest_path)
+        return self._manifest
+    
+    def _manifest_entry(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """What the manifest records for a job's output."""
+        clean_text = self._clean_text(self._get_audio_script(job['step']))
+        return {
+            'key': self._cache_key(clean_text),
+            'script_hash': script_hash(clean_text),
+            'output_path': relative_path(job['output_path']),
+            # Lets speech_rate.py fit rates per backend
+            'backend': self.backend.name,
+        }
+    
+    def _plan_changed_jobs(self, jobs: List[Dict[str, Any]], scopes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Diff jobs against the manifest, apply renames and deletions, and return
+        only the jobs whose audio must be synthesized again.
+        """
+        manifest = self._get_manifest()
+        tracked = [job for job in jobs if job.get('recipe_ref')]
+        current = {}
+        for job in tracked:
+            key = entry_key(job['recipe_ref'], job['step_index'], self.language)
+            current[key] = self._manifest_entry(job)
+            job['manifest_key'] = key
+        
+        plan = manifest.plan(current, scopes)
+        
+        for key, old_path, new_path in plan['rename']:
+            os.makedirs((ROOT / new_path).parent, exist_ok=True)
+            os.replace(ROOT / old_path, ROOT / new_path)
+            if 'duration' in manifest.entries[key]:
+                current[key]['duration'] = manifest.entries[key]['duration']
+            manifest.record(key, current[key])
+            print(f"    🔀 Renamed: {old_path} → {new_path}")
+        
+        for key, old_path in plan['delete']:
+            if old_path and os.path.exists(ROOT / old_path):
+                os.unlink(ROOT / old_path)
+                print(f"    🗑️  Deleted: {old_path}")
+            manifest.remove(key)
+        
+        manifest.save()
+        
+        regenerate = set(plan['regenerate'])
+        print(f"    📋 Changed-only: {len(regenerate)} to generate, {len(plan['rename'])} renamed, "
+              f"{len(plan['delete'])} deleted, {len(plan['unchanged'])} unchanged")
+        # Jobs without a recipe_ref cannot be tracked, so they always run
+        return [job for job in jobs if not job.get('recipe_ref') or job['manifest_key'] in regenerate]
+    
+    def _record_manifest(self, jobs: List[Dict[str, Any]]) -> None:
+        """Remember what each successful job produced for the next --changed-only run."""
+        tracked = [job for job in jobs if job.get('recipe_ref') and job.get('ok')]
+        if not tracked or not self.manifest_path:
+            return
+        manifest = self._get_manifest()
+        for job in tracked:
+            key = entry_key(job['recipe_ref'], job['step_index'], self.language)
+            entry = self._manifest_entry(job)
+            previous = manifest.entries.get(key, {})
+            duration = job.get('duration')
+            if duration is None and previous.get('key') == entry['key']:
+                # Restored from the cache: same audio as last time
+                duration = previous.get('duration')
+            if duration is not None:
+                # Trimmed length, for validators that would otherwise estimate from word count
+                entry['duration'] = round(duration, 3)
+            manifest.record(key, entry)
+        manifest.save()
+    
+    def _process_jobs(self, jobs: List[Dict[str, Any]], scopes: List[str]) -> bool:
+        """Run jobs (only the changed ones with --changed-only) and update the manifest."""
+        if self.changed_only:
+            jobs = self._plan_changed_jobs(jobs, scopes)
+        success = self._run_jobs(jobs)
+        self._record_manifest(jobs)
+        return success
+    
+    def generate_recipe_audio(self, recipe: Dict[str, Any], output_dir: str, 
+                            include_preparation: bool = True, 
+                            include_brewing: bool = True, 
+                            include_notes: bool = True,
+                            recipe_ref: Optional[str] = None) -> bool:
+        """
+        Generate audio for a specific recipe using ONLY the audio_script field.
+        
+        Args:
+            recipe: Recipe dictionary from JSON
+            output_dir: Output directory for audio files
+            include_preparation: Whether to generate preparation step audio
+            include_brewing: Whether to generate brewing step audio
+            include_notes: Whether to generate notes audio
+            recipe_ref: Recipe file and index (e.g. "path/x.json[0]") used to track
+                the recipe's clips in the audio build manifest
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        title = recipe.get('title', 'Unknown Recipe')
+        print(f"\n🎵 Generating audio for: {title}")
+        
+        jobs = self._collect_recipe_jobs(recipe, output_dir, include_preparation,
+                                         include_brewing, include_notes, recipe_ref)
+        scopes = [f"{recipe_ref}::{self.language}"] if recipe_ref else []
+        success = self._process_jobs(jobs, scopes)
+        
         if success:
             print(f"🎉 Audio generation complete for: {title}")
         else:
@@ -313,17 +640,37 @@ class UniversalAudioGenerator:
         with open(recipes_file, 'r') as f:
             recipes = json.load(f)
         
+        # Manifest identity: recipe file plus the recipe's index within it
+        recipes_path = relative_path(recipes_file)
+        recipes = [(f"{recipes_path}[{i}]", r) for i, r in enumerate(recipes)]
+        
         # Filter recipes if needed
         if brewing_method:
-            recipes = [r for r in recipes if r.get('brewing_method') == brewing_method]
+            recipes = [(ref, r) for ref, r in recipes if r.get('brewing_method') == brewing_method]
         
         if recipe_title:
-            recipes = [r for r in recipes if recipe_title.lower() in r.get('title', '').lower()]
+            recipes = [(ref, r) for ref, r in recipes if recipe_title.lower() in r.get('title', '').lower()]
         
         print(f"Found {len(recipes)} recipes to process")
         
+        if self.workers > 1:
+            # Queue every step of every recipe so no worker idles between recipes
+            jobs = []
+            for recipe_ref, recipe in recipes:
+                jobs.extend(self._collect_recipe_jobs(recipe, base_output_dir, recipe_ref=recipe_ref))
+            scopes = [f"{recipe_ref}::{self.language}" for recipe_ref, _ in recipes]
+            print(f"Queued {len(jobs)} audio jobs on {self.workers} workers")
+            try:
+                if self._process_jobs(jobs, scopes):
+                    print("🎉 Audio generation complete for all recipes")
+                else:
+                    print("⚠️  Audio generation completed with some errors")
+            finally:
+                self.close()
+            return
+        
         # Process each recipe
-        for recipe in recipes:
+        for recipe_ref, recipe in recipes:
             title = recipe.get('title', 'Unknown')
             brewing_method = recipe.get('brewing_method', 'Unknown')
             
@@ -332,7 +679,7 @@ class UniversalAudioGenerator:
             recipe_output_dir = base_output_dir
             
             # Generate audio
-            self.generate_recipe_audio(recipe, recipe_output_dir)
+            self.generate_recipe_audio(recipe, recipe_output_dir, recipe_ref=recipe_ref)
 
 def main():
     """Main function with command line interface."""
@@ -342,15 +689,59 @@ def main():
     parser.add_argument('--method', help='Filter by brewing method (AeroPress, V60, FrenchPress)')
     parser.add_argument('--recipe', help='Filter by specific recipe title')
     parser.add_argument('--device', default='cpu', help='Device to use (cpu or cuda)')
-    parser.add_argument('--language', '-l', default='en', choices=['en', 'es'],
-                        help='Language for audio generation (en=English, es=Spanish)')
+    parser.add_argument('--language', '-l', default=SOURCE_LOCALE, choices=all_locales(),
+                        help='Language for audio generation (en=English, es=Spanish, ...)')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='Number of TTS worker processes, each with its own model (default: 1)')
+    parser.add_argument('--cache-dir', default=str(CACHE_DIR),
+                        help='TTS output cache directory (default: .audio_cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-synthesize, ignoring the output cache')
+    parser.add_argument('--changed-only', action='store_true',
+                        help='Only regenerate, rename or delete clips whose step changed since the last run')
+    parser.add_argument('--stream', action='store_true',
+                        help='Synthesize long scripts sentence by sentence straight into the encoder (flat memory)')
+    parser.add_argument('--stream-threshold', type=int, default=400,
+                        help='Minimum script length in characters to stream (default: 400)')
+    parser.add_argument('--backend', default='chatterbox', choices=BACKEND_CHOICES,
+                        help='TTS backend: chatterbox for final renders, pyttsx3/say/silent/tone for fast drafts '
+                             '(see python3 tts_backends.py for cost profiles)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip jobs the journal shows as finished; re-run failed and missing ones')
+    parser.add_argument('--retries', type=int, default=2,
+                        help='Extra attempts for failed jobs, with exponential backoff (default: 2)')
+    parser.add_argument('--job-timeout', type=int, default=None,
+                        help='Seconds one script may take to synthesize before it is retried')
+    parser.add_argument('--voice', default=None,
+                        help='Reference clip to clone, e.g. reference_spanish_best.wav (chatterbox only)')
+    parser.add_argument('--profile', default='standard', choices=PROFILE_CHOICES,
+                        help='AAC profile: standard (128k stereo), speech (48k mono 22.05 kHz) '
+                             'or speech-he (32k HE-AAC, needs libfdk_aac)')
+    parser.add_argument('--no-postprocess', action='store_true',
+                        help='Skip silence trimming and loudness normalization before encoding')
+    parser.add_argument('--encoder', default='auto', choices=ENCODER_CHOICES,
+                        help='M4A encoder: in-process PyAV, ffmpeg over a pipe, or temp WAV + ffmpeg (default: auto)')
     
     args = parser.parse_args()
     
     print(f"🌐 Language: {args.language.upper()}")
+    print(f"🎙️  Backend: {args.backend}")
     
     # Initialize generator with language setting
-    generator = UniversalAudioGenerator(device=args.device, language=args.language)
+    generator = UniversalAudioGenerator(device=args.device, language=args.language,
+                                        workers=args.workers,
+                                        cache_dir=None if args.no_cache else args.cache_dir,
+                                        changed_only=args.changed_only,
+                                        encoder=args.encoder,
+                                        stream=args.stream,
+                                        stream_threshold=args.stream_threshold,
+                                        backend=args.backend,
+                                        resume=args.resume,
+                                        retries=args.retries,
+                                        job_timeout=args.job_timeout,
+                                        voice=args.voice,
+                                        profile=args.profile,
+                                        postprocess=not args.no_postprocess)
     
     # Generate audio
     generator.generate_all_recipes_audio(
@@ -2,7 +2,10 @@
 """
 Comprehensive validation for AeroPress recipe timers and audio scripts.
 Validates:
-1. Audio script length matches time_seconds (2.5 words/second rule)
+1. Audio length fits time_seconds: the clip's measured duration (from
+   audio_durations.py) when it exists, else an estimate from the speaking
+   rate speech_rate.py calibrated for the script's language (English and
+   audio_script_es)
 2. Audio scripts start with proper timing phrases
 3. No "Start your timer" or "At <timestamp>" phrases
 4. Total brew time consistency
@@ -12,7 +15,11 @@ Validates:
 import json
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from audio_durations import refresh_durations
+from audio_paths import bundle_root_index, clip_file_name, resolve_audio_file
+from speech_rate import SpeechRates
 
 ROOT = Path(__file__).resolve().parent
 RECIPES_DIR = ROOT / "PerfectBrew" / "Resources" / "Recipes" / "AeroPress"
@@ -30,7 +37,7 @@ ALLOWED_STARTERS = (
 START_TIMER_RE = re.compile(r"\bStart (your )?timer\b", re.IGNORECASE)
 AT_TIMESTAMP_RE = re.compile(r"\bAt\s+\d(?::\d{2})?", re.IGNORECASE)  # At 1:20 / At 90
 
-# Words per second for TTS (conservative estimate)
+# Words per second for TTS when speech_rates.json has no calibration (conservative estimate)
 WORDS_PER_SECOND = 2.5
 
 # UX-focused thresholds for audio script length
@@ -52,51 +59,65 @@ def count_words(text: str) -> int:
     return len(text.split())
 
 
-def validate_audio_timing(script: str, time_seconds: int) -> Tuple[bool, str, str]:
+def validate_audio_timing(script: str, time_seconds: int,
+                          measured_seconds: Optional[float] = None,
+                          language: str = "en",
+                          rates: Optional[SpeechRates] = None) -> Tuple[bool, str, str]:
     """
     Validate audio script fits within time constraint with UX-focused thresholds.
+    Uses the clip's measured duration when given, else the calibrated speaking
+    rate for language (WORDS_PER_SECOND without rates).
     Returns: (is_valid, severity, message)
     """
     word_count = count_words(script)
-    estimated_seconds = word_count / WORDS_PER_SECOND
+    words_per_second = rates.words_per_second(language) if rates else WORDS_PER_SECOND
+    if measured_seconds is not None:
+        estimated_seconds = measured_seconds
+        length = f"{word_count} words = {estimated_seconds:.1f}s measured"
+    else:
+        if rates:
+            estimated_seconds = rates.estimate_seconds(script, language)
+        else:
+            estimated_seconds = word_count / words_per_second
+        length = f"{word_count} words ≈ {estimated_seconds:.1f}s"
     percent_used = estimated_seconds / time_seconds if time_seconds > 0 else 0
     
     # Calculate target word ranges
-    min_words = int(time_seconds * MIN_PERCENT * WORDS_PER_SECOND)
-    optimal_min_words = int(time_seconds * OPTIMAL_MIN * WORDS_PER_SECOND)
-    optimal_max_words = int(time_seconds * OPTIMAL_MAX * WORDS_PER_SECOND)
-    max_words = int(time_seconds * WARNING_MAX * WORDS_PER_SECOND)
+    min_words = int(time_seconds * MIN_PERCENT * words_per_second)
+    optimal_min_words = int(time_seconds * OPTIMAL_MIN * words_per_second)
+    optimal_max_words = int(time_seconds * OPTIMAL_MAX * words_per_second)
+    max_words = int(time_seconds * WARNING_MAX * words_per_second)
     
     if estimated_seconds > time_seconds:
         return False, "error", (
-            f"Script too long: {word_count} words ≈ {estimated_seconds:.1f}s "
+            f"Script too long: {length} "
             f"({percent_used:.0%} of {time_seconds}s) - WILL CUT OFF"
         )
     elif percent_used < MIN_PERCENT:
         return False, "error", (
-            f"Script too short: {word_count} words ≈ {estimated_seconds:.1f}s "
+            f"Script too short: {length} "
             f"({percent_used:.0%} of {time_seconds}s) - Insufficient guidance. "
             f"Target: {min_words}-{optimal_max_words} words"
         )
     elif percent_used < OPTIMAL_MIN:
         return True, "warning", (
-            f"Script could be longer: {word_count} words ≈ {estimated_seconds:.1f}s "
+            f"Script could be longer: {length} "
             f"({percent_used:.0%} of {time_seconds}s). "
             f"Optimal: {optimal_min_words}-{optimal_max_words} words for better UX"
         )
     elif percent_used <= OPTIMAL_MAX:
         return True, "ok", (
-            f"Optimal length: {word_count} words ≈ {estimated_seconds:.1f}s "
+            f"Optimal length: {length} "
             f"({percent_used:.0%} of {time_seconds}s) - Good balance"
         )
     elif percent_used <= WARNING_MAX:
         return True, "warning", (
-            f"Script getting tight: {word_count} words ≈ {estimated_seconds:.1f}s "
+            f"Script getting tight: {length} "
             f"({percent_used:.0%} of {time_seconds}s) - Consider trimming slightly"
         )
     else:
         return False, "error", (
-            f"Script too long: {word_count} words ≈ {estimated_seconds:.1f}s "
+            f"Script too long: {length} "
             f"({percent_used:.0%} of {time_seconds}s) - Risk of cutoff"
         )
 
@@ -116,8 +137,21 @@ def validate_timing_phrase(script: str) -> Tuple[bool, str]:
         return False, "Missing timing phrase (e.g., 'You have X seconds ...' / 'In X seconds ...')"
 
 
-def validate_recipe(path: Path, recipe: Dict) -> List[Dict]:
-    """Validate a single recipe."""
+def measured_duration(file_name: Optional[str], title: str, durations: Dict[str, Dict[str, Any]],
+                      root_index: Dict[str, List[Path]]) -> Optional[float]:
+    """Measured duration of the clip the app plays for file_name, if known."""
+    if not file_name:
+        return None
+    clip = resolve_audio_file(file_name, title, root_index=root_index)
+    if clip is None:
+        return None
+    return durations.get(str(clip.relative_to(ROOT)), {}).get("duration")
+
+
+def validate_recipe(path: Path, recipe: Dict, durations: Optional[Dict[str, Dict[str, Any]]] = None,
+                    root_index: Optional[Dict[str, List[Path]]] = None,
+                    rates: Optional[SpeechRates] = None) -> List[Dict]:
+    """Validate a single recipe (against measured clip durations and calibrated rates when given)."""
     issues: List[Dict] = []
     recipe_name = recipe.get("title", "Unknown")
     
@@ -201,7 +235,10 @@ def validate_recipe(path: Path, recipe: Dict) -> List[Dict]:
             })
         
         # Check audio timing
-        timing_fit, timing_severity, timing_info = validate_audio_timing(script, step_time)
+        measured = None
+        if durations is not None:
+            measured = measured_duration(step.get("audio_file_name"), recipe_name, durations, root_index or {})
+        timing_fit, timing_severity, timing_info = validate_audio_timing(script, step_time, measured, "en", rates)
         if not timing_fit or timing_severity in ("error", "warning"):
             issues.append({
                 "file": str(path),
@@ -212,6 +249,27 @@ def validate_recipe(path: Path, recipe: Dict) -> List[Dict]:
                 "time_seconds": step_time,
                 "script": script[:100] + "..." if len(script) > 100 else script
             })
+        
+        # Spanish narration runs slower, so it gets its own cut-off check
+        script_es = step.get("audio_script_es")
+        if script_es:
+            measured_es = None
+            if durations is not None:
+                # The generator writes <name>_es.m4a when the step has no audio_file_name_es
+                measured_es = measured_duration(clip_file_name(step, "es", f"step_{idx:02d}"), recipe_name,
+                                                durations, root_index or {})
+            timing_fit, timing_severity, timing_info = validate_audio_timing(script_es, step_time, measured_es, "es", rates)
+            # Length guidance is the English script's job; only flag cut-offs here
+            if not timing_fit and timing_info.startswith("Script too long"):
+                issues.append({
+                    "file": str(path),
+                    "recipe": recipe_name,
+                    "location": f"brewing_steps[{idx}].audio_script_es",
+                    "severity": timing_severity,
+                    "issue": timing_info,
+                    "time_seconds": step_time,
+                    "script": script_es[:100] + "..." if len(script_es) > 100 else script_es
+                })
     
     # Validate total brew time
     expected_total = recipe.get("parameters", {}).get("total_brew_time_seconds", 0)
@@ -238,6 +296,11 @@ def main():
     all_issues: List[Dict] = []
     recipe_count = 0
     
+    # Real clip lengths (header probe, cached by mtime/size) instead of word-count estimates
+    durations = refresh_durations()
+    root_index = bundle_root_index()
+    rates = SpeechRates()
+    
     for path in sorted(RECIPES_DIR.rglob("*.json")):
         try:
             with path.open("r", encoding="utf-8") as f:
@@ -251,7 +314,7 @@ def main():
                 continue
             
             recipe_count += 1
-            issues = validate_recipe(path, recipe)
+            issues = validate_recipe(path, recipe, durations, root_index, rates)
             all_issues.extend(issues)
             
         except Exception as e: